@@ -0,0 +1,79 @@
+"""Benchmark of the conversion of string representations.
+
+Usage: PYTHONPATH=. python benchmarks/convert.py
+
+:meth:`FlatRule._check_value` is compared to the former conversion based on
+:func:`eval`, which is reproduced here, for each supported type.
+"""
+
+import timeit
+
+from configcontextualchecker.flat_rule import FlatRule
+
+
+def eval_type_string(string):
+    """Former :meth:`FlatRule._type_string`."""
+    try:
+        if eval(string) in (int, float, str):
+            return type
+    except (ValueError, NameError):
+        pass
+
+    if string in ('True', 'False'):
+        return bool
+
+    try:
+        int(string)
+        return int
+    except ValueError:
+        pass
+
+    try:
+        float(string)
+        return float
+    except ValueError:
+        pass
+
+    return str
+
+
+def eval_check_value(value, type_):
+    """Former type checking and conversion of :meth:`FlatRule._check_value`.
+    """
+    if type(value) is not type_ and eval_type_string(value) != type_:
+        msg = 'bad item type: expected {0}, found {1}'.format(
+            type_, eval_type_string(value))
+        raise TypeError(msg)
+
+    if isinstance(value, str):
+        if type_ in (type, bool):
+            value = eval(value)
+        else:
+            value = type_(value)
+    return value
+
+
+def main():
+    number = 100000
+    data = (
+        (int, '12345'),
+        (float, '1.5e3'),
+        (str, 'abc'),
+        (bool, 'True'),
+        (type, 'float'),
+    )
+    for type_, string in data:
+        timings = (
+            ('eval', lambda: eval_check_value(string, type_)),
+            ('_check_value',
+             lambda: FlatRule._check_value(string, True, type_)),
+        )
+        print('{0}:'.format(type_.__name__))
+        for name, function in timings:
+            duration = timeit.timeit(function, number=number)
+            print('  {0:<13} {1:.3f} us'.format(name,
+                                                1e6 * duration / number))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Benchmark of the dictionary paths accessors.
+
+Usage: PYTHONPATH=. python benchmarks/dict_path.py
+
+The :class:`Path` accessors are compared to the :func:`get_from_path` and
+:func:`set_from_path` functions for paths of increasing depths.
+"""
+
+import timeit
+
+from configcontextualchecker.dict_path import (get_from_path, set_from_path,
+                                               Path)
+
+
+def main():
+    number = 200000
+    for depth in (1, 4, 8, 16):
+        string = ''.join('/key_{0}'.format(i) for i in range(depth))
+        path = Path(string)
+        dict_ = dict()
+        path.set(dict_, 0)
+
+        timings = (
+            ('get_from_path', lambda: get_from_path(dict_, string)),
+            ('Path.get', lambda: path.get(dict_)),
+            ('set_from_path', lambda: set_from_path(dict_, string, 0)),
+            ('Path.set', lambda: path.set(dict_, 0)),
+        )
+        print('depth {0}:'.format(depth))
+        for name, function in timings:
+            duration = timeit.timeit(function, number=number)
+            print('  {0:<14} {1:.3f} us'.format(name,
+                                                1e6 * duration / number))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark of the import time of the package.
+
+Usage: python benchmarks/import_time.py [repeat]
+
+The package is imported in new processes with ``python -X importtime``, the
+median cumulative times of the package and of its slowest imports are
+reported, as well as the time to create a first checker, which creates the
+parsers.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_CHECKER = '''
+import time
+start = time.perf_counter()
+from configcontextualchecker import ConfigContextualChecker
+imported = time.perf_counter()
+ConfigContextualChecker({
+    'key': {
+        'type': int,
+        'exists': True,
+        'allowed': '[0, 10]',
+        'default': 0,
+        '{/a/b} == 1': {'exists': False},
+    },
+    '/a/b': {'type': int, 'exists': False},
+})
+print(imported - start, time.perf_counter() - imported)
+'''
+
+
+def run(arguments):
+    """Run python in a new process from the repository root."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable] + arguments, cwd=ROOT, env=env,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+
+
+def import_times():
+    """Get the cumulative import times in us bound to the modules names."""
+    stderr = run(['-X', 'importtime', '-c',
+                  'import configcontextualchecker']).stderr
+    times = dict()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 11
+
+    # the first run compiles the bytecode
+    import_times()
+    runs = [import_times() for _ in range(repeat)]
+    times = dict((name, median([times.get(name, 0) for times in runs]))
+                 for name in runs[0])
+
+    print('import configcontextualchecker: {0:.1f} ms'.format(
+        times['configcontextualchecker'] / 1e3))
+    print('slowest top level imports:')
+    top_level = sorted((time, name) for name, time in times.items()
+                       if '.' not in name and
+                       name != 'configcontextualchecker')
+    for time, name in reversed(top_level[-5:]):
+        print('  {0:<20} {1:.1f} ms'.format(name, time / 1e3))
+
+    timings = [run(['-c', FIRST_CHECKER]).stdout.split()
+               for _ in range(repeat)]
+    print('import then first checker: {0:.1f} ms + {1:.1f} ms'.format(
+        1e3 * median([float(t[0]) for t in timings]),
+        1e3 * median([float(t[1]) for t in timings])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark of the parallel checking of configs.
+
+Usage: PYTHONPATH=. python benchmarks/parallel.py [number of configs]
+
+The throughput of :meth:`ConfigContextualChecker.check_parallel` is measured
+for an increasing number of processes, the speedup is relative to one
+process. The throughput of the serial
+:meth:`ConfigContextualChecker.check_many` is given for reference.
+"""
+
+import multiprocessing
+import sys
+import time
+
+from configcontextualchecker import ConfigContextualChecker
+
+
+def make_rules(count):
+    """Make rules with contextual sections depending on a mode and level."""
+    rules = {
+        'mode': {
+            'type': str,
+            'exists': True,
+            'allowed': ['a', 'b', 'c'],
+        },
+        'level': {
+            'type': int,
+            'exists': True,
+            'default': 0,
+        },
+    }
+    for i in range(count):
+        rules['/section_{0}/key_{1}'.format(i % 10, i)] = {
+            'type': int,
+            'exists': True,
+            'allowed': '[0,+inf]',
+            'default': i,
+            '{mode} == "a"': {
+                'allowed': '[0,100]',
+                'default': 0,
+            },
+            '{mode} in ("b", "c") and {level} > 1': {
+                'default': 1,
+            },
+        }
+    return rules
+
+
+def make_configs(count, rules_count):
+    for i in range(count):
+        config = {'mode': 'abc'[i % 3], 'level': i % 3}
+        for j in range(0, rules_count, 2):
+            section = config.setdefault('section_{0}'.format(j % 10), {})
+            section['key_{0}'.format(j)] = str(j % 50)
+        yield config
+
+
+def throughput(check, count, rules_count):
+    start = time.time()
+    for _ in check(make_configs(count, rules_count)):
+        pass
+    return count / (time.time() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rules_count = 200
+    checker = ConfigContextualChecker(make_rules(rules_count))
+
+    serial = throughput(checker.check_many, count, rules_count)
+    print('serial: {0:.0f} configs/s'.format(serial))
+
+    processes = 1
+    reference = None
+    while processes <= multiprocessing.cpu_count():
+        def check(configs):
+            return checker.check_parallel(configs, processes=processes)
+        rate = throughput(check, count, rules_count)
+        reference = reference or rate
+        print('{0} processes: {1:.0f} configs/s, speedup {2:.2f}'.format(
+            processes, rate, rate / reference))
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark of the hand-written parsers against the PLY parsers.
+
+Usage: PYTHONPATH=. python benchmarks/parsers.py
+
+The creation of the parsers, from their precomputed tables for the PLY ones,
+and the parsing of conditional and range expressions are timed, as well as
+the creation of a :class:`CondExp` which compiles its expression.
+"""
+
+import timeit
+
+from configcontextualchecker import condexp
+from configcontextualchecker.condexp import Compiler, PlyCompiler
+from configcontextualchecker.condexp_parser import Parser, PlyParser
+from configcontextualchecker.range.range_parser import (PlyRangeParser,
+                                                        RangeParser)
+
+CONFIG = {'a': 0, 'b': 1, 'c': 2, 'd': 'e', 't': True}
+
+CONDITION = '({a} in (0, 1) or {b} > 1) and {d} != "x" and not {t}'
+
+RANGE = ']-inf, 2.5e3]'
+
+
+def timings(parser, ply_parser, string, number):
+    """Time the creation of the parsers and the parsing of a string."""
+    for name, cls in (('hand-written', parser), ('PLY', ply_parser)):
+        instance = cls()
+        instance.config = CONFIG
+        create = timeit.timeit(cls, number=number // 10)
+        parse = timeit.timeit(lambda: instance.parse(string), number=number)
+        print('  {0:<13} create {1:8.1f} us  parse {2:6.1f} us'.format(
+            name, 1e6 * create / (number // 10), 1e6 * parse / number))
+
+
+def main():
+    number = 10000
+    print('condition {0!r}'.format(CONDITION))
+    print(' evaluation:')
+    timings(Parser, PlyParser, CONDITION, number)
+    print(' compilation:')
+    timings(Compiler, PlyCompiler, CONDITION, number)
+    print('range {0!r}'.format(RANGE))
+    timings(RangeParser, PlyRangeParser, RANGE, number)
+
+    print('CondExp creation:')
+    for name, cls in (('hand-written', Compiler), ('PLY', PlyCompiler)):
+        condexp.Compiler = cls
+        duration = timeit.timeit(lambda: condexp.CondExp(CONDITION),
+                                 number=number)
+        print('  {0:<13} {1:.1f} us'.format(name, 1e6 * duration / number))
+    condexp.Compiler = Compiler
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark of the on-disk store of the checkers.
+
+Usage: PYTHONPATH=. python benchmarks/store.py [number of rules]
+
+The creation of a checker of many rules with contextual rules is compared to
+its loading from the store.
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+
+from configcontextualchecker.checker import ConfigContextualChecker
+from configcontextualchecker.store import load_checker
+
+
+def rules_def(size):
+    """Create rule definitions, each rule depends on the previous one."""
+    rules = dict()
+    for i in range(size):
+        rules['/section{0}/key'.format(i)] = {
+            'type': int,
+            'exists': True,
+            'allowed': '[0, {0}]'.format(size),
+            'default': i,
+        }
+        rules['/section{0}/mode'.format(i)] = {
+            'type': str,
+            'exists': True,
+            'allowed': ['fast', 'safe', 'off'],
+            'default': 'safe',
+            '{{/section{0}/key}} > 10 and {{/section{0}/key}} != 20'.format(
+                i): {
+                'default': 'fast',
+            },
+        }
+    return rules
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rules = rules_def(size)
+    directory = tempfile.mkdtemp()
+    try:
+        print('{0} rules:'.format(len(rules)))
+        print('  create          {0:.1f} ms'.format(
+            1e3 * timed(ConfigContextualChecker, rules)))
+        print('  create, store   {0:.1f} ms'.format(
+            1e3 * timed(load_checker, rules, directory)))
+        print('  load            {0:.1f} ms'.format(
+            1e3 * min(timed(load_checker, rules, directory)
+                      for _ in range(5))))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
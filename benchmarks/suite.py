@@ -0,0 +1,357 @@
+"""Microbenchmarks of the hot paths of the checker.
+
+Usage: PYTHONPATH=. python benchmarks/suite.py [options]
+
+The benchmark scripts are run from the root of the repository, which is put
+on the path of the modules so that the package is imported from the tree.
+
+Each benchmark is timed with :mod:`timeit`, the best time of a call over
+several repetitions is kept. The results are written as JSON, with the
+versions of python and of the library, then compared to a stored baseline:
+a ratio below 1 means faster than the baseline.
+
+    PYTHONPATH=. python benchmarks/suite.py                  # run, compare
+    PYTHONPATH=. python benchmarks/suite.py --save-baseline  # new baseline
+    PYTHONPATH=. python benchmarks/suite.py -k range         # only some
+    PYTHONPATH=. python benchmarks/suite.py --max-slowdown 1.2  # fail
+
+The baseline is only meaningful on the machine that produced it, it shall be
+stored again when benchmarks are added: the benchmarks missing from it are
+reported, and fail the comparison with --max-slowdown.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import timeit
+
+import configcontextualchecker
+from configcontextualchecker import ConfigContextualChecker
+from configcontextualchecker.condexp import CondExp
+from configcontextualchecker.condexp_parser import Parser
+from configcontextualchecker.dict_path import Path
+from configcontextualchecker.flat_rule import FlatRule
+from configcontextualchecker.range import Range, RangeParser
+from configcontextualchecker.rule import Rule
+
+from parallel import make_configs, make_rules
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+RESULTS = os.path.join(DIRECTORY, 'results.json')
+
+BASELINE = os.path.join(DIRECTORY, 'baseline.json')
+
+# benchmarks names bound to the functions creating the timed callables
+BENCHMARKS = dict()
+
+
+def benchmark(name):
+    """Register a function creating a callable to time."""
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+@benchmark('checker.create')
+def checker_create():
+    rules = make_rules(20)
+    return lambda: ConfigContextualChecker(rules)
+
+
+@benchmark('checker.call')
+def checker_call():
+    checker = ConfigContextualChecker(make_rules(20))
+    configs = list(make_configs(3, 20))
+
+    def check():
+        # 3 configs whose items are strings at each call, their defaults are
+        # set again
+        for config in configs:
+            checker(dict((key, dict(value) if isinstance(value, dict)
+                          else value) for key, value in config.items()))
+    return check
+
+
+@benchmark('checker.compiled_call')
+def compiled_call():
+    checker = ConfigContextualChecker(make_rules(20)).compile()
+    configs = list(make_configs(3, 20))
+
+    def check():
+        for config in configs:
+            checker(dict((key, dict(value) if isinstance(value, dict)
+                          else value) for key, value in config.items()))
+    return check
+
+
+@benchmark('checker.instrumented_call')
+def instrumented_call():
+    checker = ConfigContextualChecker(make_rules(20))
+    checker.instrument()
+    configs = list(make_configs(3, 20))
+
+    def check():
+        for config in configs:
+            checker(dict((key, dict(value) if isinstance(value, dict)
+                          else value) for key, value in config.items()))
+    return check
+
+
+@benchmark('checker.shared_conditions')
+def shared_conditions():
+    # 50 rules with the same condition
+    rule_def = {
+        'type': int,
+        'exists': True,
+        'allowed': '[0, 100]',
+        'default': 0,
+        '{/env} == "prod" and {/level} > 1 and {/mode} in ("a", "b")': {
+            'default': 1,
+        },
+    }
+    rules = dict(('/key_{0}'.format(i), rule_def) for i in range(50))
+    rules['/env'] = {'type': str, 'exists': True}
+    rules['/level'] = {'type': int, 'exists': True}
+    rules['/mode'] = {'type': str, 'exists': True}
+    checker = ConfigContextualChecker(rules)
+    config = {'env': 'prod', 'level': 2, 'mode': 'b'}
+    return lambda: checker(dict(config))
+
+
+@benchmark('rule.apply.flat')
+def rule_apply_flat():
+    rule = Rule('/section/key', {
+        'type': int,
+        'exists': True,
+        'allowed': '[0, 100]',
+        'default': 0,
+    })
+    config = {'section': {'key': '50'}}
+    return lambda: rule.apply(config)
+
+
+@benchmark('rule.apply.contextual')
+def rule_apply_contextual():
+    rule = make_rules(1)['/section_0/key_0']
+    rule = Rule('/section_0/key_0', rule)
+    config = {'mode': 'b', 'level': 2, 'section_0': {'key_0': '50'}}
+    return lambda: rule.apply(config)
+
+
+@benchmark('rule.apply.modes')
+def rule_apply_modes():
+    # 50 contextual rules selected by the value of an item, the last one is
+    # selected
+    rule_def = {
+        'type': int,
+        'exists': True,
+        'allowed': '[0, 100]',
+        'default': 0,
+    }
+    for mode in range(50):
+        rule_def['{{mode}} == "m{0}"'.format(mode)] = {'default': mode}
+    rule = Rule('/section/key', rule_def)
+    config = {'mode': 'm49', 'section': {'key': '50'}}
+    return lambda: rule.apply(config)
+
+
+CONDITION = '({a} in (0, 1) or {b} > 1) and {d} != "x" and not {t}'
+
+CONDITION_CONFIG = {'a': 0, 'b': 1, 'd': 'e', 't': False}
+
+
+@benchmark('condition.parse')
+def condition_parse():
+    parser = Parser()
+    parser.config = CONDITION_CONFIG
+    return lambda: parser.parse(CONDITION)
+
+
+@benchmark('condition.compile')
+def condition_compile():
+    return lambda: CondExp(CONDITION)
+
+
+@benchmark('condition.evaluate')
+def condition_evaluate():
+    cond_exp = CondExp(CONDITION)
+    return lambda: cond_exp.evaluate(CONDITION_CONFIG)
+
+
+def check_value(type_, value, allowed=None):
+    return lambda: FlatRule._check_value(value, True, type_, allowed)
+
+
+BENCHMARKS.update({
+    'check_value.int': lambda: check_value(int, '12345'),
+    'check_value.float': lambda: check_value(float, '1.5e3'),
+    'check_value.str': lambda: check_value(str, 'abc'),
+    'check_value.bool': lambda: check_value(bool, 'True'),
+    'check_value.type': lambda: check_value(type, 'float'),
+    'check_value.native': lambda: check_value(int, 12345),
+    'check_value.range': lambda: check_value(
+        int, '50', RangeParser().parse('[0, 100]')),
+    'check_value.allowed': lambda: check_value(
+        str, 'b', FlatRule._parse_allowed(['a', 'b', 'c'], str)),
+})
+
+
+@benchmark('range.parse')
+def range_parse():
+    parser = RangeParser()
+    return lambda: parser.parse(']-inf, 2.5e3]')
+
+
+def range_contains(*args):
+    range_ = Range(*args)
+    return lambda: 50 in range_
+
+
+BENCHMARKS.update({
+    'range.contains.closed': lambda: range_contains(0, False, 100, False),
+    'range.contains.open': lambda: range_contains(0, True, 100, True),
+    'range.contains.unbounded': lambda: range_contains(0, False, None, False),
+})
+
+
+def path_get(depth):
+    path = Path(''.join('/key_{0}'.format(i) for i in range(depth)))
+    dict_ = dict()
+    path.set(dict_, 0)
+    return lambda: path.get(dict_)
+
+
+def path_set(depth):
+    path = Path(''.join('/key_{0}'.format(i) for i in range(depth)))
+    dict_ = dict()
+    return lambda: path.set(dict_, 0)
+
+
+BENCHMARKS.update({
+    'dict_path.get.1': lambda: path_get(1),
+    'dict_path.get.4': lambda: path_get(4),
+    'dict_path.set.1': lambda: path_set(1),
+    'dict_path.set.4': lambda: path_set(4),
+})
+
+
+def measure(function, repeat, duration=0.05):
+    """Time a callable.
+
+    Parameters
+    ----------
+    function : callable
+        callable without arguments
+    repeat : int
+        number of repetitions
+    duration : float, optional
+        approximate duration of a repetition in seconds
+
+    Returns
+    -------
+    float
+        best time of a call in microseconds
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * duration / 0.2))
+    return 1e6 * min(timer.repeat(repeat, number)) / number
+
+
+def run(names, repeat):
+    results = dict()
+    for name in names:
+        results[name] = measure(BENCHMARKS[name](), repeat)
+        print('  {0:<28} {1:10.3f} us'.format(name, results[name]))
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'version': configcontextualchecker.__version__,
+        'unit': 'us',
+        'results': results,
+    }
+
+
+def compare(results, baseline, max_slowdown=None):
+    """Compare results to a baseline.
+
+    Returns
+    -------
+    regressions : list of str
+        names of the benchmarks slower than the baseline by more than
+        max_slowdown
+    missing : list of str
+        names of the benchmarks missing from the baseline
+    """
+    regressions = list()
+    missing = list()
+    print('compared to the baseline:')
+    for key in ('python', 'implementation', 'machine'):
+        if results[key] != baseline[key]:
+            print('  the baseline was run on another {0}: {1}'.format(
+                key, baseline[key]))
+    for name, time in sorted(results['results'].items()):
+        reference = baseline['results'].get(name)
+        if reference is None:
+            missing += [name]
+            print('  {0:<28} {1:>10}'.format(name, 'missing'))
+            continue
+        ratio = time / reference
+        mark = ''
+        if max_slowdown is not None and ratio > max_slowdown:
+            regressions += [name]
+            mark = '  <- regression'
+        print('  {0:<28} {1:10.2f}x{2}'.format(name, ratio, mark))
+    if missing:
+        print('warning: {0} benchmarks are missing from the baseline, store '
+              'a new one with --save-baseline'.format(len(missing)))
+    return regressions, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', dest='pattern', default='',
+                        help='only run the benchmarks matching a regex')
+    parser.add_argument('--repeat', type=int, default=7,
+                        help='number of repetitions of each timing')
+    parser.add_argument('--output', default=RESULTS,
+                        help='file of the results, default: %(default)s')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='file of the baseline, default: %(default)s')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write the results to the baseline file')
+    parser.add_argument('--max-slowdown', type=float,
+                        help='exit with an error when a benchmark is '
+                             'slower than the baseline by this ratio')
+    args = parser.parse_args(argv)
+
+    pattern = re.compile(args.pattern)
+    names = sorted(name for name in BENCHMARKS if pattern.search(name))
+    results = run(names, args.repeat)
+
+    with open(args.output, 'w') as file_:
+        json.dump(results, file_, indent=2, sort_keys=True)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file_:
+            json.dump(results, file_, indent=2, sort_keys=True)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('no baseline, store one with --save-baseline')
+        return 0
+    with open(args.baseline) as file_:
+        baseline = json.load(file_)
+    regressions, missing = compare(results, baseline, args.max_slowdown)
+    if regressions or (missing and args.max_slowdown is not None):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
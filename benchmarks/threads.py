@@ -0,0 +1,57 @@
+"""Benchmark of the checking of configs by several threads.
+
+Usage: PYTHONPATH=. python benchmarks/threads.py [number of configs per thread]
+
+The same checker is shared by an increasing number of threads, each thread
+checks its own configs. The throughput scales with the number of threads
+only when the interpreter runs threads in parallel, i.e. on free-threaded
+builds; the speedup is relative to one thread.
+"""
+
+import multiprocessing
+import sys
+import threading
+import time
+
+from configcontextualchecker import ConfigContextualChecker
+
+from parallel import make_rules, make_configs
+
+
+def throughput(checker, threads_count, count, rules_count):
+    configs = [list(make_configs(count, rules_count))
+               for _ in range(threads_count)]
+
+    def check(configs):
+        for config in configs:
+            checker(config)
+
+    threads = [threading.Thread(target=check, args=(c,)) for c in configs]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return threads_count * count / (time.time() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rules_count = 200
+    checker = ConfigContextualChecker(make_rules(rules_count))
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('GIL enabled: {0}'.format(gil))
+
+    threads_count = 1
+    reference = None
+    while threads_count <= multiprocessing.cpu_count():
+        rate = throughput(checker, threads_count, count, rules_count)
+        reference = reference or rate
+        print('{0} threads: {1:.0f} configs/s, speedup {2:.2f}'.format(
+            threads_count, rate, rate / reference))
+        threads_count *= 2
+
+
+if __name__ == '__main__':
+    main()
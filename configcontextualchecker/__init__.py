@@ -1 +1,3 @@
+__version__ = '0.8'
+
 from .checker import ConfigContextualChecker
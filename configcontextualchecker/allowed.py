@@ -0,0 +1,93 @@
+"""This module provides the container of the allowed values of a rule.
+
+The allowed values are enumerated by a list, the membership of a value is
+tested with a container compiled from the list: a frozenset, or a sorted
+array searched by bisection for the large numeric enumerations which are
+then stored compactly.
+"""
+
+import bisect
+import math
+from array import array
+
+
+class SortedArray(object):
+    """Sorted array of numbers searched by bisection.
+
+    Parameters
+    ----------
+    values : iterable of int or float
+        numbers of the array
+    typecode : str
+        type code of the :class:`array.array`
+    """
+
+    __slots__ = ('_array',)
+
+    def __init__(self, values, typecode):
+        self._array = array(typecode, sorted(values))
+
+    def __contains__(self, value):
+        index = bisect.bisect_left(self._array, value)
+        return index < len(self._array) and self._array[index] == value
+
+    def __len__(self):
+        return len(self._array)
+
+    def __getstate__(self):
+        return self._array
+
+    def __setstate__(self, state):
+        self._array = state
+
+
+class AllowedValues(list):
+    """Allowed values of a rule.
+
+    This is the list of the allowed values, as defined by the rule, with a
+    fast membership test. It shall not be modified.
+
+    Parameters
+    ----------
+    values : iterable
+        allowed values
+
+    Attributes
+    ----------
+    container : frozenset or :class:`SortedArray` or list
+        container used for testing the membership of a value
+    """
+
+    # size from which a numeric enumeration is stored in a sorted array
+    ARRAY_MIN_SIZE = 1024
+
+    def __init__(self, values):
+        super(AllowedValues, self).__init__(values)
+        self.container = self._compile(self)
+
+    @classmethod
+    def _compile(cls, values):
+        """Compile the container of the values."""
+        types = set(type(value) for value in values)
+        if len(values) >= cls.ARRAY_MIN_SIZE and len(types) == 1:
+            type_ = types.pop()
+            try:
+                if type_ is int:
+                    return SortedArray(values, 'q')
+                if type_ is float and not any(math.isnan(v) for v in values):
+                    return SortedArray(values, 'd')
+            except OverflowError:
+                # too large for a machine integer
+                pass
+        try:
+            return frozenset(values)
+        except TypeError:
+            # not hashable
+            return list(values)
+
+    def __contains__(self, value):
+        try:
+            return value in self.container
+        except TypeError:
+            # the value cannot be compared or hashed
+            return list.__contains__(self, value)
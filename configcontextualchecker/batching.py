@@ -0,0 +1,141 @@
+"""This module provides the asyncio front end of the checker.
+
+The configs to check are grouped into micro-batches: the configs submitted
+within a short time window are checked together by an executor, so the
+event loop is not blocked and the cost of a round trip to the executor is
+shared by the configs of a batch.
+"""
+
+import asyncio
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, \
+    ThreadPoolExecutor
+
+from .checker import _check_all, _check_chunk, _init_worker
+
+
+def _check_batch(check, configs):
+    return list(_check_all(check, configs))
+
+
+class MicroBatcher(object):
+    """Micro-batching asynchronous checker.
+
+    A batch is checked when it holds ``max_batch_size`` configs or when its
+    first config has waited for ``max_wait`` seconds.
+    A batcher shall be used from a single event loop.
+
+    Parameters
+    ----------
+    checker : :class:`ConfigContextualChecker`
+        checker of the configs, it is compiled
+    max_batch_size : int, optional
+        maximum number of configs of a batch
+    max_wait : float, optional
+        maximum time in seconds a config waits for its batch to be checked
+    executor : str or :class:`concurrent.futures.Executor`, optional
+        executor that checks the batches: 'thread' for a thread pool,
+        'process' for a process pool, or an executor instance
+
+    Attributes
+    ----------
+    max_batch_size : int
+        maximum number of configs of a batch
+    max_wait : float
+        maximum time in seconds a config waits for its batch to be checked
+    """
+
+    def __init__(self, checker, max_batch_size=64, max_wait=0.001,
+                 executor='thread'):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._check = checker.compile()
+        self._owns_executor = not isinstance(executor, Executor)
+        if executor == 'thread':
+            self._executor = ThreadPoolExecutor()
+        elif executor == 'process':
+            # the compiled checker is sent once to each process
+            self._executor = ProcessPoolExecutor(
+                initializer=_init_worker,
+                initargs=(pickle.dumps(self._check,
+                                       pickle.HIGHEST_PROTOCOL),))
+        elif isinstance(executor, Executor):
+            self._executor = executor
+        else:
+            raise ValueError('bad executor {0!r}'.format(executor))
+        self._process = executor == 'process'
+        self._pending = list()
+        self._timer = None
+
+    async def check(self, config):
+        """Check a config against the rules.
+
+        Parameters
+        ----------
+        config : dict
+            config to check
+
+        Returns
+        -------
+        dict
+            checked config, a copy of the config when it is checked by
+            another process
+
+        Raises
+        ------
+        Exception
+            the error raised by the checking of the config
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((config, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def close(self):
+        """Shut down the executor if it has been created by the batcher."""
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    def _flush(self):
+        """Send the pending configs to the executor."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = list()
+        configs = [config for config, _ in batch]
+        loop = asyncio.get_running_loop()
+        if self._process:
+            checked = loop.run_in_executor(self._executor, _check_chunk,
+                                           (0, configs))
+        else:
+            checked = loop.run_in_executor(self._executor, _check_batch,
+                                           self._check, configs)
+        checked.add_done_callback(
+            lambda checked: self._dispatch(batch, checked))
+
+    @staticmethod
+    def _dispatch(batch, checked):
+        """Pass the results of a batch to the futures of its configs."""
+        futures = [future for _, future in batch]
+        error = checked.exception()
+        if error is None:
+            for future, result in zip(futures, checked.result()):
+                if future.done():
+                    continue
+                if result.valid:
+                    future.set_result(result.config)
+                else:
+                    future.set_exception(result.error)
+        else:
+            # the whole batch failed
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
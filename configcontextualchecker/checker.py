@@ -3,47 +3,187 @@
 This is the entry point into the checker.
 """
 
-import networkx
+import copy
+import heapq
+import itertools
+from collections import deque, namedtuple
 
-from .dict_path import set_from_path
+from .codegen import CompiledChecker
+from .condexp import iter_shared, share
+from .dict_path import Path, PathTrie
+from .exceptions import RuleError
 from .rule import Rule
 
 
+class CheckResult(namedtuple('CheckResult', ('index', 'config', 'error'))):
+    """Result of the checking of a config.
+
+    Attributes
+    ----------
+    index : int
+        position of the config in the checked sequence
+    config : dict
+        checked config
+    error : Exception or None
+        error raised by the checking, None if the config is valid
+    """
+
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        """Whether the config satisfies the rules."""
+        return self.error is None
+
+
+class Violation(namedtuple('Violation',
+                           ('rule', 'context', 'kind', 'error'))):
+    """Violation of a rule by a config.
+
+    Attributes
+    ----------
+    rule : str
+        name of the rule, the path of its item
+    context : str or None
+        conditional expression of the selected contextual rule, None for the
+        base rule or when the selection failed
+    kind : str
+        name of the type of the error, like ``'ItemError'``, ``'TypeError'``
+        or ``'ValueError'``
+    error : Exception
+        error raised by the rule
+    """
+
+    __slots__ = ()
+
+
+class CheckReport(namedtuple('CheckReport', ('violations', 'skipped'))):
+    """Report of all the violations of the rules by a config.
+
+    Attributes
+    ----------
+    violations : tuple of :class:`Violation`
+        violations in the order the rules are applied
+    skipped : tuple of str
+        names of the rules not applied since they depend on items that
+        violate a rule or that were not checked
+    """
+
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        """Whether the config satisfies the rules."""
+        return not self.violations
+
+
+def _check_all(check, configs, start=0):
+    """Check configs one after the other.
+
+    Parameters
+    ----------
+    check : callable
+        checker
+    configs : iterable of dict
+        configs to check
+    start : int, optional
+        index of the first config
+
+    Yields
+    ------
+    :class:`CheckResult`
+        result of the checking of each config, in order
+    """
+    for index, config in enumerate(configs, start):
+        try:
+            check(config)
+        except Exception as error:
+            yield CheckResult(index, config, error)
+        else:
+            yield CheckResult(index, config, None)
+
+
+# compiled checker of a worker process
+_WORKER_CHECKER = None
+
+
+def _init_worker(pickled_checker):
+    import pickle
+    global _WORKER_CHECKER
+    _WORKER_CHECKER = pickle.loads(pickled_checker)
+
+
+def _check_chunk(chunk):
+    start, configs = chunk
+    return list(_check_all(_WORKER_CHECKER, configs, start))
+
+
+def _delete(dict_, path):
+    """Delete a dict value from a path if it exists."""
+    for key in path.keys[:-1]:
+        dict_ = dict_.get(key)
+        if not isinstance(dict_, dict):
+            return
+    dict_.pop(path.keys[-1], None)
+
+
 class ConfigContextualChecker(object):
     """Contextual config checker class.
 
     A :class:`ConfigContextualChecker` object is a callable that can process a
     config object or a dictionary.
+    It holds no state of the checking, so several threads can check configs at
+    once.
 
     Parameters
     ----------
     rules_def : dict
         rule definitions
+    cache : :class:`ConversionCache`, optional
+        cache of the checked string values, it may be shared with other
+        checkers, no caching by default
 
     Attributes
     ----------
     graph : :class:`networkx.DiGraph`
-        rules dependency graph
+        rules dependency graph, created on first access
+    plan : tuple of :class:`Rule`
+        rules in the order they are applied, dependencies first and ties
+        broken by the rules names so the order does not depend on the one of
+        the definitions
+    batcher : :class:`MicroBatcher` or None
+        micro-batching asynchronous checker used by :meth:`acheck`, one with
+        the default settings is created on first use
     """
 
-    def __init__(self, rules_def):
-        self.graph = networkx.DiGraph()
+    def __init__(self, rules_def, cache=None):
+        self.batcher = None
+        self._graph = None
+        self._stats = None
 
         # parse the rule definitions
         rules = list()
         for name, rule_def in rules_def.items():
-            rules += [Rule(name, rule_def)]
-
-        # create the dependency graph of the rules
-        self.graph.add_nodes_from(rules)
+            rules += [Rule(name, rule_def, cache)]
 
         name_node = dict()
         for rule in rules:
             name_node[rule.name] = rule
 
+        # rules that depend on each rule
+        self._dependents = dict((rule, list()) for rule in rules)
         for node in rules:
-            for dep in node.dependencies:
-                self.graph.add_edge(name_node[dep], node)
+            for dep in set(node.dependencies):
+                self._dependents[name_node[dep]] += [node]
+
+        # sort the rules once and for all according to their dependencies
+        self.plan = self._sort(rules)
+
+        # paths of all the items the rules read
+        self._trie = PathTrie(path for rule in rules for path in rule.paths)
+
+        self._precompute_impacts()
+        self._share_conditions()
 
     def __call__(self, config):
         """Check a config against the rules.
@@ -53,9 +193,454 @@ class ConfigContextualChecker(object):
         config : dict
             config to check
         """
-        # loop over the rules sorted according to their dependencies and
-        # apply them
-        for rule in networkx.topological_sort(self.graph):
+        if self._stats is not None:
+            return self._instrumented_call(config)
+
+        # walk the config once for all the rules
+        values = self._trie.snapshot(config)
+        for rule in self.plan:
+            value = rule.apply(config, values)
+            self._store(rule, config, value, values)
+
+    def _instrumented_call(self, config):
+        # the same as __call__, the rules are applied through their records
+        values = self._trie.snapshot(config)
+        for rule in self.plan:
+            value = self._stats[rule.name].apply(rule, config, values)
+            self._store(rule, config, value, values)
+
+    def _store(self, rule, config, value, values):
+        """Set the value returned by a rule and update the values seen by the
+        next rules.
+
+        Parameters
+        ----------
+        rule : :class:`Rule`
+            applied rule
+        config : dict
+            config being checked
+        value : int or float or str or None
+            value returned by the rule, None if the item does not exist
+        values : dict
+            values of the items and of the shared conditions, updated in place
+        """
+        if value is not None:
+            created = rule.path.set(config, value)
+            if created is not None or values[rule.name] is not value:
+                self._trie.refresh(values, config, rule.path, created)
+                if rule in self._invalidated:
+                    for node in self._invalidated[rule]:
+                        values.pop(node, None)
+
+    def __getstate__(self):
+        # the trie and the impacts are larger than the rules and quick to
+        # create again
+        state = self.__dict__.copy()
+        del state['_trie'], state['_rule_impacts'], state['_section_impacts']
+        state['batcher'] = state['_graph'] = state['_stats'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._trie = PathTrie(path for rule in self.plan
+                              for path in rule.paths)
+        self._precompute_impacts()
+
+    @property
+    def graph(self):
+        """Rules dependency graph."""
+        if self._graph is None:
+            # networkx takes long to import, it is only imported when needed
+            import networkx
+
+            graph = networkx.DiGraph()
+            graph.add_nodes_from(self.plan)
+            for rule, dependents in self._dependents.items():
+                for dependent in dependents:
+                    graph.add_edge(rule, dependent)
+            self._graph = graph
+        return self._graph
+
+    def instrument(self, enabled=True):
+        """Enable or disable the instrumentation of the rules.
+
+        An instrumented checker records the applications of each rule when
+        it is called, see :class:`RuleStats`. The records are reset when the
+        instrumentation is enabled, they are dropped when it is disabled.
+        The checker checks the configs the same way, a bit slower, and a
+        checker that is not instrumented is not slowed down.
+        The checkers of :meth:`compile` and the rules applied by
+        :meth:`recheck` are not instrumented.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            whether to instrument the rules
+        """
+        if enabled:
+            from .stats import RuleStats
+            self._stats = dict((rule.name, RuleStats()) for rule in self.plan)
+        else:
+            self._stats = None
+
+    def stats(self):
+        """Get the records of the applications of the rules.
+
+        Returns
+        -------
+        dict
+            copies of the :class:`RuleStats` of the rules bound to their
+            names, empty when the instrumentation is disabled, they can be
+            exported with :func:`stats.write_prometheus`
+        """
+        if self._stats is None:
+            return dict()
+        return dict((name, stat.copy()) for name, stat in self._stats.items())
+
+    def _sort(self, rules):
+        """Sort the rules according to their dependencies.
+
+        The dependencies come first and the ties are broken by the rules
+        names.
+
+        Parameters
+        ----------
+        rules : list of :class:`Rule`
+            rules to sort
+
+        Returns
+        -------
+        tuple of :class:`Rule`
+            sorted rules
+
+        Raises
+        ------
+        RuleError
+            if the rules depend on each other circularly
+        """
+        # number of the dependencies of each rule not sorted yet
+        counts = dict((rule, len(set(rule.dependencies))) for rule in rules)
+        ready = [(rule.name, rule) for rule in rules if not counts[rule]]
+        heapq.heapify(ready)
+
+        plan = list()
+        while ready:
+            _, rule = heapq.heappop(ready)
+            plan += [rule]
+            for dependent in self._dependents[rule]:
+                counts[dependent] -= 1
+                if not counts[dependent]:
+                    heapq.heappush(ready, (dependent.name, dependent))
+
+        if len(plan) != len(rules):
+            names = sorted(rule.name for rule in rules if counts[rule])
+            msg = 'circular dependencies between the rules {0}'.format(
+                ', '.join(names))
+            raise RuleError(msg)
+        return tuple(plan)
+
+    def _precompute_impacts(self):
+        """Precompute the rules to apply again when an item changes.
+
+        The rules are represented by bitsets of their indices in the plan.
+        """
+        index = dict((rule, i) for i, rule in enumerate(self.plan))
+
+        # a rule and the rules that depend on it, recursively
+        impacts = [0] * len(self.plan)
+        for i in reversed(range(len(self.plan))):
+            bits = 1 << i
+            for successor in self._dependents[self.plan[i]]:
+                bits |= impacts[index[successor]]
+            impacts[i] = bits
+
+        # impacts of the rules bound to the keys of their items paths, and of
+        # all the rules of the items below the keys
+        self._rule_impacts = dict()
+        self._section_impacts = dict()
+        for i, rule in enumerate(self.plan):
+            keys = rule.path.keys
+            self._rule_impacts[keys] = \
+                self._rule_impacts.get(keys, 0) | impacts[i]
+            for depth in range(1, len(keys) + 1):
+                self._section_impacts[keys[:depth]] = \
+                    self._section_impacts.get(keys[:depth], 0) | impacts[i]
+
+    def _share_conditions(self):
+        """Share the identical subexpressions of the conditional expressions.
+
+        A shared subexpression is evaluated once per check, its value is kept
+        with the values of the items. The rules of its items come first, so
+        their values are final when it is evaluated, unless a later rule sets
+        an item of a section or a section of an item: its value is dropped
+        when such a rule sets its item.
+        """
+        cond_exps = [cond_exp for rule in self.plan
+                     for cond_exp, _ in rule.cond_exps
+                     if cond_exp.tree is not None]
+        trees = share([cond_exp.tree for cond_exp in cond_exps])
+        for cond_exp, tree in zip(cond_exps, trees):
+            cond_exp.tree = tree
+
+        # the shared subexpressions and the index of the first rule that
+        # evaluates them, bound to the keys of the paths of their items and
+        # to the ones of the sections containing the items
+        items = dict()
+        sections = dict()
+        seen = set()
+        for i, rule in enumerate(self.plan):
+            for cond_exp, _ in rule.cond_exps:
+                if cond_exp.tree is None:
+                    continue
+                for node in iter_shared(cond_exp.tree, seen):
+                    for path in node.paths:
+                        keys = path.keys
+                        items.setdefault(keys, []).append((i, node))
+                        for depth in range(1, len(keys) + 1):
+                            sections.setdefault(keys[:depth], []).append(
+                                (i, node))
+
+        # the shared subexpressions whose values may change when a rule sets
+        # its item, bound to the rule, for the rules that have ones
+        self._invalidated = dict()
+        for i, rule in enumerate(self.plan):
+            keys = rule.path.keys
+            candidates = list(sections.get(keys, ()))
+            for depth in range(1, len(keys)):
+                candidates += items.get(keys[:depth], ())
+            nodes = set(node for first, node in candidates if first <= i)
+            if nodes:
+                self._invalidated[rule] = tuple(nodes)
+
+    def impacted(self, changed):
+        """Find the rules to apply again after some items have changed.
+
+        These are the rules of the changed items, of the items within changed
+        sections or of the sections containing changed items, and the rules
+        that depend on them.
+
+        Parameters
+        ----------
+        changed : iterable of str
+            paths of the changed items or sections
+
+        Returns
+        -------
+        list of :class:`Rule`
+            rules in the order they are applied
+        """
+        bits = 0
+        for string in changed:
+            keys = Path(string).keys
+            bits |= self._section_impacts.get(keys, 0)
+            for depth in range(1, len(keys)):
+                bits |= self._rule_impacts.get(keys[:depth], 0)
+
+        rules = list()
+        while bits:
+            lowest = bits & -bits
+            bits ^= lowest
+            rules += [self.plan[lowest.bit_length() - 1]]
+        return rules
+
+    def recheck(self, config, changed, original):
+        """Check again a config after some of its items have changed.
+
+        Only the rules given by :meth:`impacted` are applied. The changed
+        items and the items of these rules are first restored to their values
+        in the unchecked config, or deleted if they are not in it, so that the
+        default values are set again and the result is the one of a full
+        checking of the unchecked config.
+
+        Parameters
+        ----------
+        config : dict
+            config already checked, it is updated in place
+        changed : iterable of str
+            paths of the items or sections that differ between the config
+            checked before and the unchecked config
+        original : dict
+            unchecked config, it is left untouched
+        """
+        changed = list(changed)
+        rules = self.impacted(changed)
+        for path in [Path(string) for string in changed] + \
+                [rule.path for rule in rules]:
+            value = path.get(original)
+            if value is None:
+                _delete(config, path)
+            else:
+                path.set(config, copy.deepcopy(value))
+
+        for rule in rules:
             value = rule.apply(config)
             if value is not None:
-                set_from_path(config, rule.name, value)
+                rule.path.set(config, value)
+
+    def report(self, config):
+        """Check a config against all the rules and report the violations.
+
+        Unlike a call, the checking does not stop at the first violation.
+        A rule that depends on an item that violates its rule, or that was
+        not checked, is skipped so that a violation does not cause others.
+        The items of the other rules are set as a call sets them.
+
+        Parameters
+        ----------
+        config : dict
+            config to check
+
+        Returns
+        -------
+        :class:`CheckReport`
+            violations of the rules and skipped rules
+        """
+        violations = list()
+        skipped = list()
+        # names of the rules violated or skipped
+        failed = set()
+        values = self._trie.snapshot(config)
+        for rule in self.plan:
+            if failed and not failed.isdisjoint(rule.dependencies):
+                skipped += [rule.name]
+                failed.add(rule.name)
+                continue
+
+            condition = None
+            try:
+                condition, flat_rule = rule.select(config, values)
+                value = flat_rule.check(values[rule.name])
+            except Exception as error:
+                violations += [Violation(rule.name, condition,
+                                         type(error).__name__, error)]
+                failed.add(rule.name)
+                continue
+
+            self._store(rule, config, value, values)
+        return CheckReport(tuple(violations), tuple(skipped))
+
+    def check_many(self, configs):
+        """Check configs one after the other.
+
+        The configs are checked lazily as the results are consumed, an error
+        raised by a config is reported in its result and does not stop the
+        checking of the next ones.
+
+        Parameters
+        ----------
+        configs : iterable of dict
+            configs to check
+
+        Yields
+        ------
+        :class:`CheckResult`
+            result of the checking of each config, in order
+        """
+        return _check_all(self, configs)
+
+    def check_parallel(self, configs, processes=None, chunksize=256):
+        """Check configs with a pool of processes.
+
+        The rules are compiled and sent once to each process, the configs are
+        sent by chunks. The number of chunks being checked is bounded so the
+        configs are consumed as the results are.
+        Since the configs are checked by other processes, the configs of the
+        results are the checked copies, not the original configs.
+
+        Parameters
+        ----------
+        configs : iterable of dict
+            configs to check
+        processes : int, optional
+            number of processes, the number of CPUs by default
+        chunksize : int, optional
+            number of configs sent at once to a process
+
+        Yields
+        ------
+        :class:`CheckResult`
+            result of the checking of each config, in order
+        """
+        # those modules take long to import, they are only imported when
+        # needed
+        import multiprocessing
+        import pickle
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        pickled_checker = pickle.dumps(self.compile(),
+                                       pickle.HIGHEST_PROTOCOL)
+        pool = multiprocessing.Pool(processes, _init_worker,
+                                    (pickled_checker,))
+        try:
+            configs = iter(configs)
+            pending = deque()
+            start = 0
+            while True:
+                chunk = list(itertools.islice(configs, chunksize))
+                if chunk:
+                    pending.append(pool.apply_async(_check_chunk,
+                                                    ((start, chunk),)))
+                    start += len(chunk)
+                if pending and (not chunk or len(pending) > 2 * processes):
+                    for result in pending.popleft().get():
+                        yield result
+                elif not chunk:
+                    break
+        finally:
+            pool.terminate()
+
+    def acheck(self, config):
+        """Check a config against the rules without blocking the event loop.
+
+        The config is checked by the executor of :attr:`batcher`, together
+        with the other configs submitted within a short time window.
+
+        Parameters
+        ----------
+        config : dict
+            config to check
+
+        Returns
+        -------
+        awaitable
+            awaitable of the checked config, it raises the error raised by
+            the checking
+        """
+        if self.batcher is None:
+            # asyncio is only imported when used
+            from .batching import MicroBatcher
+            self.batcher = MicroBatcher(self)
+        return self.batcher.check(config)
+
+    def watch(self, filenames, callback, **kwargs):
+        """Create a watcher that checks config files when they are modified.
+
+        Parameters
+        ----------
+        filenames : iterable of str
+            paths to the config files to watch
+        callback : callable
+            called with a :class:`WatchResult` each time a file is checked
+        kwargs
+            other arguments of :class:`Watcher`
+
+        Returns
+        -------
+        :class:`Watcher`
+            watcher of the files, the watching is started with its
+            :meth:`Watcher.run` method
+        """
+        from .watch import Watcher
+        return Watcher(self, filenames, callback, **kwargs)
+
+    def compile(self):
+        """Generate a specialized checking function from the rules.
+
+        Returns
+        -------
+        :class:`CompiledChecker`
+            callable that checks a config like the current checker, its
+            ``source`` attribute holds the generated source
+        """
+        return CompiledChecker(self)
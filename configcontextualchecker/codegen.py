@@ -0,0 +1,389 @@
+"""This module provides the code generation backend of the checker.
+
+The rules of a :class:`ConfigContextualChecker` are turned into the source of
+a single Python function where the items paths, the types, the allowed values
+and the conditional expressions are inlined.
+Only the common cases are inlined, the other ones are handed over to the
+objects of the checker so the errors are the same as the ones of the checker.
+"""
+
+import math
+
+from .condexp import (Literal, Item, Not, And, Or, Compare, Contains, Shared,
+                      NUMBER_TYPES, OPERAND_TYPES, grammar_tests)
+from .allowed import AllowedValues
+from .exceptions import ItemError
+from .flat_rule import FlatRule
+from .range import Range
+
+
+class CompiledChecker(object):
+    """Compiled config checker class.
+
+    A :class:`CompiledChecker` object is a callable that processes a config
+    object like the checker it has been generated from.
+    The rules are copied when the source is generated, later changes to the
+    rules of the checker are not taken into account.
+    It can be pickled, only the source and the objects it refers to are
+    stored, the source is compiled again when unpickling.
+
+    Parameters
+    ----------
+    checker : :class:`ConfigContextualChecker`
+        checker to compile
+
+    Attributes
+    ----------
+    source : str
+        source of the generated function
+    """
+
+    # name of the generated function
+    FUNCTION_NAME = 'check'
+
+    def __init__(self, checker):
+        generator = _SourceGenerator(self.FUNCTION_NAME)
+        self.source = generator.generate(checker.plan)
+        self._constants = generator.constants
+        self._function = self._compile()
+
+    def _compile(self):
+        """Compile the source and return the checking function."""
+        namespace = dict(self._constants)
+        code = compile(self.source, '<configcontextualchecker>', 'exec')
+        exec(code, namespace)
+        return namespace[self.FUNCTION_NAME]
+
+    def __getstate__(self):
+        return {'source': self.source, '_constants': self._constants}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._function = self._compile()
+
+    def __call__(self, config):
+        """Check a config against the rules.
+
+        Parameters
+        ----------
+        config : dict
+            config to check
+        """
+        self._function(config)
+
+
+class _SourceGenerator(object):
+    """Generator of the source of a checking function.
+
+    Parameters
+    ----------
+    function_name : str
+        name of the generated function
+
+    Attributes
+    ----------
+    constants : dict
+        objects referred to by the source, bound to their names
+    """
+
+    INDENT = '    '
+
+    # maximum number of allowed values inlined as a set display
+    MAX_SET_DISPLAY_SIZE = 64
+
+    def __init__(self, function_name):
+        self.function_name = function_name
+        self.constants = {
+            'ItemError': ItemError,
+            'check_value': FlatRule._check_value,
+            'NUMBER_TYPES': NUMBER_TYPES,
+            'OPERAND_TYPES': OPERAND_TYPES,
+        }
+        self._lines = list()
+
+    def generate(self, rules):
+        """Generate the source of the checking function.
+
+        Parameters
+        ----------
+        rules : sequence of :class:`Rule`
+            rules in the order they are applied
+
+        Returns
+        -------
+        str
+            source of the function
+        """
+        self._lines = list()
+        self._emit(0, 'def {0}(config):'.format(self.function_name))
+        for rule in rules:
+            self._emit_rule(rule)
+        self._emit(1, 'return None')
+        return '\n'.join(self._lines) + '\n'
+
+    def _emit(self, level, line):
+        self._lines += [self.INDENT * level + line]
+
+    def _constant(self, obj, hint='constant'):
+        """Bind an object to a name usable in the source.
+
+        Parameters
+        ----------
+        obj : any object
+            object to bind
+        hint : str, optional
+            prefix of the name
+
+        Returns
+        -------
+        str
+            the name bound to the object
+        """
+        name = '{0}_{1}'.format(hint, len(self.constants))
+        self.constants[name] = obj
+        return name
+
+    @staticmethod
+    def _is_literal(obj):
+        """Tell whether an object can be represented by a literal."""
+        if type(obj) is float:
+            return not math.isinf(obj) and not math.isnan(obj)
+        return obj is None or type(obj) in (bool, int, str)
+
+    def _literal(self, obj):
+        """Provide the source of an object, as a literal if possible.
+
+        Parameters
+        ----------
+        obj : any object
+            object to represent
+
+        Returns
+        -------
+        str
+            source evaluating to the object or to an equal object
+        """
+        if self._is_literal(obj):
+            return repr(obj)
+        return self._constant(obj)
+
+    def _type(self, type_):
+        """Provide the source of a type."""
+        if type_ in (bool, int, float, str, type):
+            return type_.__name__
+        return self._constant(type_, 'type')
+
+    def _types(self, variable, types):
+        """Provide the source of a test of the type of a variable."""
+        if len(types) == 1:
+            return 'type({0}) is {1}'.format(variable, self._type(types[0]))
+        for name in ('NUMBER_TYPES', 'OPERAND_TYPES'):
+            if types == self.constants[name]:
+                return 'type({0}) in {1}'.format(variable, name)
+        return 'type({0}) in {1}'.format(variable,
+                                         self._constant(types, 'types'))
+
+    def _emit_rule(self, rule):
+        self._emit(1, '# {0}'.format(rule.name))
+
+        trees = [cond_exp.tree for cond_exp, _ in rule.cond_exps]
+        if None in trees:
+            # the parser is needed to evaluate some expressions
+            self._emit(1, 'value = {0}(config)'.format(
+                self._constant(rule.apply, 'apply')))
+            self._emit_set(1, rule.name)
+            return
+
+        # fetch once the items the conditional expressions refer to and
+        # gather the types they must have
+        items, pairs, fits = grammar_tests(trees)
+        variables = dict()
+        for path in items:
+            variables[path] = 'item_{0}'.format(len(variables))
+            self._emit_get(1, path, variables[path])
+
+        guards = self._guards(items, pairs, fits, variables)
+        level = 1
+        if guards:
+            # the items values do not fit the grammar
+            self._emit(1, 'if not ({0}):'.format(' and '.join(guards)))
+            self._emit(2, 'value = {0}(config)'.format(
+                self._constant(rule.apply, 'apply')))
+            self._emit(1, 'else:')
+            level = 2
+
+        self._emit_get(level, rule.path, 'value')
+        keyword = 'if'
+        for cond_exp, flat_rule in rule.cond_exps:
+            self._emit(level, '{0} {1}:'.format(
+                keyword, self._condition(cond_exp.tree, variables)))
+            self._emit_flat_rule(level + 1, flat_rule)
+            keyword = 'elif'
+        if rule.cond_exps:
+            self._emit(level, 'else:')
+            self._emit_flat_rule(level + 1, rule.base_rule)
+        else:
+            self._emit_flat_rule(level, rule.base_rule)
+
+        self._emit_set(1, rule.path)
+
+    def _emit_get(self, level, path, variable):
+        """Emit the lookup of an item, like :meth:`Path.get`."""
+        if path.nested:
+            keys = ''.join('[{0!r}]'.format(key) for key in path.keys)
+            self._emit(level, 'try:')
+            self._emit(level + 1, '{0} = config{1}'.format(variable, keys))
+            self._emit(level, 'except (TypeError, KeyError):')
+            self._emit(level + 1, '{0} = None'.format(variable))
+        else:
+            self._emit(level, '{0} = config.get({1!r})'.format(
+                variable, path.keys[0]))
+
+    def _emit_set(self, level, path):
+        """Emit the assignment of an item, like :meth:`Path.set`."""
+        self._emit(level, 'if value is not None:')
+        level += 1
+        parent = 'config'
+        for depth, key in enumerate(path.keys[:-1]):
+            section = 'section_{0}'.format(depth)
+            self._emit(level, '{0} = {1}.get({2!r})'.format(section, parent,
+                                                            key))
+            self._emit(level, 'if not isinstance({0}, dict):'.format(
+                section))
+            self._emit(level + 1, '{0} = {1}[{2!r}] = dict()'.format(
+                section, parent, key))
+            parent = section
+        self._emit(level, '{0}[{1!r}] = value'.format(parent, path.keys[-1]))
+
+    def _emit_flat_rule(self, level, flat_rule):
+        """Emit the checking of the value, like :meth:`FlatRule.apply`."""
+        if not flat_rule.exists:
+            self._emit(level, 'if value is not None:')
+            self._emit(level + 1, "raise ItemError('item is forbidden')")
+            return
+
+        self._emit(level, 'if value is None:')
+        if flat_rule.default is None:
+            self._emit(level + 1, "raise ItemError('item is mandatory')")
+        else:
+            self._emit(level + 1, 'value = {0}'.format(
+                self._literal(flat_rule.default)))
+
+        # the value is kept as is when it has the right type and is allowed,
+        # the checking of the flat rule deals with the other cases
+        type_ = self._type(flat_rule.type)
+        test = 'type(value) is not {0}'.format(type_)
+        if flat_rule.allowed is not None:
+            test += ' or {0}'.format(self._forbidden('value',
+                                                     flat_rule.allowed))
+        self._emit(level, 'elif {0}:'.format(test))
+        if flat_rule.cache is not None and flat_rule.type is not str:
+            # the flat rule looks up its cache
+            self._emit(level + 1, 'value = {0}(value)'.format(
+                self._constant(flat_rule.check, 'check')))
+            return
+        self._emit(level + 1, 'value = check_value(value, True, {0}, {1}, '
+                              '{2})'.format(
+                                  type_,
+                                  self._constant(flat_rule.allowed,
+                                                 'allowed'),
+                                  self._literal(flat_rule.default)))
+
+    def _forbidden(self, variable, allowed):
+        """Provide the source of a test that a value is not allowed."""
+        if isinstance(allowed, Range):
+            bounds = list()
+            if allowed.lower.value is not None:
+                bounds += [self._literal(allowed.lower.value),
+                           '<' if allowed.lower._open else '<=']
+            bounds += [variable]
+            if allowed.upper.value is not None:
+                bounds += ['<' if allowed.upper._open else '<=',
+                           self._literal(allowed.upper.value)]
+            return 'not {0}'.format(' '.join(bounds))
+
+        if isinstance(allowed, list) and \
+                0 < len(allowed) <= self.MAX_SET_DISPLAY_SIZE and \
+                all(self._is_literal(v) for v in allowed):
+            # a set display of literals is compiled to a constant
+            values = ', '.join(repr(v) for v in allowed)
+            return '{0} not in {{{1}}}'.format(variable, values)
+
+        if isinstance(allowed, AllowedValues):
+            # test the membership with its compiled container directly
+            allowed = allowed.container
+        return '{0} not in {1}'.format(variable,
+                                       self._constant(allowed, 'allowed'))
+
+    def _guards(self, items, pairs, fits, variables):
+        """Provide the tests that the items values fit the grammar.
+
+        Parameters
+        ----------
+        items : dict
+            types allowed for the values bound to the items paths
+        pairs : list of tuple
+            paths of the items tested for equality to one another
+        fits : bool
+            whether the literals tested for equality are of the same kind
+        variables : dict
+            names of the variables bound to the items paths
+
+        Returns
+        -------
+        list of str
+            sources of the tests
+        """
+        guards = [self._types(variables[path], types)
+                  for path, types in sorted(items.items(),
+                                            key=lambda item: item[0].string)]
+
+        # equality tests shall not compare strings to numbers
+        guard = '(type({0}) is str) is (type({1}) is str)'
+        guards += [guard.format(variables[left], variables[right])
+                   for left, right in pairs]
+        if not fits:
+            guards += ['False']
+        return guards
+
+    def _condition(self, node, variables):
+        """Provide the source of a conditional expression tree.
+
+        Parameters
+        ----------
+        node : node
+            tree of a conditional expression
+        variables : dict
+            names of the variables bound to the items paths
+
+        Returns
+        -------
+        str
+            source of the expression
+        """
+        if isinstance(node, Literal):
+            return self._literal(node.value)
+        elif isinstance(node, Item):
+            return variables[node.path]
+        elif isinstance(node, Shared):
+            # the items are fetched by each rule, the subexpression is inlined
+            return self._condition(node.node, variables)
+        elif isinstance(node, Not):
+            return '(not {0})'.format(self._condition(node.operand,
+                                                      variables))
+        elif isinstance(node, (And, Or)):
+            return '({0} {1} {2})'.format(
+                self._condition(node.left, variables),
+                'and' if isinstance(node, And) else 'or',
+                self._condition(node.right, variables))
+        elif isinstance(node, Compare):
+            return '({0} {1} {2})'.format(
+                self._condition(node.left, variables),
+                node.op,
+                self._condition(node.right, variables))
+        elif isinstance(node, Contains):
+            elements = [self._condition(e, variables) for e in node.elements]
+            return '({0} {1} ({2}))'.format(
+                self._condition(node.item, variables),
+                'not in' if node.negate else 'in',
+                ', '.join(elements))
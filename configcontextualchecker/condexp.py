@@ -0,0 +1,753 @@
+"""This module provides the compiled conditional expressions.
+
+A conditional expression is compiled once into a tree of nodes, the tree can
+then be evaluated against any number of config objects without parsing the
+expression again.
+A tree is evaluated against the values of the items of a config object bound
+to their paths, the values are checked against the types the grammar of
+:class:`condexp_parser.Parser` expects at their position.
+"""
+
+import operator
+
+from .dict_path import Path
+from .condexp_parser import Parser, PlyParser
+from .exceptions import ParserSyntaxError
+
+
+class _Mismatch(Exception):
+    """Raised when an expression does not fit the grammar of the parser."""
+
+
+# types of the values that can be compared, checked for membership or used
+# as a truth value
+NUMBER_TYPES = (int, float)
+OPERAND_TYPES = (int, float, str)
+BOOL_TYPES = (bool,)
+
+
+class Literal(object):
+    """Literal value node."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def evaluate(self, values):
+        return self.value
+
+
+class Item(object):
+    """Config item node.
+
+    Parameters
+    ----------
+    path : :class:`Path`
+        path to the item in the config
+    types : tuple of type
+        types allowed for the item's value
+    """
+
+    __slots__ = ('path', 'types')
+
+    def __init__(self, path, types):
+        self.path = path
+        self.types = types
+
+    def evaluate(self, values):
+        value = values[self.path.string]
+        if type(value) not in self.types:
+            raise _Mismatch
+        return value
+
+
+class Not(object):
+    """Negation node."""
+
+    __slots__ = ('operand',)
+
+    def __init__(self, operand):
+        self.operand = operand
+
+    def evaluate(self, values):
+        return not self.operand.evaluate(values)
+
+
+class And(object):
+    """Conjunction node, the right operand is evaluated only if needed."""
+
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    def evaluate(self, values):
+        return self.left.evaluate(values) and self.right.evaluate(values)
+
+
+class Or(object):
+    """Disjunction node, the right operand is evaluated only if needed."""
+
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    def evaluate(self, values):
+        return self.left.evaluate(values) or self.right.evaluate(values)
+
+
+class Compare(object):
+    """Comparison node.
+
+    Parameters
+    ----------
+    op : str
+        comparison operator
+    left, right : node
+        operands
+    """
+
+    __slots__ = ('op', 'left', 'right', '_function', '_same_kind')
+
+    OPERATORS = {
+        '<': operator.lt,
+        '>': operator.gt,
+        '<=': operator.le,
+        '>=': operator.ge,
+        '==': operator.eq,
+        '!=': operator.ne,
+    }
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+        self._function = self.OPERATORS[op]
+        # only equality tests may compare strings, to one another
+        self._same_kind = op in ('==', '!=')
+
+    def evaluate(self, values):
+        left = self.left.evaluate(values)
+        right = self.right.evaluate(values)
+        if self._same_kind and (type(left) is str) is not (type(right) is str):
+            raise _Mismatch
+        return self._function(left, right)
+
+
+class Contains(object):
+    """Membership node.
+
+    Parameters
+    ----------
+    item : node
+        operand to look for
+    elements : list of node
+        container's elements
+    negate : bool
+        whether the membership is negated
+    """
+
+    __slots__ = ('item', 'elements', 'negate', '_values')
+
+    def __init__(self, item, elements, negate):
+        self.item = item
+        self.elements = elements
+        self.negate = negate
+        if all(isinstance(e, Literal) for e in elements):
+            self._values = tuple(e.value for e in elements)
+        else:
+            self._values = None
+
+    def evaluate(self, values):
+        value = self.item.evaluate(values)
+        elements = self._values
+        if elements is None:
+            elements = [e.evaluate(values) for e in self.elements]
+        return (value in elements) is not self.negate
+
+
+class Shared(object):
+    """Node of a subexpression shared by several expressions.
+
+    Its value is stored in the values of the items it is evaluated against,
+    so that it is evaluated once for all the expressions.
+
+    Parameters
+    ----------
+    node : node
+        shared subexpression
+
+    Attributes
+    ----------
+    node : node
+        shared subexpression
+    paths : tuple of :class:`Path`
+        paths of the items the subexpression refers to
+    """
+
+    __slots__ = ('node', 'paths')
+
+    def __init__(self, node):
+        self.node = node
+        self.paths = tuple(set(item.path for item in iter_items(node)))
+
+    def evaluate(self, values):
+        try:
+            return values[self]
+        except KeyError:
+            value = values[self] = self.node.evaluate(values)
+            return value
+
+
+def iter_items(node):
+    """Iterate over the items of a tree.
+
+    Parameters
+    ----------
+    node : node
+        tree of a conditional expression
+
+    Yields
+    ------
+    :class:`Item`
+        items of the tree
+    """
+    if isinstance(node, Item):
+        yield node
+    elif isinstance(node, Shared):
+        for item in iter_items(node.node):
+            yield item
+    elif isinstance(node, Not):
+        for item in iter_items(node.operand):
+            yield item
+    elif isinstance(node, (And, Or, Compare)):
+        for child in (node.left, node.right):
+            for item in iter_items(child):
+                yield item
+    elif isinstance(node, Contains):
+        for child in [node.item] + node.elements:
+            for item in iter_items(child):
+                yield item
+
+
+def iter_shared(node, seen=None):
+    """Iterate over the shared subexpressions of a tree.
+
+    Parameters
+    ----------
+    node : node
+        tree of a conditional expression
+    seen : set, optional
+        shared subexpressions not to iterate over, with the ones within
+        them, the iterated ones are added
+
+    Yields
+    ------
+    :class:`Shared`
+        shared subexpressions, the outer ones first
+    """
+    if seen is None:
+        seen = set()
+    nodes = [node]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, Shared):
+            if node in seen:
+                continue
+            seen.add(node)
+            yield node
+            nodes += [node.node]
+        elif not isinstance(node, (Item, Literal)):
+            nodes += reversed(_children(node))
+
+
+def _children(node):
+    """Provide the children of a node."""
+    if isinstance(node, Not):
+        return [node.operand]
+    elif isinstance(node, (And, Or, Compare)):
+        return [node.left, node.right]
+    elif isinstance(node, Contains):
+        return [node.item] + node.elements
+    return []
+
+
+def _describe(node, numbers, nodes):
+    """Number a node, the nodes of identical subexpressions get the same
+    number.
+
+    Parameters
+    ----------
+    node : node
+        node
+    numbers : dict
+        numbers bound to the descriptions of the nodes numbered so far, a
+        node is described by its type, its attributes and the numbers of its
+        children
+    nodes : list of tuple
+        first node numbered and the numbers of its children, for each
+        number
+
+    Returns
+    -------
+    int
+        number of the node
+    """
+    type_ = type(node)
+    if type_ is Shared:
+        return _describe(node.node, numbers, nodes)
+    elif type_ is Literal:
+        head, children = (Literal, type(node.value), node.value), ()
+    elif type_ is Item:
+        head, children = (Item, node.path.string, node.types), ()
+    elif type_ is Not:
+        head = Not,
+        children = _describe(node.operand, numbers, nodes),
+    elif type_ is Compare:
+        head = Compare, node.op
+        children = (_describe(node.left, numbers, nodes),
+                    _describe(node.right, numbers, nodes))
+    elif type_ is Contains:
+        head = Contains, node.negate
+        children = (_describe(node.item, numbers, nodes),) + \
+            tuple(_describe(element, numbers, nodes)
+                  for element in node.elements)
+    else:
+        head = type_,
+        children = (_describe(node.left, numbers, nodes),
+                    _describe(node.right, numbers, nodes))
+
+    description = head + children
+    number = numbers.get(description)
+    if number is None:
+        number = numbers[description] = len(nodes)
+        nodes += [(node, children)]
+    return number
+
+
+def share(trees):
+    """Share the identical subexpressions of trees.
+
+    The identical subexpressions are replaced by a single node, the ones
+    that appear several times and are not items or literals are wrapped in a
+    :class:`Shared` node, so that they are evaluated once against the same
+    values.
+
+    Parameters
+    ----------
+    trees : list of node
+        trees of conditional expressions, they may have shared
+        subexpressions already, their nodes are reused
+
+    Returns
+    -------
+    list of node
+        the trees with shared subexpressions
+    """
+    numbers = dict()
+    nodes = list()
+    roots = [_describe(tree, numbers, nodes) for tree in trees]
+
+    # appearances of the subexpressions, the ones within a subexpression
+    # that appears again are not counted again
+    counts = [0] * len(nodes)
+    for number in roots:
+        counts[number] += 1
+    for _, children in nodes:
+        for number in children:
+            counts[number] += 1
+
+    # the node replacing the subexpressions of each number
+    replacements = list()
+    for (node, _), count in zip(nodes, counts):
+        if count > 1 and type(node) not in (Item, Literal):
+            node = Shared(node)
+        replacements += [node]
+
+    # link the first nodes to the replacements of their children
+    for node, children in nodes:
+        type_ = type(node)
+        if type_ is Not:
+            node.operand = replacements[children[0]]
+        elif type_ is Contains:
+            node.item = replacements[children[0]]
+            node.elements = [replacements[number] for number in children[1:]]
+        elif type_ not in (Item, Literal):
+            node.left = replacements[children[0]]
+            node.right = replacements[children[1]]
+
+    return [replacements[root] for root in roots]
+
+
+def switch_case(node):
+    """Decompose a test of an item for equality to literals.
+
+    Parameters
+    ----------
+    node : node
+        tree of a conditional expression
+
+    Returns
+    -------
+    tuple or None
+        path of the item and the literal values that make the expression
+        true, None if the tree is not an equality to a literal or a
+        membership in literals
+    """
+    if isinstance(node, Compare) and node.op == '==':
+        for item, other in ((node.left, node.right),
+                            (node.right, node.left)):
+            if isinstance(item, Item) and isinstance(other, Literal):
+                return item.path, (other.value,)
+    elif isinstance(node, Contains) and not node.negate and \
+            isinstance(node.item, Item) and node._values is not None:
+        return node.item.path, node._values
+    return None
+
+
+def grammar_tests(trees):
+    """Gather the tests that the items values fit the grammar of the parser.
+
+    The values of the items shall fit the grammar wherever the items are in
+    the trees, whether or not they are evaluated, for the results to be the
+    ones of the parser.
+
+    Parameters
+    ----------
+    trees : list of node
+        trees of conditional expressions
+
+    Returns
+    -------
+    items : dict
+        types allowed for the values bound to the items paths
+    pairs : list of tuple
+        paths of the items tested for equality to one another, their values
+        shall be both strings or both numbers
+    fits : bool
+        whether the literals tested for equality to one another are of the
+        same kind
+    """
+    items = dict()
+    pairs = list()
+    fits = True
+    nodes = list(trees)
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, Item):
+            _narrow(items, node.path, node.types)
+        elif isinstance(node, Shared):
+            nodes += [node.node]
+        elif not isinstance(node, Literal):
+            nodes += _children(node)
+
+        if isinstance(node, Compare) and node.op in ('==', '!='):
+            operands = (node.left, node.right)
+            if all(isinstance(o, Item) for o in operands):
+                pairs += [(node.left.path, node.right.path)]
+            elif all(isinstance(o, Literal) for o in operands):
+                fits = fits and (type(node.left.value) is str) is \
+                    (type(node.right.value) is str)
+            else:
+                # an item tested for equality to a literal must be of the
+                # same kind
+                for item, other in (operands, operands[::-1]):
+                    if isinstance(item, Item) and isinstance(other, Literal):
+                        if type(other.value) is str:
+                            _narrow(items, item.path, (str,))
+                        else:
+                            _narrow(items, item.path, NUMBER_TYPES)
+    return items, pairs, fits
+
+
+def _narrow(items, path, types):
+    """Narrow the types allowed for the value bound to an item path."""
+    previous = items.get(path, types)
+    items[path] = tuple(t for t in previous if t in types)
+
+
+def _restrict(node, types):
+    """Restrict the types of the value of an operand node.
+
+    Parameters
+    ----------
+    node : Literal or Item
+        operand node
+    types : tuple of type
+        allowed types
+
+    Raises
+    ------
+    _Mismatch
+        if the node is a literal of another type
+    """
+    if isinstance(node, Item):
+        node.types = types
+    elif type(node.value) not in types:
+        raise _Mismatch
+
+
+def _binop(op, left, right):
+    """Create the node of a binary operator.
+
+    Parameters
+    ----------
+    op : str
+        operator
+    left, right : node
+        operands
+
+    Returns
+    -------
+    node
+        node of the operator
+    """
+    if op == 'or':
+        return Or(left, right)
+    elif op == 'and':
+        return And(left, right)
+    else:
+        types = OPERAND_TYPES if op in ('==', '!=') else NUMBER_TYPES
+        _restrict(left, types)
+        _restrict(right, types)
+        return Compare(op, left, right)
+
+
+class Compiler(Parser):
+    """This class provides a conditional expression compiler.
+
+    It shares the tokens and precedence rules of :class:`Parser` but its
+    parsing rules build a tree of nodes instead of evaluating the expression.
+    The items are kept as nodes whose values are looked up at evaluation.
+    """
+
+    # the items are operands of any comparison, or truth values
+    _OPERANDS = ('INTEGER', 'FLOAT', 'STRING', 'ITEM')
+    COMPARISONS = dict.fromkeys(_OPERANDS, dict.fromkeys(
+        ('LT', 'GT', 'LE', 'GE', 'EQ', 'NE'), _OPERANDS))
+    ELEMENTS = _OPERANDS
+    BOOLS = ('BOOL', 'ITEM')
+
+    @staticmethod
+    def lex_ITEM(t):
+        t.value = t.value.strip('{}')
+        return t
+
+    # Values of the parsing rules
+
+    @staticmethod
+    def _binop(op, left, right):
+        return _binop(op, left, right)
+
+    @staticmethod
+    def _negate(operand):
+        return Not(operand)
+
+    @staticmethod
+    def _contains(item, elements, negate):
+        return Contains(item, elements, negate)
+
+    @staticmethod
+    def _operand(token):
+        if token.type == 'ITEM':
+            return Item(Path(token.value), OPERAND_TYPES)
+        return Literal(token.value)
+
+    @staticmethod
+    def _bool(token):
+        if token.type == 'ITEM':
+            return Item(Path(token.value), BOOL_TYPES)
+        return Literal(token.value)
+
+
+class PlyCompiler(PlyParser):
+    """This class provides the PLY conditional expression compiler.
+
+    It is the reference of :class:`Compiler`.
+    """
+
+    TABLES = 'configcontextualchecker.tables.condexp_compiler'
+
+    start = 'bool'
+
+    @staticmethod
+    def t_ITEM(t):
+        r'{.+?}'
+        t.value = t.value.strip('{}')
+        return t
+
+    # Parsing rules
+
+    @staticmethod
+    def p_not(p):
+        'bool : NOT bool'
+        p[0] = Not(p[2])
+
+    @staticmethod
+    def p_binop(p):
+        """
+        bool : operand LT operand
+             | operand GT operand
+             | operand LE operand
+             | operand GE operand
+             | operand EQ operand
+             | operand NE operand
+             | bool OR bool
+             | bool AND bool
+        """
+        p[0] = _binop(p[2], p[1], p[3])
+
+    @staticmethod
+    def p_paren(p):
+        """
+        bool : LPAREN bool RPAREN
+        container : LPAREN list RPAREN
+        """
+        p[0] = p[2]
+
+    @staticmethod
+    def p_self(p):
+        """
+        listitem : operand
+                 | list
+        """
+        p[0] = p[1]
+
+    @staticmethod
+    def p_literal(p):
+        """
+        bool : BOOL
+        operand : INTEGER
+                | FLOAT
+                | STRING
+        """
+        p[0] = Literal(p[1])
+
+    @staticmethod
+    def p_bool_item(p):
+        'bool : ITEM'
+        p[0] = Item(Path(p[1]), BOOL_TYPES)
+
+    @staticmethod
+    def p_operand_item(p):
+        'operand : ITEM'
+        p[0] = Item(Path(p[1]), OPERAND_TYPES)
+
+    @staticmethod
+    def p_list(p):
+        """
+        list : listitem COMMA operand
+        """
+        if isinstance(p[1], list):
+            p[0] = p[1] + [p[3]]
+        else:
+            p[0] = [p[1], p[3]]
+
+    @staticmethod
+    def p_membership(p):
+        """
+        bool : operand IN container
+        """
+        p[0] = Contains(p[1], p[3], False)
+
+    @staticmethod
+    def p_membership_not(p):
+        """
+        bool : operand NOT IN container
+        """
+        p[0] = Contains(p[1], p[4], True)
+
+
+class CondExp(object):
+    """Compiled conditional expression.
+
+    The evaluation of ``and`` and ``or`` is short-circuited, the values of
+    all the items are checked beforehand so that an operand that is not
+    evaluated raises the errors of :class:`Parser` as well.
+    An expression holds no state of its evaluation, it can be evaluated by
+    several threads at once.
+    When the items values do not fit the grammar, or when the expression
+    cannot be compiled, the expression is handed over to :class:`Parser` so
+    that the errors are the ones of the parser.
+
+    Parameters
+    ----------
+    string : str
+        conditional expression
+
+    Attributes
+    ----------
+    string : str
+        conditional expression
+    tree : node or None
+        compiled expression, None if the expression cannot be compiled
+    paths : list of :class:`Path`
+        paths of the items the compiled expression refers to
+    """
+
+    def __init__(self, string):
+        self.string = string
+        try:
+            self.tree = Compiler.for_thread().parse(string)
+        except (ParserSyntaxError, _Mismatch):
+            self.tree = None
+            self.paths = list()
+        else:
+            self.paths = list()
+            for item in iter_items(self.tree):
+                if item.path not in self.paths:
+                    self.paths += [item.path]
+            items, pairs, fits = grammar_tests([self.tree])
+            if not fits:
+                # the parser raises whatever the values
+                self.tree = None
+                self.paths = list()
+            self._items = tuple((path.string, types)
+                                for path, types in items.items())
+            self._pairs = tuple((left.string, right.string)
+                                for left, right in pairs)
+
+    def evaluate(self, config, values=None):
+        """Evaluate the expression.
+
+        Parameters
+        ----------
+        config : dict
+            config that contains the items
+        values : dict, optional
+            values of the items of the config bound to the strings of their
+            paths, looked up in the config by default
+
+        Returns
+        -------
+        bool
+            truth value of the expression
+        """
+        if self.tree is not None:
+            if values is None:
+                values = dict((path.string, path.get(config))
+                              for path in self.paths)
+            if self._fit(values):
+                try:
+                    return self.tree.evaluate(values)
+                except _Mismatch:
+                    pass
+
+        parser = Parser.for_thread()
+        parser.config = config
+        return parser.parse(self.string)
+
+    def _fit(self, values):
+        """Test that the values of the items fit the grammar."""
+        for string, types in self._items:
+            if type(values[string]) not in types:
+                return False
+        for left, right in self._pairs:
+            if (type(values[left]) is str) is not \
+                    (type(values[right]) is str):
+                return False
+        return True
@@ -1,18 +1,224 @@
 """This module provides a parser for conditional expressions."""
 
 from .dict_path import get_from_path
+from .descent import DescentParserBase, END
 from .parser_base import ParserBase
 
 
-class Parser(ParserBase):
+class Parser(DescentParserBase):
     """This class provides a conditional expression parser.
 
+    It is a hand-written parser of the grammar of :class:`PlyParser`, with the
+    same precedence rules and syntax errors.
+
     Parameters
     ----------
     config : dict
         a config object.
     """
 
+    TOKENS = DescentParserBase.TOKENS[:2] + (
+        ('STRING', r'\"(?:[^\\"]|\\.)*\"'),
+        ('BOOL', r'True|False'),
+        ('ITEM', r'{.+?}'),
+        ('AND', r'and'),
+        ('NOT', r'not'),
+        ('EQ', r'=='),
+        ('GE', r'>='),
+        ('IN', r'in'),
+        ('LE', r'<='),
+        ('LPAREN', r'\('),
+        ('NE', r'!='),
+        ('OR', r'or'),
+        ('RPAREN', r'\)'),
+    ) + DescentParserBase.TOKENS[2:] + (
+        ('GT', r'>'),
+        ('LT', r'<'),
+    )
+
+    # types of the tokens of the config items values
+    ITEM_TYPES = {
+        int: 'INTEGER',
+        float: 'FLOAT',
+        str: 'STRING',
+        bool: 'BOOL',
+    }
+
+    # types of the tokens of the operands of a comparison bound to the types
+    # of the comparison operators, bound to the types of the right operands
+    _NUMBERS = ('INTEGER', 'FLOAT')
+    _ORDERINGS = dict.fromkeys(('LT', 'GT', 'LE', 'GE', 'EQ', 'NE'), _NUMBERS)
+    COMPARISONS = {
+        'INTEGER': _ORDERINGS,
+        'FLOAT': _ORDERINGS,
+        'STRING': {'EQ': ('STRING',), 'NE': ('STRING',)},
+    }
+
+    # types of the tokens of the elements of a container
+    ELEMENTS = ('INTEGER', 'FLOAT', 'STRING')
+
+    # types of the tokens of the truth values
+    BOOLS = ('BOOL',)
+
+    # types of the tokens that may follow a truth value
+    FOLLOWS = ('AND', 'OR', 'RPAREN', END)
+
+    BINARY_OPERATORS = {
+        'or': lambda a, b: a or b,
+        'and': lambda a, b: a and b,
+        '<': lambda a, b: a < b,
+        '>': lambda a, b: a > b,
+        '<=': lambda a, b: a <= b,
+        '>=': lambda a, b: a >= b,
+        '!=': lambda a, b: a != b,
+        '==': lambda a, b: a == b,
+    }
+
+    def __init__(self):
+        super(Parser, self).__init__()
+        self.config = dict()
+
+    @staticmethod
+    def lex_STRING(t):
+        t.value = t.value.strip('"')
+        return t
+
+    @staticmethod
+    def lex_BOOL(t):
+        t.value = t.value == 'True'
+        return t
+
+    def lex_ITEM(self, t):
+        key_path = t.value.strip('{}')
+        value = get_from_path(self.config, key_path)
+        if value is None:
+            print('key path "{}" does not exist'.format(key_path))
+            t.lexer.skip(1)
+            return
+        t.value = value
+        t.type = self.ITEM_TYPES[type(t.value)]
+        return t
+
+    # Parsing rules, from the lowest precedence to the highest
+
+    def _parse(self):
+        """bool : bool OR bool"""
+        value = self._and()
+        while self._type == 'OR':
+            op = self._next().value
+            value = self._binop(op, value, self._and())
+        return value
+
+    def _and(self):
+        """bool : bool AND bool"""
+        value = self._not()
+        while self._type == 'AND':
+            op = self._next().value
+            value = self._binop(op, value, self._not())
+        return value
+
+    def _not(self):
+        """bool : NOT bool"""
+        if self._type == 'NOT':
+            self._next()
+            return self._negate(self._not())
+        return self._primary()
+
+    def _primary(self):
+        """
+        bool : LPAREN bool RPAREN
+             | operand comparison operand
+             | operand IN container
+             | operand NOT IN container
+             | BOOL
+        """
+        type_ = self._type
+        if type_ == 'LPAREN':
+            self._next()
+            value = self._parse()
+            self._expect(('RPAREN',))
+            return value
+
+        comparisons = self.COMPARISONS.get(type_)
+        if comparisons is not None:
+            token = self._next()
+            type_ = self._type
+            if type_ in comparisons:
+                left = self._operand(token)
+                op = self._next().value
+                right = self._operand(self._expect(comparisons[type_]))
+                # the comparison is only reduced on a valid next token, as
+                # the PLY parser does, before the operands are checked
+                if self._type not in self.FOLLOWS:
+                    self._error()
+                return self._binop(op, left, right)
+            if type_ == 'IN':
+                item = self._operand(token)
+                self._next()
+                return self._contains(item, self._container(), False)
+            if type_ == 'NOT':
+                item = self._operand(token)
+                self._next()
+                self._expect(('IN',))
+                return self._contains(item, self._container(), True)
+            if token.type not in self.BOOLS:
+                self._error()
+            return self._bool(token)
+
+        return self._bool(self._expect(self.BOOLS))
+
+    def _container(self):
+        """
+        container : LPAREN list RPAREN
+        list : listitem COMMA operand
+        listitem : operand
+                 | list
+        """
+        self._expect(('LPAREN',))
+        elements = [self._operand(self._expect(self.ELEMENTS))]
+        self._expect(('COMMA',))
+        elements += [self._operand(self._expect(self.ELEMENTS))]
+        while self._type == 'COMMA':
+            self._next()
+            elements += [self._operand(self._expect(self.ELEMENTS))]
+        self._expect(('RPAREN',))
+        return elements
+
+    # Values of the parsing rules
+
+    def _binop(self, op, left, right):
+        return self.BINARY_OPERATORS[op](left, right)
+
+    @staticmethod
+    def _negate(operand):
+        return not operand
+
+    @staticmethod
+    def _contains(item, elements, negate):
+        return (item in elements) is not negate
+
+    @staticmethod
+    def _operand(token):
+        return token.value
+
+    @staticmethod
+    def _bool(token):
+        return token.value
+
+
+class PlyParser(ParserBase):
+    """This class provides the PLY conditional expression parser.
+
+    It is the reference of :class:`Parser`.
+
+    Parameters
+    ----------
+    config : dict
+        a config object.
+    """
+
+    TABLES = 'configcontextualchecker.tables.condexp_parser'
+
     tokens = ParserBase.tokens + (
         'BOOL',
         'ITEM',
@@ -46,7 +252,7 @@ class Parser(ParserBase):
     t_IN = r'in'
 
     def __init__(self):
-        super(Parser, self).__init__()
+        super(PlyParser, self).__init__()
         self.config = dict()
 
     @staticmethod
@@ -63,12 +269,6 @@ class Parser(ParserBase):
 
     def t_ITEM(self, t):
         r'{.+?}'
-        type_token = {
-            int: 'INTEGER',
-            float: 'FLOAT',
-            str: 'STRING',
-            bool: 'BOOL',
-        }
         key_path = t.value.strip('{}')
         value = get_from_path(self.config, key_path)
         if value is None:
@@ -76,7 +276,7 @@ class Parser(ParserBase):
             t.lexer.skip(1)
             return
         t.value = value
-        t.type = type_token[type(t.value)]
+        t.type = Parser.ITEM_TYPES[type(t.value)]
         return t
 
     # Parsing rules
@@ -89,16 +289,7 @@ class Parser(ParserBase):
         ('right', 'NOT'),
     )
 
-    BINARY_OPERATORS = {
-        'or': lambda a, b: a or b,
-        'and': lambda a, b: a and b,
-        '<': lambda a, b: a < b,
-        '>': lambda a, b: a > b,
-        '<=': lambda a, b: a <= b,
-        '>=': lambda a, b: a >= b,
-        '!=': lambda a, b: a != b,
-        '==': lambda a, b: a == b,
-    }
+    BINARY_OPERATORS = Parser.BINARY_OPERATORS
 
     @staticmethod
     def p_not(p):
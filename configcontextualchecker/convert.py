@@ -0,0 +1,225 @@
+"""This module provides the conversion of string representations of values.
+
+The values of a config file are usually strings, they are converted to the
+type expected by a rule with a parser dedicated to that type.
+Supported types are type, int, float, str and bool, the types are represented
+by their names and the booleans by True and False.
+The checked values can be cached by a :class:`ConversionCache`.
+"""
+
+import threading
+from collections import OrderedDict
+
+# values represented by names
+TYPE_NAMES = {'int': int, 'float': float, 'str': str}
+BOOL_NAMES = {'True': True, 'False': False}
+
+
+def type_string(string):
+    """Determine the type of a string representation.
+
+    Parameters
+    ----------
+    string : str
+        a string representation of a variable
+
+    Returns
+    -------
+    type
+        the type of the variable, the type of the object itself if it is not
+        a string
+    """
+    if not isinstance(string, str):
+        return type(string)
+
+    if string.strip() in TYPE_NAMES:
+        return type
+
+    if string in BOOL_NAMES:
+        return bool
+
+    try:
+        int(string)
+        return int
+    except ValueError:
+        pass
+
+    try:
+        float(string)
+        return float
+    except ValueError:
+        pass
+
+    return str
+
+
+def _parse_type(string):
+    try:
+        return TYPE_NAMES[string.strip()]
+    except KeyError:
+        raise ValueError(string)
+
+
+def _parse_bool(string):
+    try:
+        return BOOL_NAMES[string]
+    except KeyError:
+        raise ValueError(string)
+
+
+def _parse_float(string):
+    value = float(string)
+    # the representation of an int is not the one of a float, a float
+    # representation made only of digits is an int one
+    if string.strip().lstrip('+-').replace('_', '').isdigit():
+        raise ValueError(string)
+    return value
+
+
+# parsers of the string representations bound to their types, a parser
+# raises ValueError if a string does not represent its type
+PARSERS = {
+    type: _parse_type,
+    bool: _parse_bool,
+    int: int,
+    float: _parse_float,
+    str: str,
+}
+
+
+def convert(value, type_):
+    """Convert a string representation of a value to its type.
+
+    Parameters
+    ----------
+    value : str
+        string representation of the value
+    type_ : type
+        expected type of the value
+
+    Returns
+    -------
+    type_
+        the represented value
+
+    Raises
+    ------
+    TypeError
+        if the value is not a string representation of an instance of type_
+    """
+    parser = PARSERS.get(type_)
+    if parser is not None and isinstance(value, str):
+        try:
+            return parser(value)
+        except ValueError:
+            pass
+
+    msg = 'bad item type: expected {0}, found {1}'.format(type_,
+                                                          type_string(value))
+    raise TypeError(msg)
+
+
+def allowed_key(allowed):
+    """Provide a hashable equivalent of the allowed values of a rule.
+
+    Parameters
+    ----------
+    allowed : list or Range or None
+        allowed values
+
+    Returns
+    -------
+    tuple or Range or None
+        the values as a tuple for a list, a range as is
+    """
+    if isinstance(allowed, list):
+        return tuple(allowed)
+    return allowed
+
+
+class ConversionCache(object):
+    """Least recently used cache of checked values.
+
+    The values checked against the rules are cached by their string
+    representations, the types and the allowed values of the rules.
+    A cache can be shared by several checkers and threads, the values are
+    looked up without locking so the counters may miss a few lookups made at
+    once by several threads.
+    When pickled, only its size is kept.
+
+    Parameters
+    ----------
+    maxsize : int or None, optional
+        maximum number of cached values, the least recently used ones are
+        evicted first, None for no limit
+
+    Attributes
+    ----------
+    maxsize : int or None
+        maximum number of cached values
+    hits : int
+        number of values found in the cache
+    misses : int
+        number of values not found in the cache
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key, function, *args):
+        """Get a cached value, compute and cache it when it is missing.
+
+        Parameters
+        ----------
+        key : hashable object
+            key of the value
+        function : callable
+            computes the value from the other arguments, what it raises is
+            not cached
+
+        Returns
+        -------
+        any object
+            the value
+        """
+        try:
+            value = self._values[key]
+        except KeyError:
+            pass
+        else:
+            try:
+                self._values.move_to_end(key)
+            except KeyError:
+                # evicted by another thread meanwhile
+                pass
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = function(*args)
+
+        with self._lock:
+            self._values[key] = value
+            if self.maxsize is not None and len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove the cached values and reset the counters."""
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getstate__(self):
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state['maxsize'])
@@ -0,0 +1,227 @@
+"""This module provides the base of the hand-written parsers.
+
+The hand-written parsers are recursive descent parsers of the grammars of the
+PLY parsers, they are used by default and the PLY parsers are kept as their
+reference. Their tokens are defined by the same regular expressions tried in
+the same order, and they are read on demand as PLY does, so a syntax error is
+raised on the same token, with the same message.
+"""
+
+import re
+
+from .exceptions import ParserSyntaxError
+from .parser_base import PerThread
+
+
+# compiled regular expressions of the tokens and of the ignored characters
+# bound to the tokens and the ignored characters
+_REGEXES = dict()
+
+# type of the token that ends a string
+END = '$end'
+
+
+class Token(object):
+    """Token, with the attributes of a PLY token.
+
+    Attributes
+    ----------
+    type : str
+        type of the token
+    value : object
+        value of the token
+    lexpos : int
+        position of the token in the string
+    lexer : :class:`Lexer`
+        lexer that read the token
+    """
+
+    __slots__ = ('type', 'value', 'lexpos', 'lexer')
+
+    def __init__(self, type_, value, lexpos, lexer):
+        self.type = type_
+        self.value = value
+        self.lexpos = lexpos
+        self.lexer = lexer
+
+
+class Lexer(object):
+    """Lexer of a string, the tokens are read on demand.
+
+    Parameters
+    ----------
+    parser : :class:`DescentParserBase`
+        parser that defines the tokens
+    lexdata : str
+        string to be read
+
+    Attributes
+    ----------
+    lexdata : str
+        string to be read
+    lexpos : int
+        position of the next character to be read
+    """
+
+    __slots__ = ('lexdata', 'lexpos', '_regex', '_ignore', '_functions')
+
+    def __init__(self, parser, lexdata):
+        self.lexdata = lexdata
+        self.lexpos = 0
+        self._regex = parser._regex.match
+        self._ignore = parser._ignore.match
+        self._functions = parser._functions
+
+    def skip(self, count):
+        """Skip characters.
+
+        Parameters
+        ----------
+        count : int
+            number of characters to skip
+        """
+        self.lexpos += count
+
+    def token(self):
+        """Read the next token.
+
+        Returns
+        -------
+        :class:`Token` or None
+            next token, None at the end of the string
+        """
+        lexdata = self.lexdata
+        while True:
+            lexpos = self.lexpos = self._ignore(lexdata, self.lexpos).end()
+            if lexpos >= len(lexdata):
+                return None
+
+            match = self._regex(lexdata, lexpos)
+            if match is None:
+                print("Illegal character '%s'" % lexdata[lexpos])
+                self.lexpos += 1
+                continue
+
+            self.lexpos = match.end()
+            token = Token(match.lastgroup, match.group(), lexpos, self)
+            function = self._functions.get(token.type)
+            if function is not None:
+                token = function(token)
+                if token is None:
+                    # discarded
+                    continue
+            return token
+
+
+class DescentParserBase(PerThread):
+    """This class provides the base of a hand-written parser.
+
+    It defines the tokens of :class:`parser_base.ParserBase`, a derived class
+    defines its own :attr:`TOKENS` and the :meth:`_parse` method that parses
+    its grammar from its start symbol. The value of a token of type ``NAME``
+    is converted by the method ``lex_NAME`` when it is defined, a token is
+    discarded when this method returns None.
+
+    A parser holds the state of the parsing, so it shall not be used by
+    several threads at once, see :meth:`for_thread`.
+    """
+
+    # types and regular expressions of the tokens, a string is matched
+    # against them in this order
+    TOKENS = (
+        ('FLOAT', r'\d+\.\d*(?:[eE]\d+)?'),
+        ('INTEGER', r'[+-]?\d+'),
+        ('COMMA', r','),
+    )
+
+    # ignored characters
+    IGNORE = ' \t'
+
+    def __init__(self):
+        tokens = self.TOKENS
+        try:
+            self._regex, self._ignore = _REGEXES[tokens, self.IGNORE]
+        except KeyError:
+            self._regex = re.compile('|'.join(
+                '(?P<{0}>{1})'.format(*token) for token in tokens))
+            self._ignore = re.compile('[{0}]*'.format(re.escape(self.IGNORE)))
+            _REGEXES[tokens, self.IGNORE] = self._regex, self._ignore
+        self._functions = dict()
+        for type_, _ in tokens:
+            function = getattr(self, 'lex_' + type_, None)
+            if function is not None:
+                self._functions[type_] = function
+        self._lexer = None
+        self._token = None
+        self._type = END
+
+    def parse(self, string):
+        """Parse a string.
+
+        Parameters
+        ----------
+        string : str
+            string to be parsed
+
+        Returns
+        -------
+        parsed object (derived class dependent)
+        """
+        self._lexer = Lexer(self, string)
+        self._next()
+        result = self._parse()
+        if self._type is not END:
+            self._error()
+        return result
+
+    def _parse(self):
+        """Parse the tokens from the start symbol of the grammar."""
+        raise NotImplementedError
+
+    def _next(self):
+        """Read the next token.
+
+        Returns
+        -------
+        :class:`Token` or None
+            the current token, which is then replaced by the next one
+        """
+        token = self._token
+        self._token = self._lexer.token()
+        self._type = END if self._token is None else self._token.type
+        return token
+
+    def _expect(self, types):
+        """Read the current token if it has one of the expected types.
+
+        Parameters
+        ----------
+        types : container of str
+            expected types
+
+        Returns
+        -------
+        :class:`Token`
+            the current token
+
+        Raises
+        ------
+        ParserSyntaxError
+            if the current token has another type
+        """
+        if self._type not in types:
+            self._error()
+        return self._next()
+
+    def _error(self):
+        raise ParserSyntaxError(self._token)
+
+    @staticmethod
+    def lex_FLOAT(t):
+        t.value = float(t.value)
+        return t
+
+    @staticmethod
+    def lex_INTEGER(t):
+        t.value = int(t.value)
+        return t
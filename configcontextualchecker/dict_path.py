@@ -66,3 +66,214 @@ def set_from_path(dict_, path, value):
         d[path_items[-1]] = value
     else:
         dict_[path] = value
+
+
+class Path(object):
+    """Compiled path to a dictionary value.
+
+    The path is split once into its keys, getting and setting the value
+    behave like :func:`get_from_path` and :func:`set_from_path`.
+
+    Parameters
+    ----------
+    string : str
+        path to a key (included) or just a key
+
+    Attributes
+    ----------
+    string : str
+        path to a key (included) or just a key
+    keys : tuple of str
+        keys from the root dictionary to the value
+    nested : bool
+        whether the string is a path or just a key
+    """
+
+    __slots__ = ('string', 'keys', 'nested', '_sections', '_key')
+
+    def __init__(self, string):
+        self.string = string
+        self.nested = string.startswith(PATH_SEP)
+        if self.nested:
+            self.keys = tuple(string[1:].split(PATH_SEP))
+        else:
+            self.keys = (string,)
+        self._sections = self.keys[:-1]
+        self._key = self.keys[-1]
+
+    def __reduce__(self):
+        # the string is smaller than the split keys
+        return Path, (self.string,)
+
+    def get(self, dict_):
+        """Get the value.
+
+        Parameters
+        ----------
+        dict_ : dict
+            a dictionary
+
+        Returns
+        -------
+        int or float or str
+            value bound to the path, None if it does not exist
+        """
+        if not self.nested:
+            return dict_.get(self._key)
+        try:
+            for key in self.keys:
+                dict_ = dict_[key]
+        except (TypeError, KeyError):
+            # not a dict
+            return None
+        return dict_
+
+    def set(self, dict_, value):
+        """Set the value.
+
+        Missing sections are created recursively, even if an existing value
+        has to be overwritten.
+
+        Parameters
+        ----------
+        dict_ : dict
+            a dictionary
+        value : any object
+            value to be assigned
+
+        Returns
+        -------
+        int or None
+            index in :attr:`keys` of the first section created, None if no
+            section has been created
+        """
+        created = None
+        for index, key in enumerate(self._sections):
+            section = dict_.get(key)
+            if not isinstance(section, dict):
+                section = dict_[key] = dict()
+                if created is None:
+                    created = index
+            dict_ = section
+        dict_[self._key] = value
+        return created
+
+    def __eq__(self, other):
+        return isinstance(other, Path) and self.string == other.string
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.string)
+
+    def __repr__(self):
+        return 'Path({0!r})'.format(self.string)
+
+
+class _TrieNode(object):
+    """Node of a :class:`PathTrie`."""
+
+    __slots__ = ('strings', 'children', 'nested')
+
+    def __init__(self):
+        # strings of the paths ending at the node
+        self.strings = list()
+        self.children = dict()
+        # whether a path through the node is not just a key
+        self.nested = False
+
+
+class PathTrie(object):
+    """Trie of dictionary paths.
+
+    The values bound to all the paths of the trie are collected by walking a
+    dictionary once, the sections shared by several paths are looked up once.
+
+    Parameters
+    ----------
+    paths : iterable of :class:`Path`
+        paths of the trie
+    """
+
+    def __init__(self, paths):
+        self._root = _TrieNode()
+        for path in paths:
+            node = self._root
+            for key in path.keys:
+                node = node.children.setdefault(key, _TrieNode())
+                node.nested = node.nested or path.nested
+            if path.string not in node.strings:
+                node.strings += [path.string]
+
+    def snapshot(self, dict_):
+        """Collect the values bound to the paths of the trie.
+
+        Parameters
+        ----------
+        dict_ : dict
+            a dictionary
+
+        Returns
+        -------
+        dict
+            values bound to the strings of the paths, like :meth:`Path.get`
+        """
+        values = dict()
+        for key, child in self._root.children.items():
+            if child.nested:
+                try:
+                    value = dict_[key]
+                except (TypeError, KeyError):
+                    value = None
+            else:
+                value = dict_.get(key)
+            self._collect(child, value, values)
+        return values
+
+    def refresh(self, values, dict_, path, created):
+        """Refresh the values changed by setting the value of a path.
+
+        Parameters
+        ----------
+        values : dict
+            values bound to the strings of the paths, as returned by
+            :meth:`snapshot`
+        dict_ : dict
+            the dictionary
+        path : :class:`Path`
+            path of the trie whose value has been set with :meth:`Path.set`
+        created : int or None
+            index of the first section created by :meth:`Path.set`
+        """
+        # the values below the first created section or the value are the
+        # only ones that have changed
+        depth = len(path.keys) if created is None else created + 1
+        node = self._root
+        for key in path.keys[:depth]:
+            node = node.children[key]
+            dict_ = dict_[key]
+        self._collect(node, dict_, values)
+
+    @classmethod
+    def _collect(cls, node, value, values):
+        """Collect the values bound to the paths of a sub-trie.
+
+        Parameters
+        ----------
+        node : _TrieNode
+            root of the sub-trie
+        value : any object
+            value bound to the root
+        values : dict
+            values bound to the strings of the paths
+        """
+        for string in node.strings:
+            values[string] = value
+        for key, child in node.children.items():
+            try:
+                child_value = value[key]
+            except (TypeError, KeyError):
+                # not a dict
+                child_value = None
+            cls._collect(child, child_value, values)
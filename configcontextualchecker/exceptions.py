@@ -23,16 +23,32 @@ class ParserSyntaxError(SyntaxError):
             parser that raised the error
         """
         self.parser = parser
+        # the parser is reused so the message is built while it is up to date
+        self.msg = self._format(parser)
 
-    def __str__(self):
-        if self.parser is None:
-            return self.MSG_EOS
+    @classmethod
+    def _format(cls, parser):
+        if parser is None:
+            return cls.MSG_EOS
         else:
-            position = self.parser.lexpos
-            lexdata = self.parser.lexer.lexdata
+            position = parser.lexpos
+            lexdata = parser.lexer.lexdata
             pointer = '-' * position + '^' + \
                       '-' * (len(lexdata) - position - 1)
-            return self.MSG_PATTERN.format(self.parser.value, lexdata, pointer)
+            return cls.MSG_PATTERN.format(parser.value, lexdata, pointer)
+
+    def __str__(self):
+        return self.msg
+
+    def __reduce__(self):
+        # the parser cannot be pickled, only the message is kept
+        return _unpickle_parser_syntax_error, (self.msg,)
+
+
+def _unpickle_parser_syntax_error(msg):
+    error = ParserSyntaxError(None)
+    error.msg = msg
+    return error
 
 
 # class DependencyError(Exception):
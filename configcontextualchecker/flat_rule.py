@@ -1,9 +1,11 @@
 """This module provides the flat rule class.
 """
 
+from .allowed import AllowedValues
+from .convert import allowed_key, convert, type_string
 from .range import RangeParser, Range
+from .vectorized import check_values
 from .exceptions import RuleError, ItemError, ParserSyntaxError
-from .dict_path import get_from_path
 
 
 class FlatRule(object):
@@ -24,6 +26,8 @@ class FlatRule(object):
         rule definition
     other : Rule, optional
         other rule to copy undefined criteria from
+    cache : :class:`ConversionCache`, optional
+        cache of the checked string values
 
     Attributes
     ----------
@@ -31,10 +35,12 @@ class FlatRule(object):
         type of the item's value
     exists : bool
         existence of the item
-    allowed : list, Range, None
+    allowed : AllowedValues, Range, None
         allowed values
     default : int, float, str, None
         default value of the item
+    cache : :class:`ConversionCache` or None
+        cache of the checked string values
     """
 
     # rules for checking a rule definition
@@ -60,10 +66,9 @@ class FlatRule(object):
         },
     }
 
-    # value range parser
-    RANGE_PARSER = RangeParser()
+    def __init__(self, rule_def, other=None, cache=None):
+        self.cache = cache
 
-    def __init__(self, rule_def, other=None):
         # copy the rule definition as it may be modified
         rule_def_ = dict(rule_def)
 
@@ -81,12 +86,16 @@ class FlatRule(object):
 
         self._parse(rule_def_)
 
+        # key of the rule in the cache, a forbidden item shall not get the
+        # value converted for a rule where it exists
+        self._cache_key = (self.exists, self.type, allowed_key(self.allowed))
+
     def apply(self, item_path, config):
         """Check a config's item against a rule.
 
         Parameters
         ----------
-        item_path : str
+        item_path : :class:`Path`
             path pointing to a config's item
         rule : dict
             rule that must be satisfied by the item
@@ -99,13 +108,57 @@ class FlatRule(object):
             item's value eventually converted to satisfy the rule's type
             or None if the item does not exist
         """
-        current_value = get_from_path(config, item_path)
-        return self._check_value(current_value,
+        return self.check(item_path.get(config))
+
+    def check(self, value):
+        """Check a value against a rule.
+
+        Parameters
+        ----------
+        value : str representation or instance of type
+            the value to be checked
+
+        Returns
+        -------
+        int or float or str or None
+            value eventually converted to satisfy the rule's type
+            or None if the value does not exist
+        """
+        # a string needs no conversion to a string
+        if self.cache is not None and type(value) is str and \
+                self.type is not str:
+            return self.cache.lookup((value,) + self._cache_key,
+                                     self._check_value,
+                                     value,
+                                     self.exists,
+                                     self.type,
+                                     self.allowed,
+                                     self.default)
+        return self._check_value(value,
                                  self.exists,
                                  self.type,
                                  self.allowed,
                                  self.default)
 
+    def check_values(self, values):
+        """Check each value of a sequence against the type and the allowed
+        values of a rule.
+
+        Parameters
+        ----------
+        values : sequence or :class:`numpy.ndarray`
+            values or their string representations, like the ones of a
+            list-valued item
+
+        Returns
+        -------
+        checked : list or :class:`numpy.ndarray`
+            values converted to the rule's type
+        offending : list of int or :class:`numpy.ndarray`
+            indices of the values that do not satisfy the rule
+        """
+        return check_values(values, self.type, self.allowed)
+
     def _parse(self, rule_def):
         # check possible items
         for key, value in rule_def.items():
@@ -149,14 +202,14 @@ class FlatRule(object):
 
         Returns
         -------
-        list of int or list of float or list of str or Range
+        AllowedValues or Range
             parsed allowed settings
         """
         if isinstance(allowed, str):
             # deal first with range representation so range type checking is
             # done once
             try:
-                allowed = cls.RANGE_PARSER.parse(allowed)
+                allowed = RangeParser.for_thread().parse(allowed)
             except ParserSyntaxError:
                 pass
 
@@ -176,7 +229,8 @@ class FlatRule(object):
             allowed = [allowed]
 
         # check each value and return
-        return [cls._check_value(value, True, type_) for value in allowed]
+        return AllowedValues(cls._check_value(value, True, type_)
+                             for value in allowed)
 
     @classmethod
     def _check_value(cls, value, exists, type_, allowed=None, default=None):
@@ -213,19 +267,9 @@ class FlatRule(object):
                 else:
                     return default
 
-            # check type
-            if type(value) != type_ and cls._type_string(value) != type_:
-                msg = 'bad item type: expected {0}, found {1}'.format(
-                    type_, cls._type_string(value))
-                raise TypeError(msg)
-
-            if isinstance(value, str):
-                # convert the value to its represented type
-                if type_ in (type, bool):
-                    # those types cannot be casted from a string so evaluate it
-                    value = eval(value)
-                else:
-                    value = type_(value)
+            # check type and convert the value from its representation
+            if type(value) is not type_:
+                value = convert(value, type_)
 
             # check allowed value
             if allowed is not None and value not in allowed:
@@ -253,25 +297,4 @@ class FlatRule(object):
         type
             the type of the variable
         """
-        try:
-            if eval(string) in (int, float, str):
-                return type
-        except (ValueError, NameError):
-            pass
-
-        if string in ('True', 'False'):
-            return bool
-
-        try:
-            int(string)
-            return int
-        except ValueError:
-            pass
-
-        try:
-            float(string)
-            return float
-        except ValueError:
-            pass
-
-        return str
+        return type_string(string)
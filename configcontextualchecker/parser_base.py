@@ -1,12 +1,42 @@
-"""This module provides a parser."""
+"""This module provides the base of the PLY parsers.
 
-from ply import lex, yacc
+PLY is only imported when a PLY parser is created, the PLY parsers are the
+reference of the hand-written parsers, see :mod:`descent`.
+"""
+
+import threading
 
 from .exceptions import ParserSyntaxError
 
 
-class ParserBase(object):
-    """This class provides a basic parser.
+# parsers dedicated to each thread
+_THREAD_PARSERS = threading.local()
+
+
+class PerThread(object):
+    """This class provides the parsers dedicated to each thread."""
+
+    @classmethod
+    def for_thread(cls):
+        """Return the parser dedicated to the current thread.
+
+        The parser is created on first use.
+
+        Returns
+        -------
+        parser object
+            instance of the class
+        """
+        parsers = _THREAD_PARSERS.__dict__.setdefault('parsers', dict())
+        try:
+            return parsers[cls]
+        except KeyError:
+            parser = parsers[cls] = cls()
+            return parser
+
+
+class ParserBase(PerThread):
+    """This class provides a basic PLY parser.
 
     It can parse:
     * a comma,
@@ -15,10 +45,19 @@ class ParserBase(object):
     * ignored characters
 
     It also defines the parse method.
+
+    A parser holds the state of the parsing, so it shall not be used by
+    several threads at once, see :meth:`for_thread`.
+    The lexing and parsing tables are loaded from the modules named after
+    :attr:`TABLES`, see :mod:`configcontextualchecker.tables`.
     """
 
     debug = False
 
+    # prefix of the modules of the precomputed tables, a derived class with
+    # its own tokens or grammar shall have its own modules
+    TABLES = None
+
     tokens = (
         'FLOAT',  # must be before INTEGER to catch decimal point
         'INTEGER',
@@ -31,10 +70,22 @@ class ParserBase(object):
     t_ignore = " \t"
 
     def __init__(self):
-        self.lexer = lex.lex(module=self)
-        self.parser = yacc.yacc(module=self,
-                                debug=self.debug,
-                                write_tables=False)
+        from ply import lex, yacc
+
+        if self.TABLES is None:
+            self.lexer = lex.lex(module=self)
+            self.parser = yacc.yacc(module=self,
+                                    debug=self.debug,
+                                    write_tables=False)
+        else:
+            # the rules are not validated when the lexing tables are loaded
+            self.lexer = lex.lex(module=self,
+                                 optimize=True,
+                                 lextab=self.TABLES + '_lex')
+            self.parser = yacc.yacc(module=self,
+                                    debug=self.debug,
+                                    write_tables=False,
+                                    tabmodule=self.TABLES + '_yacc')
 
     def parse(self, string):
         """Parse a string.
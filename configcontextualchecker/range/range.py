@@ -9,6 +9,9 @@ class Range(object):
     Used for checking whether a value belongs to a range.
     The checking is performed by using the contained operator, i.e.
     'value in range'. Lower and upper bounds values must be of the same type.
+    The comparison of a value to the bounds is specialized when the range is
+    created, so a range shall not be modified.
+    Ranges are equal when they contain the same values of the same type.
 
     Parameters
     ----------
@@ -29,11 +32,34 @@ class Range(object):
         upper bound
     """
 
+    # comparisons of a value to the bounds values bound to whether the lower
+    # and upper bounds are open, None for no bound
+    _CONTAINS = {
+        (True, True): lambda lower, upper: lambda v: lower < v < upper,
+        (True, False): lambda lower, upper: lambda v: lower < v <= upper,
+        (False, True): lambda lower, upper: lambda v: lower <= v < upper,
+        (False, False): lambda lower, upper: lambda v: lower <= v <= upper,
+        (True, None): lambda lower, upper: lambda v: lower < v,
+        (False, None): lambda lower, upper: lambda v: lower <= v,
+        (None, True): lambda lower, upper: lambda v: v < upper,
+        (None, False): lambda lower, upper: lambda v: v <= upper,
+    }
+
     def __init__(self, lower_value, lower_is_open, upper_value, upper_is_open):
         self._check_bounds_values(lower_value, upper_value)
         self.lower = LowerBound(lower_value, lower_is_open)
         self.upper = UpperBound(upper_value, upper_is_open)
 
+        # the openness of a missing bound does not matter
+        if lower_value is None:
+            lower_is_open = None
+        if upper_value is None:
+            upper_is_open = None
+        self._contains = self._CONTAINS[lower_is_open, upper_is_open](
+            lower_value, upper_value)
+        self._key = (self.type, lower_value, lower_is_open, upper_value,
+                     upper_is_open)
+
     @property
     def type(self):
         """Return the bound type."""
@@ -100,12 +126,25 @@ class Range(object):
         bool
             True if the value is within the range, False otherwise
         """
-        return self.lower.check(value) and self.upper.check(value)
+        return self._contains(value)
 
     def __repr__(self):
         return '{0}, {1}'.format(self.lower, self.upper)
 
     def __eq__(self, other):
-        # there is a one to one mapping from string representation to
-        # the object
-        return str(self) == str(other)
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self._key == other._key
+
+    def __ne__(self, other):
+        if not isinstance(other, Range):
+            return NotImplemented
+        return self._key != other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __reduce__(self):
+        # the specialized comparison is created again
+        return Range, (self.lower.value, self.lower._open, self.upper.value,
+                       self.upper._open)
@@ -1,48 +1,24 @@
 """This module provides the range parser."""
 
+from ..descent import DescentParserBase
 from ..parser_base import ParserBase
 from .range import Range
 from .bound import LowerBound, UpperBound
 
 
-class RangeParser(ParserBase):
-    """This class provides a range parser."""
+def _range_args(lower_bracket, lower_value, upper_value, upper_bracket):
+    """Determine the Range class init arguments from the parsed tokens."""
+    lower_is_open = lower_bracket == ']'
+    upper_is_open = upper_bracket == '['
+    if lower_value == LowerBound.UNBOUND:
+        lower_value = None
+    if upper_value == UpperBound.UNBOUND:
+        upper_value = None
+    return (lower_value, lower_is_open, upper_value, upper_is_open)
 
-    tokens = ParserBase.tokens + (
-        'BRACKET',
-        'PLUS_INF',
-        'MINUS_INF',
-    )
-
-    t_BRACKET = r'\[|\]'
-    t_PLUS_INF = r'\+inf'
-    t_MINUS_INF = r'\-inf'
 
-    @staticmethod
-    def p_range(p):
-        """
-        range : BRACKET item COMMA item BRACKET
-        """
-        p[0] = p[2]
-        lower_is_open = p[1] == ']'
-        lower_value = p[2]
-        upper_value = p[4]
-        upper_is_open = p[5] == '['
-        if lower_value == LowerBound.UNBOUND:
-            lower_value = None
-        if upper_value == UpperBound.UNBOUND:
-            upper_value = None
-        p[0] = (lower_value, lower_is_open, upper_value, upper_is_open)
-
-    @staticmethod
-    def p_item(p):
-        """
-        item : FLOAT
-             | INTEGER
-             | PLUS_INF
-             | MINUS_INF
-        """
-        p[0] = p[1]
+class _RangeParsing(object):
+    """This class provides the parsing of a range to the range parsers."""
 
     def _get_range_args(self, string):
         """Determine the Range class init arguments.
@@ -57,7 +33,7 @@ class RangeParser(ParserBase):
         list
             Range object init arguments
         """
-        return super(RangeParser, self).parse(string)
+        return super(_RangeParsing, self).parse(string)
 
     def parse(self, string):
         """Parse a range expression.
@@ -73,3 +49,66 @@ class RangeParser(ParserBase):
             a Range object
         """
         return Range(*self._get_range_args(string))
+
+
+class RangeParser(_RangeParsing, DescentParserBase):
+    """This class provides a range parser.
+
+    It is a hand-written parser of the grammar of :class:`PlyRangeParser`,
+    with the same syntax errors.
+    """
+
+    TOKENS = DescentParserBase.TOKENS[:2] + (
+        ('BRACKET', r'\[|\]'),
+        ('MINUS_INF', r'\-inf'),
+        ('PLUS_INF', r'\+inf'),
+        DescentParserBase.TOKENS[2],
+    )
+
+    ITEMS = ('FLOAT', 'INTEGER', 'PLUS_INF', 'MINUS_INF')
+
+    def _parse(self):
+        """range : BRACKET item COMMA item BRACKET"""
+        lower_bracket = self._expect(('BRACKET',)).value
+        lower_value = self._expect(self.ITEMS).value
+        self._expect(('COMMA',))
+        upper_value = self._expect(self.ITEMS).value
+        upper_bracket = self._expect(('BRACKET',)).value
+        return _range_args(lower_bracket, lower_value, upper_value,
+                           upper_bracket)
+
+
+class PlyRangeParser(_RangeParsing, ParserBase):
+    """This class provides the PLY range parser.
+
+    It is the reference of :class:`RangeParser`.
+    """
+
+    TABLES = 'configcontextualchecker.tables.range_parser'
+
+    tokens = ParserBase.tokens + (
+        'BRACKET',
+        'PLUS_INF',
+        'MINUS_INF',
+    )
+
+    t_BRACKET = r'\[|\]'
+    t_PLUS_INF = r'\+inf'
+    t_MINUS_INF = r'\-inf'
+
+    @staticmethod
+    def p_range(p):
+        """
+        range : BRACKET item COMMA item BRACKET
+        """
+        p[0] = _range_args(p[1], p[2], p[4], p[5])
+
+    @staticmethod
+    def p_item(p):
+        """
+        item : FLOAT
+             | INTEGER
+             | PLUS_INF
+             | MINUS_INF
+        """
+        p[0] = p[1]
@@ -12,9 +12,82 @@ their path within curly braces {}.
 
 import re
 
+from .dict_path import Path
 from .exceptions import RuleError
 from .flat_rule import FlatRule
-from . import condexp_parser
+from .condexp import CondExp, OPERAND_TYPES, switch_case
+
+
+class _Switch(object):
+    """Dispatch table of consecutive contextual rules whose conditional
+    expressions test the same item for equality to literals of the same kind.
+
+    Parameters
+    ----------
+    path : :class:`Path`
+        path to the tested item
+    strings : bool
+        whether the literals are strings, or numbers
+
+    Attributes
+    ----------
+    cases : list of tuple
+        compiled conditional expressions and their contextual flat rules, in
+        order
+    """
+
+    __slots__ = ('path', 'strings', 'cases', '_table')
+
+    def __init__(self, path, strings):
+        self.path = path
+        self.strings = strings
+        self.cases = list()
+        self._table = dict()
+
+    def add(self, literals, cond_exp, ctx_rule):
+        """Add a contextual rule after the others.
+
+        Parameters
+        ----------
+        literals : tuple
+            values of the item that make the expression true
+        cond_exp : :class:`CondExp`
+            compiled conditional expression
+        ctx_rule : :class:`FlatRule`
+            contextual flat rule
+        """
+        self.cases += [(cond_exp, ctx_rule)]
+        for literal in literals:
+            # the first expression true for a value is selected
+            self._table.setdefault(literal, (cond_exp, ctx_rule))
+
+    def select(self, config, values):
+        """Select the contextual rule of the first true expression.
+
+        Parameters
+        ----------
+        config : dict
+            config that contains the items
+        values : dict
+            values of the items bound to the strings of their paths
+
+        Returns
+        -------
+        tuple or None
+            compiled conditional expression and its contextual flat rule,
+            None if no expression is true
+        """
+        value = values[self.path.string]
+        if type(value) in OPERAND_TYPES and \
+                (type(value) is str) is self.strings:
+            return self._table.get(value)
+
+        # the value does not fit the expressions, they are evaluated in order
+        # so that the errors are the ones of the expressions
+        for cond_exp, ctx_rule in self.cases:
+            if cond_exp.evaluate(config, values):
+                return cond_exp, ctx_rule
+        return None
 
 
 class Rule(object):
@@ -26,39 +99,51 @@ class Rule(object):
         name of the rule and path to the item in the config to be checked
     rule_def : dict
         rule definition
+    cache : :class:`ConversionCache`, optional
+        cache of the checked string values shared by the flat rules
 
     Attributes
     ----------
     name : str
         name of the rule and path to the item in the config to be checked
+    path : :class:`Path`
+        compiled path to the item in the config to be checked
     base_rule : :class:`FlatRule`
         flat rule that do not depend on conditional expressions
     dependencies : list of str
         names of the rules that the current rule depends on
     ctx_rules : dict of FlatRule
         contextual flat rules
+    cond_exps : list of tuple
+        compiled conditional expressions and their contextual flat rules
+    paths : list of :class:`Path`
+        paths of the item to be checked and of the items the compiled
+        conditional expressions refer to
     """
 
     # pattern to identify a condition expression
     RULE_NAME_PARSER = re.compile(r'(?:{(.+?)})')
 
-    # conditional expression parser
-    CONDEXP_PARSER = condexp_parser.Parser()
-
-    def __init__(self, name, rule_def):
+    def __init__(self, name, rule_def, cache=None):
         self.name = name
-        self.base_rule = FlatRule(rule_def)
+        self.path = Path(name)
+        self.base_rule = FlatRule(rule_def, cache=cache)
         self.dependencies = list()
         self.ctx_rules = dict()
+        self.cond_exps = list()
+        self.paths = [self.path]
         self._parse(rule_def)
 
-    def apply(self, config):
+    def apply(self, config, values=None):
         """Check the item of a config dictionary.
 
         Parameters
         ----------
         config : dict
             config that contains the item
+        values : dict, optional
+            values of the items of :attr:`paths` bound to the strings of
+            their paths, looked up in the config by default
 
         Returns
         -------
@@ -66,15 +151,52 @@ class Rule(object):
             item's value eventually converted to satisfy the rule
             or None if the item does not exist
         """
-        # pass the config to the conditional expression parser about
-        self.CONDEXP_PARSER.config = config
+        if values is None:
+            values = dict((path.string, path.get(config))
+                          for path in self.paths)
 
         # determine the rule to use
-        for cond_exp, ctx_rule in self.ctx_rules.items():
-            if self.CONDEXP_PARSER.parse(cond_exp):
-                return ctx_rule.apply(self.name, config)
-        else:
-            return self.base_rule.apply(self.name, config)
+        for cond_exp, ctx_rule in self._cases:
+            if ctx_rule is None:
+                # dispatch table
+                case = cond_exp.select(config, values)
+                if case is not None:
+                    return case[1].check(values[self.name])
+            elif cond_exp.evaluate(config, values):
+                return ctx_rule.check(values[self.name])
+        return self.base_rule.check(values[self.name])
+
+    def select(self, config, values=None):
+        """Select the flat rule an item of a config dictionary shall satisfy.
+
+        Parameters
+        ----------
+        config : dict
+            config that contains the item
+        values : dict, optional
+            values of the items of :attr:`paths` bound to the strings of
+            their paths, looked up in the config by default
+
+        Returns
+        -------
+        condition : str or None
+            conditional expression of the selected contextual rule, None for
+            the base rule
+        flat_rule : :class:`FlatRule`
+            selected flat rule
+        """
+        if values is None:
+            values = dict((path.string, path.get(config))
+                          for path in self.paths)
+
+        for cond_exp, ctx_rule in self._cases:
+            if ctx_rule is None:
+                case = cond_exp.select(config, values)
+                if case is not None:
+                    return case[0].string, case[1]
+            elif cond_exp.evaluate(config, values):
+                return cond_exp.string, ctx_rule
+        return None, self.base_rule
 
     def _parse(self, rule_def):
         # parse the contextual rules, they override the root flat items,
@@ -83,11 +205,59 @@ class Rule(object):
             if not isinstance(ctx_rule, dict):
                 continue
             self.dependencies += self._parse_dependencies(cond_exp)
-            self.ctx_rules[cond_exp] = FlatRule(ctx_rule, self.base_rule)
+            self.ctx_rules[cond_exp] = FlatRule(ctx_rule, self.base_rule,
+                                                self.base_rule.cache)
+            compiled = CondExp(cond_exp)
+            self.cond_exps += [(compiled, self.ctx_rules[cond_exp])]
+            self.paths += [path for path in compiled.paths
+                           if path not in self.paths]
 
         if self.name in self.dependencies:
             raise RuleError('a rule cannot depend on itself')
 
+        self._cases = self._dispatch(self.cond_exps)
+
+    @staticmethod
+    def _dispatch(cond_exps):
+        """Group the consecutive tests of an item for equality to literals.
+
+        Parameters
+        ----------
+        cond_exps : list of tuple
+            compiled conditional expressions and their contextual flat rules
+
+        Returns
+        -------
+        list of tuple
+            the conditional expressions and their contextual flat rules,
+            the ones of a group replaced by a :class:`_Switch` and None
+        """
+        cases = list()
+        switch = None
+        for cond_exp, ctx_rule in cond_exps:
+            case = None
+            if cond_exp.tree is not None:
+                case = switch_case(cond_exp.tree)
+            if case is not None and case[1]:
+                path, literals = case
+                strings = type(literals[0]) is str
+                if all((type(literal) is str) is strings
+                       for literal in literals):
+                    if switch is None or switch.path != path or \
+                            switch.strings is not strings:
+                        switch = _Switch(path, strings)
+                        cases += [(switch, None)]
+                    switch.add(literals, cond_exp, ctx_rule)
+                    continue
+            switch = None
+            cases += [(cond_exp, ctx_rule)]
+
+        # a single expression is evaluated as is
+        for index, (switch, ctx_rule) in enumerate(cases):
+            if ctx_rule is None and len(switch.cases) == 1:
+                cases[index] = switch.cases[0]
+        return cases
+
     @classmethod
     def _parse_dependencies(cls, cond_exp):
         """Determine the dependencies from a conditional expression.
@@ -0,0 +1,180 @@
+"""This module provides the instrumentation of the rules.
+
+An instrumented checker records, for each rule, the number of times it is
+applied, the time spent applying it, the contextual rules selected, the
+values converted from their representations and the errors raised, see
+:meth:`ConfigContextualChecker.instrument`.
+The records can be exported in the text format of Prometheus.
+"""
+
+import os
+import tempfile
+import time
+
+# prefix of the names of the exported metrics
+PREFIX = 'configcontextualchecker_rule_'
+
+
+class RuleStats(object):
+    """Records of the applications of a rule.
+
+    The records are updated without locking, so the counters may miss a few
+    applications made at once by several threads.
+
+    Attributes
+    ----------
+    calls : int
+        number of applications of the rule
+    total_time : float
+        time spent applying the rule, in seconds
+    max_time : float
+        longest time spent applying the rule once, in seconds
+    selected : dict
+        number of times each flat rule was selected, bound to the condition
+        of the contextual rule or to None for the base rule
+    conversions : int
+        number of values converted from their representations
+    errors : dict
+        number of errors raised, bound to the names of their types
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.
+        self.max_time = 0.
+        self.selected = dict()
+        self.conversions = 0
+        self.errors = dict()
+
+    def apply(self, rule, config, values):
+        """Apply a rule and record it.
+
+        Parameters
+        ----------
+        rule : :class:`Rule`
+            rule to apply
+        config : dict
+            config that contains the item
+        values : dict
+            values of the items of the paths of the rule
+
+        Returns
+        -------
+        int or float or str or None
+            what :meth:`Rule.apply` returns
+        """
+        start = time.perf_counter()
+        try:
+            condition, flat_rule = rule.select(config, values)
+            item = values[rule.name]
+            value = flat_rule.check(item)
+        except Exception as error:
+            kind = type(error).__name__
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls += 1
+            self.total_time += elapsed
+            if elapsed > self.max_time:
+                self.max_time = elapsed
+
+        self.selected[condition] = self.selected.get(condition, 0) + 1
+        if item is not None and type(item) is not flat_rule.type:
+            self.conversions += 1
+        return value
+
+    def copy(self):
+        """Copy the records.
+
+        Returns
+        -------
+        :class:`RuleStats`
+            records that are not updated anymore
+        """
+        other = RuleStats()
+        other.__dict__.update(self.__dict__)
+        other.selected = dict(self.selected)
+        other.errors = dict(self.errors)
+        return other
+
+
+def _label(value):
+    return '"{0}"'.format(str(value).replace('\\', r'\\')
+                          .replace('"', r'\"').replace('\n', r'\n'))
+
+
+def prometheus_text(stats):
+    """Format records in the text format of Prometheus.
+
+    Parameters
+    ----------
+    stats : dict
+        :class:`RuleStats` bound to the names of the rules, like the ones of
+        :meth:`ConfigContextualChecker.stats`
+
+    Returns
+    -------
+    str
+        metrics labelled with the names of the rules, the selected contextual
+        rules are labelled with their conditions, an empty one for the base
+        rule
+    """
+    metrics = (
+        ('calls_total', 'counter', 'Number of applications of a rule.',
+         lambda stat: [((), stat.calls)]),
+        ('seconds_total', 'counter', 'Time spent applying a rule.',
+         lambda stat: [((), stat.total_time)]),
+        ('max_seconds', 'gauge', 'Longest time spent applying a rule once.',
+         lambda stat: [((), stat.max_time)]),
+        ('selected_total', 'counter',
+         'Number of selections of the flat rules of a rule.',
+         lambda stat: [((('context', '' if condition is None
+                          else condition),), count)
+                       for condition, count in stat.selected.items()]),
+        ('conversions_total', 'counter',
+         'Number of values converted from their representations.',
+         lambda stat: [((), stat.conversions)]),
+        ('errors_total', 'counter', 'Number of errors raised by a rule.',
+         lambda stat: [((('kind', kind),), count)
+                       for kind, count in stat.errors.items()]),
+    )
+
+    lines = list()
+    for suffix, type_, help_, samples in metrics:
+        name = PREFIX + suffix
+        lines += ['# HELP {0} {1}'.format(name, help_),
+                  '# TYPE {0} {1}'.format(name, type_)]
+        for rule_name, stat in sorted(stats.items()):
+            for labels, value in sorted(samples(stat)):
+                labels = (('rule', rule_name),) + labels
+                lines += ['{0}{{{1}}} {2!r}'.format(
+                    name,
+                    ','.join('{0}={1}'.format(key, _label(label))
+                             for key, label in labels),
+                    value)]
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(stats, filename):
+    """Write records to a file in the text format of Prometheus.
+
+    The file is written under a temporary name then renamed, so that a
+    collector never reads a partially written file.
+
+    Parameters
+    ----------
+    stats : dict
+        :class:`RuleStats` bound to the names of the rules
+    filename : str
+        path to the file
+    """
+    descriptor, temporary = tempfile.mkstemp(
+        '.tmp', dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        with os.fdopen(descriptor, 'w') as file_:
+            file_.write(prometheus_text(stats))
+        os.replace(temporary, filename)
+    except BaseException:
+        os.remove(temporary)
+        raise
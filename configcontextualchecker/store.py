@@ -0,0 +1,145 @@
+"""This module provides the on-disk store of the checkers.
+
+Creating a checker parses all the rules, their allowed values and their
+conditional expressions. A checker is stored once created, in a file named
+after a key computed from the rule definitions and the version of the
+library, so that the next processes load it instead of creating it again.
+A checker is created again when its file is missing, cannot be loaded or
+holds another key: a change of the rules or of the library gives another
+file. The stale files are never used, they may be removed at any time.
+
+The checkers are stored with :mod:`pickle`, so they shall only be loaded
+from trusted directories.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from . import __version__
+from .checker import ConfigContextualChecker
+
+
+# extension of the files of the checkers
+SUFFIX = '.pickle'
+
+
+def ruleset_key(rules_def):
+    """Compute the key of rule definitions.
+
+    Parameters
+    ----------
+    rules_def : dict
+        rule definitions
+
+    Returns
+    -------
+    str
+        hexadecimal digest of the rule definitions and of the version of the
+        library
+    """
+    parts = [__version__]
+    _canonical(rules_def, parts)
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _canonical(value, parts):
+    """Represent a value of rule definitions.
+
+    The order of the items of a dictionary is kept since the contextual rules
+    are tried in that order.
+
+    Parameters
+    ----------
+    value : object
+        value to represent
+    parts : list of str
+        representations the ones of the value are appended to
+    """
+    if isinstance(value, dict):
+        parts += ['{']
+        for key, item in value.items():
+            _canonical(key, parts)
+            _canonical(item, parts)
+        parts += ['}']
+    elif isinstance(value, (list, tuple)):
+        parts += [type(value).__name__ + '[']
+        for item in value:
+            _canonical(item, parts)
+        parts += [']']
+    elif isinstance(value, type):
+        parts += ['type ' + value.__module__ + '.' + value.__name__]
+    else:
+        parts += [type(value).__name__ + ' ' + repr(value)]
+
+
+def load_checker(rules_def, directory, cache=None):
+    """Load the checker of rule definitions, create and store it if need be.
+
+    Parameters
+    ----------
+    rules_def : dict
+        rule definitions
+    directory : str
+        directory of the stored checkers, created if need be
+    cache : :class:`ConversionCache`, optional
+        cache of the checked string values used by the checker, it is not
+        stored
+
+    Returns
+    -------
+    :class:`ConfigContextualChecker`
+        checker of the rule definitions
+    """
+    key = ruleset_key(rules_def)
+    filename = os.path.join(directory, key + SUFFIX)
+    checker = _load(filename, key)
+    if checker is None:
+        checker = ConfigContextualChecker(rules_def, cache)
+        _store(checker, filename, key)
+    else:
+        for rule in checker.plan:
+            for flat_rule in [rule.base_rule] + list(rule.ctx_rules.values()):
+                flat_rule.cache = cache
+    return checker
+
+
+def _load(filename, key):
+    """Load a checker, return None if it cannot be loaded."""
+    try:
+        with open(filename, 'rb') as file_:
+            stored_key, checker = pickle.load(file_)
+    except Exception:
+        # missing, truncated, or written by another version of python or of
+        # the library
+        return None
+    if stored_key != key or not isinstance(checker, ConfigContextualChecker):
+        return None
+    return checker
+
+
+def _store(checker, filename, key):
+    """Store a checker, do nothing if it cannot be stored.
+
+    The file is written under a temporary name then renamed, so that a
+    process never loads a partially written file.
+    """
+    directory = os.path.dirname(filename)
+    try:
+        os.makedirs(directory)
+    except OSError:
+        # already existing, or the writing below fails
+        pass
+
+    try:
+        descriptor, temporary = tempfile.mkstemp(SUFFIX, dir=directory)
+    except OSError:
+        return
+    try:
+        with os.fdopen(descriptor, 'wb') as file_:
+            pickle.dump((key, checker), file_, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, filename)
+    except Exception:
+        # not writable, or the rules hold objects that cannot be pickled
+        os.remove(temporary)
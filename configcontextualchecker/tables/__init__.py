@@ -0,0 +1,9 @@
+"""This package holds the precomputed parsing tables of the PLY parsers.
+
+The tables are loaded by the parsers instead of being computed in each
+process. A parser computes its parsing tables when they are out of date but
+it trusts its lexing tables, so the tables shall be generated again after a
+change of the tokens or of a grammar with::
+
+    python -m configcontextualchecker.tables
+"""
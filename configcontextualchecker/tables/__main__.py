@@ -0,0 +1,34 @@
+"""Generate the lexing and parsing tables of the parsers."""
+
+import os
+
+from ply import lex, yacc
+
+from ..condexp import PlyCompiler
+from ..condexp_parser import PlyParser
+from ..range.range_parser import PlyRangeParser
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for cls in (PlyParser, PlyCompiler, PlyRangeParser):
+        lextab = cls.TABLES + '_lex'
+        tabmodule = cls.TABLES + '_yacc'
+
+        # remove the tables so they are written again
+        for module in (lextab, tabmodule):
+            filename = os.path.join(directory,
+                                    module.rpartition('.')[2] + '.py')
+            if os.path.exists(filename):
+                os.remove(filename)
+
+        parser = cls()
+        lex.lex(module=parser, optimize=True, lextab=lextab,
+                outputdir=directory)
+        yacc.yacc(module=parser, debug=False, tabmodule=tabmodule,
+                  outputdir=directory)
+        print('wrote the tables of {0}'.format(cls.__name__))
+
+
+if __name__ == '__main__':
+    main()
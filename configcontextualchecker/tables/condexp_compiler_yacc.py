@@ -0,0 +1,52 @@
+
+# condexp_compiler_yacc.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'boolleftEQNEleftGEGTLELTleftORleftANDrightNOTAND BOOL COMMA EQ FLOAT GE GT IN INTEGER ITEM LE LPAREN LT NE NOT OR RPAREN STRINGbool : NOT bool\n        bool : operand LT operand\n             | operand GT operand\n             | operand LE operand\n             | operand GE operand\n             | operand EQ operand\n             | operand NE operand\n             | bool OR bool\n             | bool AND bool\n        \n        bool : LPAREN bool RPAREN\n        container : LPAREN list RPAREN\n        \n        listitem : operand\n                 | list\n        \n        bool : BOOL\n        operand : INTEGER\n                | FLOAT\n                | STRING\n        bool : ITEMoperand : ITEM\n        list : listitem COMMA operand\n        \n        bool : operand IN container\n        \n        bool : operand NOT IN container\n        '
+    
+_lr_action_items = {'NOT':([0,2,3,4,6,7,8,9,10,11,],[2,2,20,2,-19,-15,-16,-17,2,2,]),'LPAREN':([0,2,4,10,11,19,33,],[4,4,4,4,4,32,32,]),'BOOL':([0,2,4,10,11,],[5,5,5,5,5,]),'ITEM':([0,2,4,10,11,13,14,15,16,17,18,32,40,],[6,6,6,6,6,25,25,25,25,25,25,25,25,]),'INTEGER':([0,2,4,10,11,13,14,15,16,17,18,32,40,],[7,7,7,7,7,7,7,7,7,7,7,7,7,]),'FLOAT':([0,2,4,10,11,13,14,15,16,17,18,32,40,],[8,8,8,8,8,8,8,8,8,8,8,8,8,]),'STRING':([0,2,4,10,11,13,14,15,16,17,18,32,40,],[9,9,9,9,9,9,9,9,9,9,9,9,9,]),'$end':([1,5,6,7,8,9,12,22,23,24,25,26,27,28,29,30,31,34,38,39,],[0,-14,-18,-15,-16,-17,-1,-8,-9,-2,-19,-3,-4,-5,-6,-7,-21,-10,-22,-11,]),'OR':([1,5,6,7,8,9,12,21,22,23,24,25,26,27,28,29,30,31,34,38,39,],[10,-14,-18,-15,-16,-17,-1,10,-8,-9,-2,-19,-3,-4,-5,-6,-7,-21,-10,-22,-11,]),'AND':([1,5,6,7,8,9,12,21,22,23,24,25,26,27,28,29,30,31,34,38,39,],[11,-14,-18,-15,-16,-17,-1,11,11,-9,-2,-19,-3,-4,-5,-6,-7,-21,-10,-22,-11,]),'LT':([3,6,7,8,9,],[13,-19,-15,-16,-17,]),'GT':([3,6,7,8,9,],[14,-19,-15,-16,-17,]),'LE':([3,6,7,8,9,],[15,-19,-15,-16,-17,]),'GE':([3,6,7,8,9,],[16,-19,-15,-16,-17,]),'EQ':([3,6,7,8,9,],[17,-19,-15,-16,-17,]),'NE':([3,6,7,8,9,],[18,-19,-15,-16,-17,]),'IN':([3,6,7,8,9,20,],[19,-19,-15,-16,-17,33,]),'RPAREN':([5,6,7,8,9,12,21,22,23,24,25,26,27,28,29,30,31,34,35,38,39,41,],[-14,-18,-15,-16,-17,-1,34,-8,-9,-2,-19,-3,-4,-5,-6,-7,-21,-10,39,-22,-11,-20,]),'COMMA':([7,8,9,25,35,36,37,41,],[-15,-16,-17,-19,-13,40,-12,-20,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'bool':([0,2,4,10,11,],[1,12,21,22,23,]),'operand':([0,2,4,10,11,13,14,15,16,17,18,32,40,],[3,3,3,3,3,24,26,27,28,29,30,37,41,]),'container':([19,33,],[31,38,]),'list':([32,],[35,]),'listitem':([32,],[36,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> bool","S'",1,None,None,None),
+  ('bool -> NOT bool','bool',2,'p_not','condexp.py',314),
+  ('bool -> operand LT operand','bool',3,'p_binop','condexp.py',320),
+  ('bool -> operand GT operand','bool',3,'p_binop','condexp.py',321),
+  ('bool -> operand LE operand','bool',3,'p_binop','condexp.py',322),
+  ('bool -> operand GE operand','bool',3,'p_binop','condexp.py',323),
+  ('bool -> operand EQ operand','bool',3,'p_binop','condexp.py',324),
+  ('bool -> operand NE operand','bool',3,'p_binop','condexp.py',325),
+  ('bool -> bool OR bool','bool',3,'p_binop','condexp.py',326),
+  ('bool -> bool AND bool','bool',3,'p_binop','condexp.py',327),
+  ('bool -> LPAREN bool RPAREN','bool',3,'p_paren','condexp.py',334),
+  ('container -> LPAREN list RPAREN','container',3,'p_paren','condexp.py',335),
+  ('listitem -> operand','listitem',1,'p_self','condexp.py',342),
+  ('listitem -> list','listitem',1,'p_self','condexp.py',343),
+  ('bool -> BOOL','bool',1,'p_literal','condexp.py',350),
+  ('operand -> INTEGER','operand',1,'p_literal','condexp.py',351),
+  ('operand -> FLOAT','operand',1,'p_literal','condexp.py',352),
+  ('operand -> STRING','operand',1,'p_literal','condexp.py',353),
+  ('bool -> ITEM','bool',1,'p_bool_item','condexp.py',359),
+  ('operand -> ITEM','operand',1,'p_operand_item','condexp.py',364),
+  ('list -> listitem COMMA operand','list',3,'p_list','condexp.py',370),
+  ('bool -> operand IN container','bool',3,'p_membership','condexp.py',380),
+  ('bool -> operand NOT IN container','bool',4,'p_membership_not','condexp.py',387),
+]
@@ -0,0 +1,10 @@
+# condexp_parser_lex.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BOOL', 'COMMA', 'EQ', 'FLOAT', 'GE', 'GT', 'IN', 'INTEGER', 'ITEM', 'LE', 'LPAREN', 'LT', 'NE', 'NOT', 'OR', 'RPAREN', 'STRING'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FLOAT>\\d+\\.\\d*([eE]\\d+)?)|(?P<t_INTEGER>[+-]?\\d+)|(?P<t_STRING>\\"([^\\\\"]|(\\\\.))*\\")|(?P<t_BOOL>True|False)|(?P<t_ITEM>{.+?})|(?P<t_AND>and)|(?P<t_NOT>not)|(?P<t_EQ>==)|(?P<t_GE>>=)|(?P<t_IN>in)|(?P<t_LE><=)|(?P<t_LPAREN>\\()|(?P<t_NE>!=)|(?P<t_OR>or)|(?P<t_RPAREN>\\))|(?P<t_COMMA>,)|(?P<t_GT>>)|(?P<t_LT><)', [None, ('t_FLOAT', 'FLOAT'), None, ('t_INTEGER', 'INTEGER'), ('t_STRING', 'STRING'), None, None, ('t_BOOL', 'BOOL'), ('t_ITEM', 'ITEM'), (None, 'AND'), (None, 'NOT'), (None, 'EQ'), (None, 'GE'), (None, 'IN'), (None, 'LE'), (None, 'LPAREN'), (None, 'NE'), (None, 'OR'), (None, 'RPAREN'), (None, 'COMMA'), (None, 'GT'), (None, 'LT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,53 @@
+
+# condexp_parser_yacc.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftEQNEleftGEGTLELTleftORleftANDrightNOTAND BOOL COMMA EQ FLOAT GE GT IN INTEGER ITEM LE LPAREN LT NE NOT OR RPAREN STRINGbool : NOT bool\n        bool : number LT number\n             | number GT number\n             | number LE number\n             | number GE number\n             | number EQ number\n             | number NE number\n             | STRING EQ STRING\n             | STRING NE STRING\n             | bool OR bool\n             | bool AND bool\n        \n        bool : LPAREN bool RPAREN\n        container : LPAREN list RPAREN\n        \n        bool : BOOL\n        number : INTEGER\n               | FLOAT\n        item : number\n             | STRING\n        listitem : item\n                 | list\n        \n        list : listitem COMMA item\n        \n        bool : item IN container\n        \n        bool : item NOT IN container\n        '
+    
+_lr_action_items = {'NOT':([0,2,3,4,5,7,8,9,10,11,],[2,2,-17,-18,2,23,-15,-16,2,2,]),'STRING':([0,2,5,10,11,19,20,36,45,],[4,4,4,4,4,32,33,42,42,]),'LPAREN':([0,2,5,10,11,22,37,],[5,5,5,5,5,36,36,]),'BOOL':([0,2,5,10,11,],[6,6,6,6,6,]),'INTEGER':([0,2,5,10,11,13,14,15,16,17,18,36,45,],[8,8,8,8,8,8,8,8,8,8,8,8,8,]),'FLOAT':([0,2,5,10,11,13,14,15,16,17,18,36,45,],[9,9,9,9,9,9,9,9,9,9,9,9,9,]),'$end':([1,6,8,9,12,24,25,26,27,28,29,30,31,32,33,34,35,43,44,],[0,-14,-15,-16,-1,-10,-11,-2,-3,-4,-5,-6,-7,-8,-9,-12,-22,-23,-13,]),'OR':([1,6,8,9,12,21,24,25,26,27,28,29,30,31,32,33,34,35,43,44,],[10,-14,-15,-16,-1,10,-10,-11,-2,-3,-4,-5,-6,-7,-8,-9,-12,-22,-23,-13,]),'AND':([1,6,8,9,12,21,24,25,26,27,28,29,30,31,32,33,34,35,43,44,],[11,-14,-15,-16,-1,11,11,-11,-2,-3,-4,-5,-6,-7,-8,-9,-12,-22,-23,-13,]),'LT':([3,8,9,],[13,-15,-16,]),'GT':([3,8,9,],[14,-15,-16,]),'LE':([3,8,9,],[15,-15,-16,]),'GE':([3,8,9,],[16,-15,-16,]),'EQ':([3,4,8,9,],[17,19,-15,-16,]),'NE':([3,4,8,9,],[18,20,-15,-16,]),'IN':([3,4,7,8,9,23,],[-17,-18,22,-15,-16,37,]),'RPAREN':([6,8,9,12,21,24,25,26,27,28,29,30,31,32,33,34,35,38,41,42,43,44,46,],[-14,-15,-16,-1,34,-10,-11,-2,-3,-4,-5,-6,-7,-8,-9,-12,-22,44,-17,-18,-23,-13,-21,]),'COMMA':([8,9,38,39,40,41,42,46,],[-15,-16,-20,45,-19,-17,-18,-21,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'bool':([0,2,5,10,11,],[1,12,21,24,25,]),'number':([0,2,5,10,11,13,14,15,16,17,18,36,45,],[3,3,3,3,3,26,27,28,29,30,31,41,41,]),'item':([0,2,5,10,11,36,45,],[7,7,7,7,7,40,46,]),'container':([22,37,],[35,43,]),'list':([36,],[38,]),'listitem':([36,],[39,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> bool","S'",1,None,None,None),
+  ('bool -> NOT bool','bool',2,'p_not','condexp_parser.py',290),
+  ('bool -> number LT number','bool',3,'p_binop','condexp_parser.py',296),
+  ('bool -> number GT number','bool',3,'p_binop','condexp_parser.py',297),
+  ('bool -> number LE number','bool',3,'p_binop','condexp_parser.py',298),
+  ('bool -> number GE number','bool',3,'p_binop','condexp_parser.py',299),
+  ('bool -> number EQ number','bool',3,'p_binop','condexp_parser.py',300),
+  ('bool -> number NE number','bool',3,'p_binop','condexp_parser.py',301),
+  ('bool -> STRING EQ STRING','bool',3,'p_binop','condexp_parser.py',302),
+  ('bool -> STRING NE STRING','bool',3,'p_binop','condexp_parser.py',303),
+  ('bool -> bool OR bool','bool',3,'p_binop','condexp_parser.py',304),
+  ('bool -> bool AND bool','bool',3,'p_binop','condexp_parser.py',305),
+  ('bool -> LPAREN bool RPAREN','bool',3,'p_paren','condexp_parser.py',312),
+  ('container -> LPAREN list RPAREN','container',3,'p_paren','condexp_parser.py',313),
+  ('bool -> BOOL','bool',1,'p_self','condexp_parser.py',320),
+  ('number -> INTEGER','number',1,'p_self','condexp_parser.py',321),
+  ('number -> FLOAT','number',1,'p_self','condexp_parser.py',322),
+  ('item -> number','item',1,'p_self','condexp_parser.py',323),
+  ('item -> STRING','item',1,'p_self','condexp_parser.py',324),
+  ('listitem -> item','listitem',1,'p_self','condexp_parser.py',325),
+  ('listitem -> list','listitem',1,'p_self','condexp_parser.py',326),
+  ('list -> listitem COMMA item','list',3,'p_list','condexp_parser.py',333),
+  ('bool -> item IN container','bool',3,'p_membership','condexp_parser.py',343),
+  ('bool -> item NOT IN container','bool',4,'p_membership_not','condexp_parser.py',350),
+]
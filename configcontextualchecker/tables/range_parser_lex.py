@@ -0,0 +1,10 @@
+# range_parser_lex.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('BRACKET', 'COMMA', 'FLOAT', 'INTEGER', 'MINUS_INF', 'PLUS_INF'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FLOAT>\\d+\\.\\d*([eE]\\d+)?)|(?P<t_INTEGER>[+-]?\\d+)|(?P<t_BRACKET>\\[|\\])|(?P<t_MINUS_INF>\\-inf)|(?P<t_PLUS_INF>\\+inf)|(?P<t_COMMA>,)', [None, ('t_FLOAT', 'FLOAT'), None, ('t_INTEGER', 'INTEGER'), (None, 'BRACKET'), (None, 'MINUS_INF'), (None, 'PLUS_INF'), (None, 'COMMA')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
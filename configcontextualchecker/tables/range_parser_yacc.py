@@ -0,0 +1,35 @@
+
+# range_parser_yacc.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'BRACKET COMMA FLOAT INTEGER MINUS_INF PLUS_INF\n        range : BRACKET item COMMA item BRACKET\n        \n        item : FLOAT\n             | INTEGER\n             | PLUS_INF\n             | MINUS_INF\n        '
+    
+_lr_action_items = {'BRACKET':([0,4,5,6,7,9,],[2,-2,-3,-4,-5,10,]),'$end':([1,10,],[0,-1,]),'FLOAT':([2,8,],[4,4,]),'INTEGER':([2,8,],[5,5,]),'PLUS_INF':([2,8,],[6,6,]),'MINUS_INF':([2,8,],[7,7,]),'COMMA':([3,4,5,6,7,],[8,-2,-3,-4,-5,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'range':([0,],[1,]),'item':([2,8,],[3,9,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> range","S'",1,None,None,None),
+  ('range -> BRACKET item COMMA item BRACKET','range',5,'p_range','range_parser.py',101),
+  ('item -> FLOAT','item',1,'p_item','range_parser.py',108),
+  ('item -> INTEGER','item',1,'p_item','range_parser.py',109),
+  ('item -> PLUS_INF','item',1,'p_item','range_parser.py',110),
+  ('item -> MINUS_INF','item',1,'p_item','range_parser.py',111),
+]
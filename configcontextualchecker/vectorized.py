@@ -0,0 +1,90 @@
+"""This module provides the checking of sequences of values.
+
+The values of a list-valued item or of a bulk array are checked at once
+against the type and the allowed values of a rule, the indices of the values
+that do not satisfy the rule are reported.
+NumPy arrays of numbers are checked with vectorized operations, the other
+sequences are checked value by value. NumPy is optional and never imported
+here: the values can only be a NumPy array when it has been imported.
+"""
+
+import sys
+
+from .convert import convert
+from .range import Range
+
+
+# kinds of the NumPy data types bound to the types of the rules they satisfy
+_NUMPY_KINDS = {
+    int: 'iu',
+    float: 'f',
+    bool: 'b',
+}
+
+
+def check_values(values, type_, allowed=None):
+    """Check values against a type and allowed values.
+
+    Parameters
+    ----------
+    values : sequence or :class:`numpy.ndarray`
+        values or their string representations
+    type_ : type
+        expected type of the values
+    allowed : container object, optional
+        the values have to be in that container
+
+    Returns
+    -------
+    checked : list or :class:`numpy.ndarray`
+        values converted to type_, a one dimensional array when the values
+        are a NumPy array of numbers, the offending values are kept as is
+    offending : list of int or :class:`numpy.ndarray`
+        indices of the values that do not satisfy the type or the allowed
+        values, in increasing order
+    """
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(values, numpy.ndarray) and \
+            values.dtype.kind in _NUMPY_KINDS.get(type_, ''):
+        return _check_array(numpy, values, allowed)
+    return _check_sequence(values, type_, allowed)
+
+
+def _check_sequence(values, type_, allowed):
+    """Check values one by one."""
+    checked = list()
+    offending = list()
+    for index, value in enumerate(values):
+        try:
+            if type(value) is not type_:
+                value = convert(value, type_)
+            if allowed is not None and value not in allowed:
+                offending += [index]
+        except TypeError:
+            offending += [index]
+        checked += [value]
+    return checked, offending
+
+
+def _check_array(numpy, values, allowed):
+    """Check a NumPy array of numbers of the expected type at once."""
+    values = values.ravel()
+    if allowed is None:
+        return values, numpy.empty(0, dtype=numpy.intp)
+
+    if isinstance(allowed, Range):
+        satisfied = numpy.ones(values.shape, dtype=bool)
+        if allowed.lower.value is not None:
+            if allowed.lower._open:
+                satisfied &= values > allowed.lower.value
+            else:
+                satisfied &= values >= allowed.lower.value
+        if allowed.upper.value is not None:
+            if allowed.upper._open:
+                satisfied &= values < allowed.upper.value
+            else:
+                satisfied &= values <= allowed.upper.value
+    else:
+        satisfied = numpy.isin(values, list(allowed))
+
+    return values, numpy.flatnonzero(~satisfied)
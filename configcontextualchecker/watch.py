@@ -0,0 +1,279 @@
+"""This module provides the watching of config files.
+
+The watched files are polled, a file is reloaded once its writes have settled
+and only the rules of the items that differ from the previous version of the
+file are applied again, see :meth:`ConfigContextualChecker.recheck`.
+
+The watching can be started from the command line with::
+
+    configcontextualchecker-watch package.module:RULES config.ini
+"""
+
+import argparse
+import copy
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from .checker import ConfigContextualChecker
+from .dict_path import PATH_SEP
+
+
+class WatchResult(namedtuple('WatchResult',
+                             ('filename', 'config', 'error', 'changed'))):
+    """Result of the checking of a watched config file.
+
+    Attributes
+    ----------
+    filename : str
+        path to the config file
+    config : dict or None
+        checked config, None if the file could not be loaded
+    error : Exception or None
+        error raised by the loading or the checking, None if the config is
+        valid
+    changed : set of str or None
+        paths of the items that differ from the previous version of the file,
+        None if the config has been fully checked
+    """
+
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        """Whether the config satisfies the rules."""
+        return self.error is None
+
+
+def load_config(filename):
+    """Load a config file.
+
+    JSON files are loaded with :mod:`json`, the other files with
+    :mod:`configobj` which shall then be installed.
+
+    Parameters
+    ----------
+    filename : str
+        path to the config file
+
+    Returns
+    -------
+    dict
+        config
+    """
+    if filename.endswith('.json'):
+        with open(filename) as file_:
+            return json.load(file_)
+
+    # configobj is only required by the non-JSON files
+    from configobj import ConfigObj
+    return ConfigObj(filename, file_error=True).dict()
+
+
+def _diff(old, new, keys=()):
+    """Find the paths of the items that differ between two configs.
+
+    Parameters
+    ----------
+    old : dict
+        previous config
+    new : dict
+        current config
+    keys : tuple of str, optional
+        keys from the root config to the compared sections
+
+    Yields
+    ------
+    str
+        path of an item or of a section that differs
+    """
+    for key in set(old) | set(new):
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            for path in _diff(old_value, new_value, keys + (key,)):
+                yield path
+        elif key not in old or key not in new or old_value != new_value:
+            yield PATH_SEP + PATH_SEP.join(keys + (key,))
+
+
+class Watcher(object):
+    """Watcher of config files.
+
+    A file is polled every ``interval`` seconds and it is reloaded once it
+    has not been modified for ``debounce`` seconds, so a burst of writes
+    triggers a single checking.
+    Each config is checked in full the first time and after a failed
+    checking, afterwards only the items that have changed are checked again.
+    The results are passed to the callback from the thread that polls.
+
+    Parameters
+    ----------
+    checker : :class:`ConfigContextualChecker`
+        checker of the configs
+    filenames : iterable of str
+        paths to the config files to watch
+    callback : callable
+        called with a :class:`WatchResult` each time a file is checked
+    interval : float, optional
+        time in seconds between two polls
+    debounce : float, optional
+        time in seconds a file shall be left untouched before it is reloaded
+    loader : callable, optional
+        loads a config file from its path, :func:`load_config` by default
+
+    Attributes
+    ----------
+    filenames : list of str
+        paths to the watched config files
+    interval : float
+        time in seconds between two polls
+    debounce : float
+        time in seconds a file shall be left untouched before it is reloaded
+    """
+
+    def __init__(self, checker, filenames, callback, interval=0.1,
+                 debounce=0.05, loader=load_config):
+        self.filenames = list(filenames)
+        self.interval = interval
+        self.debounce = debounce
+        self._checker = checker
+        self._callback = callback
+        self._loader = loader
+        self._stop = threading.Event()
+        # file statuses seen by the last poll
+        self._statuses = dict()
+        # time of the last modification of the files to reload
+        self._modified = dict()
+        # last loaded configs and their checked copies, None when invalid
+        self._loaded = dict()
+        self._checked = dict()
+
+    def poll(self, now=None):
+        """Look for modified files and check the settled ones.
+
+        Parameters
+        ----------
+        now : float, optional
+            current time as returned by :func:`time.time`
+        """
+        if now is None:
+            now = time.time()
+
+        for filename in self.filenames:
+            status = self._status(filename)
+            if status != self._statuses.get(filename, ()):
+                self._statuses[filename] = status
+                self._modified[filename] = now
+
+        for filename, modified in list(self._modified.items()):
+            if now - modified >= self.debounce:
+                del self._modified[filename]
+                self._reload(filename)
+
+    def run(self):
+        """Poll the files until :meth:`stop` is called."""
+        self._stop.clear()
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        """Stop :meth:`run`, it may be called from another thread."""
+        self._stop.set()
+
+    @staticmethod
+    def _status(filename):
+        """Summarize the status of a file, None if it cannot be read."""
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size, stat.st_ino
+
+    def _reload(self, filename):
+        """Load and check a modified file."""
+        try:
+            loaded = self._loader(filename)
+        except Exception as error:
+            self._loaded[filename] = self._checked[filename] = None
+            self._callback(WatchResult(filename, None, error, None))
+            return
+
+        old = self._loaded.get(filename)
+        checked = self._checked.get(filename)
+        self._loaded[filename] = loaded
+        self._checked[filename] = None
+        if checked is None:
+            changed = None
+            checked = copy.deepcopy(loaded)
+        else:
+            changed = set(_diff(old, loaded))
+            if not changed:
+                # the content is the same
+                self._checked[filename] = checked
+                return
+            checked = copy.deepcopy(checked)
+
+        try:
+            if changed is None:
+                self._checker(checked)
+            else:
+                self._checker.recheck(checked, changed, loaded)
+        except Exception as error:
+            self._callback(WatchResult(filename, checked, error, changed))
+        else:
+            self._checked[filename] = checked
+            self._callback(WatchResult(filename, checked, None, changed))
+
+
+def _load_rules(spec):
+    """Import rule definitions from a 'module:attribute' string."""
+    module_name, _, attribute = spec.partition(':')
+    return getattr(importlib.import_module(module_name), attribute or 'RULES')
+
+
+def _report(result):
+    if result.valid:
+        print('{0}: ok'.format(result.filename))
+    else:
+        print('{0}: {1}: {2}'.format(result.filename,
+                                     type(result.error).__name__,
+                                     result.error))
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    """Watch config files from the command line."""
+    parser = argparse.ArgumentParser(
+        prog='configcontextualchecker-watch',
+        description='Check config files each time they are modified.')
+    parser.add_argument('rules',
+                        help="rule definitions to import, as "
+                             "'module:attribute', the attribute defaults to "
+                             "RULES")
+    parser.add_argument('filenames', nargs='+', metavar='file',
+                        help='config file to watch')
+    parser.add_argument('--interval', type=float, default=0.1,
+                        help='time in seconds between two polls')
+    parser.add_argument('--debounce', type=float, default=0.05,
+                        help='time in seconds a file shall be left '
+                             'untouched before it is reloaded')
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    checker = ConfigContextualChecker(_load_rules(args.rules))
+    watcher = Watcher(checker, args.filenames, _report, args.interval,
+                      args.debounce)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,6 @@
 #!/usr/bin/env python
 
-try:
-    from setuptools import setup
-except ImportError:
-    from distutils.core import setup
+from setuptools import setup
 
 setup(
     name='configcontextualchecker',
@@ -11,8 +8,21 @@ setup(
     version=open('VERSION').read().strip(),
     url='https://github.com/AntoineD/configcontextualchecker',
     download_url='https://pypi.python.org/pypi/configcontextualchecker',
-    packages=['configcontextualchecker'],
-    install_requires=['networkx', 'ply'],
+    packages=['configcontextualchecker', 'configcontextualchecker.range',
+              'configcontextualchecker.tables'],
+    python_requires='>=3.7',
+    install_requires=['networkx'],
+    extras_require={
+        'numpy': ['numpy'],
+        # the reference parsers and the generation of their tables
+        'ply': ['ply'],
+    },
+    entry_points={
+        'console_scripts': [
+            'configcontextualchecker-watch = '
+            'configcontextualchecker.watch:main',
+        ],
+    },
     description='Contextual checking and default settings for config files',
     long_description=open('README.rst').read(),
     keywords='config contextual checker configobj',
@@ -22,11 +32,14 @@ setup(
         'Intended Audience :: Developers',
         'Natural Language :: English',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Topic :: Utilities',
     ],
 )
@@ -0,0 +1,116 @@
+"""Synthetic rule definitions and configs.
+
+The rules are integer items with allowed values, the contextual rules of a
+rule depend on rules created before it, so the rules are never circularly
+dependent and the dependencies may form long chains. The configs satisfy the
+rules whatever the contextual rules applied.
+"""
+
+import random
+
+
+def item_path(index, depth):
+    """Path of the item of a rule.
+
+    Parameters
+    ----------
+    index : int
+        index of the rule
+    depth : int
+        number of keys of the path, the items are spread over 4 sections at
+        each level
+
+    Returns
+    -------
+    str
+        path of the item
+    """
+    sections = ''.join('/section_{0}'.format((index >> (2 * level)) % 4)
+                       for level in range(depth - 1))
+    return '{0}/key_{1}'.format(sections, index)
+
+
+def make_rules(count, depth=2, fanout=1, contexts=1, allowed_size=8,
+               chain=True, seed=0):
+    """Make rule definitions.
+
+    Parameters
+    ----------
+    count : int
+        number of rules
+    depth : int, optional
+        number of keys of the paths of the items
+    fanout : int, optional
+        number of items a conditional expression depends on
+    contexts : int, optional
+        number of contextual rules of a rule
+    allowed_size : int, optional
+        number of allowed values of a rule
+    chain : bool, optional
+        whether a conditional expression depends on the previous rule, the
+        rules then form a chain of dependencies as long as the rules
+    seed : int, optional
+        seed of the random choices of the dependencies
+
+    Returns
+    -------
+    dict
+        rule definitions
+    """
+    generator = random.Random(seed)
+    allowed = list(range(allowed_size))
+    rules = dict()
+    for index in range(count):
+        rule = {
+            'type': int,
+            'exists': True,
+            'allowed': allowed,
+            'default': index % allowed_size,
+        }
+        for context in range(contexts if index else 0):
+            dependencies = generator.sample(range(index), min(fanout, index))
+            if chain and index - 1 not in dependencies:
+                dependencies[0] = index - 1
+            condition = ' and '.join(
+                '{{{0}}} != {1}'.format(item_path(dependency, depth),
+                                        allowed_size + context)
+                for dependency in dependencies)
+            rule[condition] = {
+                'default': (index + context + 1) % allowed_size,
+            }
+        rules[item_path(index, depth)] = rule
+    return rules
+
+
+def make_configs(count, rules_count, depth=2, allowed_size=8, missing=0.25,
+                 seed=0):
+    """Make configs that satisfy the rules of :func:`make_rules`.
+
+    Parameters
+    ----------
+    count : int
+        number of configs
+    rules_count, depth, allowed_size : int, optional
+        arguments of :func:`make_rules`
+    missing : float, optional
+        probability of an item to be missing, its default value is then used
+    seed : int, optional
+        seed of the random values
+
+    Yields
+    ------
+    dict
+        configs, the values are the string representations of the items
+    """
+    generator = random.Random(seed)
+    for _ in range(count):
+        config = dict()
+        for index in range(rules_count):
+            if generator.random() < missing:
+                continue
+            keys = item_path(index, depth).split('/')[1:]
+            section = config
+            for key in keys[:-1]:
+                section = section.setdefault(key, dict())
+            section[keys[-1]] = str(generator.randrange(allowed_size))
+        yield config
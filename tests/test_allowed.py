@@ -0,0 +1,59 @@
+import pickle
+import unittest
+
+from configcontextualchecker.allowed import AllowedValues, SortedArray
+from configcontextualchecker.flat_rule import FlatRule
+
+
+class TestAllowedValues(unittest.TestCase):
+
+    def test_frozenset(self):
+        allowed = AllowedValues(['a', 'b', 'c'])
+        self.assertIsInstance(allowed.container, frozenset)
+        self.assertIn('b', allowed)
+        self.assertNotIn('d', allowed)
+        self.assertNotIn([], allowed)
+        self.assertEqual(allowed, ['a', 'b', 'c'])
+        self.assertEqual(repr(allowed), "['a', 'b', 'c']")
+
+    def test_sorted_array(self):
+        size = AllowedValues.ARRAY_MIN_SIZE
+        for values in (list(range(2 * size, 0, -2)),
+                       [i / 4. for i in range(size)]):
+            allowed = AllowedValues(values)
+            self.assertIsInstance(allowed.container, SortedArray)
+            for value in values:
+                self.assertIn(value, allowed)
+            for value in (-1, 0.1, 0.3, 4 * size + 1):
+                self.assertNotIn(value, allowed)
+
+        # not representable by an array
+        for values in ([2 ** 64] * size, [float('nan')] * size,
+                       [0, 1.] * size):
+            allowed = AllowedValues(values)
+            self.assertIsInstance(allowed.container, frozenset)
+
+    def test_pickle(self):
+        for values in (['a', 'b'], list(range(AllowedValues.ARRAY_MIN_SIZE))):
+            allowed = pickle.loads(pickle.dumps(AllowedValues(values)))
+            self.assertEqual(allowed, values)
+            self.assertIn(values[-1], allowed)
+
+    def test_flat_rule(self):
+        rule = FlatRule({
+            'type': int,
+            'exists': True,
+            'allowed': list(range(AllowedValues.ARRAY_MIN_SIZE)),
+        })
+        self.assertIsInstance(rule.allowed, AllowedValues)
+        self.assertEqual(rule.check('10'), 10)
+
+        rule = FlatRule({
+            'type': str,
+            'exists': True,
+            'allowed': 'a, b',
+        })
+        with self.assertRaises(ValueError) as error:
+            rule.check('c')
+        self.assertEqual(str(error.exception),
+                         "value is not allowed: must be in ['a', 'b']")
@@ -0,0 +1,107 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from configcontextualchecker.batching import MicroBatcher
+from configcontextualchecker.checker import ConfigContextualChecker
+from configcontextualchecker.exceptions import ItemError
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool counting the submitted batches."""
+
+    def __init__(self):
+        super(CountingExecutor, self).__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super(CountingExecutor, self).submit(*args, **kwargs)
+
+
+class TestMicroBatcher(unittest.TestCase):
+
+    RULES = {
+        'key-1': {
+            'type': int,
+            'exists': True,
+            'default': 1,
+        },
+    }
+
+    def setUp(self):
+        self.checker = ConfigContextualChecker(self.RULES)
+        self.executor = CountingExecutor()
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_acheck(self):
+        async def check():
+            return await self.checker.acheck(dict())
+
+        self.assertEqual(asyncio.run(check()), {'key-1': 1})
+        self.checker.batcher.close()
+
+    def test_batches(self):
+        self.checker.batcher = MicroBatcher(self.checker, max_batch_size=4,
+                                            max_wait=10.,
+                                            executor=self.executor)
+
+        async def check():
+            return await asyncio.gather(
+                *[self.checker.acheck({'key-1': i}) for i in range(8)])
+
+        results = asyncio.run(check())
+        self.assertEqual(results, [{'key-1': i} for i in range(8)])
+        self.assertEqual(self.executor.submitted, 2)
+
+    def test_max_wait(self):
+        batcher = MicroBatcher(self.checker, max_batch_size=4, max_wait=0.,
+                               executor=self.executor)
+
+        async def check():
+            return await batcher.check(dict())
+
+        self.assertEqual(asyncio.run(check()), {'key-1': 1})
+        self.assertEqual(self.executor.submitted, 1)
+
+    def test_errors(self):
+        batcher = MicroBatcher(self.checker, executor=self.executor)
+
+        async def check():
+            return await asyncio.gather(batcher.check({'key-1': 'a'}),
+                                        batcher.check({'key-1': 2}),
+                                        return_exceptions=True)
+
+        error, result = asyncio.run(check())
+        self.assertIsInstance(error, TypeError)
+        self.assertEqual(result, {'key-1': 2})
+
+        with self.assertRaises(ValueError):
+            MicroBatcher(self.checker, executor='foo')
+
+    def test_process(self):
+        batcher = MicroBatcher(self.checker, executor='process')
+
+        async def check():
+            return await asyncio.gather(batcher.check(dict()),
+                                        batcher.check({'key-1': None,
+                                                       'key-2': 0}),
+                                        return_exceptions=True)
+
+        try:
+            results = asyncio.run(check())
+        finally:
+            batcher.close()
+        self.assertEqual(results[0], {'key-1': 1})
+        self.assertEqual(results[1], {'key-1': 1, 'key-2': 0})
+
+        rules = {'key-1': {'type': int, 'exists': False}}
+        batcher = MicroBatcher(ConfigContextualChecker(rules),
+                               executor='process')
+        try:
+            with self.assertRaises(ItemError):
+                asyncio.run(batcher.check({'key-1': 0}))
+        finally:
+            batcher.close()
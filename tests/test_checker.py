@@ -1,7 +1,11 @@
+import copy
+import threading
 import unittest
 
 from configcontextualchecker.checker import ConfigContextualChecker
-from configcontextualchecker.exceptions import ItemError
+from configcontextualchecker.convert import ConversionCache
+from configcontextualchecker.exceptions import (ItemError, ParserSyntaxError,
+                                                RuleError)
 
 
 class TestConfigContextualChecker(unittest.TestCase):
@@ -87,3 +91,502 @@ class TestConfigContextualChecker(unittest.TestCase):
 
         buf = {'path': {'to': {'key-1': 1}}}
         checker(buf)
+
+    def test_contextual(self):
+        rules = {
+            'key-1': {
+                'type': str,
+                'exists': True,
+                'allowed': ['a', 'b'],
+            },
+            'key-2': {
+                'type': int,
+                'exists': True,
+                'allowed': [0, 1, 2],
+                'default': 0,
+                '{key-1} == "a"': {
+                    'default': 1,
+                },
+                '{key-1} == "b"': {
+                    'exists': False,
+                },
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+
+        buf = {'key-1': 'a'}
+        checker(buf)
+        self.assertDictEqual(buf, {'key-1': 'a', 'key-2': 1})
+
+        buf = {'key-1': 'b'}
+        checker(buf)
+        self.assertDictEqual(buf, {'key-1': 'b'})
+
+        buf = {'key-1': 'b', 'key-2': 2}
+        self.assertRaises(ItemError, checker, buf)
+
+    def test_plan(self):
+        rules = {
+            'c': {
+                'type': int,
+                'exists': True,
+                'allowed': [0, 1],
+                'default': 0,
+                '{a} == 0': {
+                    'exists': False,
+                },
+            },
+            'b': {
+                'type': int,
+                'exists': True,
+            },
+            'a': {
+                'type': int,
+                'exists': True,
+                'allowed': [0, 1],
+                'default': 0,
+                '{d} == 0': {
+                    'exists': False,
+                },
+            },
+            'd': {
+                'type': int,
+                'exists': True,
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+        names = [rule.name for rule in checker.plan]
+        self.assertEqual(names, ['b', 'd', 'a', 'c'])
+
+        # the order does not depend on the one of the definitions
+        reversed_rules = dict(reversed(list(rules.items())))
+        checker = ConfigContextualChecker(reversed_rules)
+        self.assertEqual([rule.name for rule in checker.plan], names)
+
+        # the graph is created on demand
+        edges = set((u.name, v.name) for u, v in checker.graph.edges())
+        self.assertEqual(edges, {('a', 'c'), ('d', 'a')})
+
+        # circular dependencies
+        rules['d'].update({'allowed': [0, 1], 'default': 0,
+                           '{c} == 0': {'exists': False}})
+        with self.assertRaises(RuleError):
+            ConfigContextualChecker(rules)
+
+    def test_check_many(self):
+        rules = {
+            'key-1': {
+                'type': int,
+                'exists': True,
+                'default': 1,
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+
+        configs = ({'key-1': 'a'} if i % 2 else dict() for i in range(4))
+        results = checker.check_many(configs)
+
+        # lazy evaluation
+        result = next(results)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.index, 0)
+        self.assertDictEqual(result.config, {'key-1': 1})
+
+        result = next(results)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.index, 1)
+        self.assertIsInstance(result.error, TypeError)
+
+        self.assertEqual([r.valid for r in results], [True, False])
+
+    def test_check_parallel(self):
+        rules = {
+            'key-1': {
+                'type': str,
+                'exists': True,
+                'allowed': ['a', 'b'],
+            },
+            'key-2': {
+                'type': int,
+                'exists': True,
+                'allowed': [0, 1],
+                'default': 0,
+                '{key-1} == "a"': {
+                    'default': 1,
+                },
+                '{key-1} == "b" and {key-3} > 0': {
+                    'exists': False,
+                },
+            },
+            'key-3': {
+                'type': str,
+                'exists': True,
+                'default': 'x',
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+
+        configs = [
+            {'key-1': 'a'},
+            {'key-1': 'b', 'key-2': '1'},
+            {'key-1': 'c'},
+            dict(),
+            # bad item type in a conditional expression
+            {'key-1': 'b'},
+        ]
+        configs = [dict(config) for config in configs * 3]
+
+        results = list(checker.check_parallel(configs, processes=2,
+                                              chunksize=2))
+        expected = list(checker.check_many(configs))
+        self.assertIsInstance(expected[4].error, ParserSyntaxError)
+
+        self.assertEqual([r.index for r in results], list(range(15)))
+        for result, expected_result in zip(results, expected):
+            self.assertEqual(result.config, expected_result.config)
+            self.assertEqual(type(result.error), type(expected_result.error))
+            self.assertEqual(str(result.error), str(expected_result.error))
+
+    def test_threads(self):
+        rules = {
+            'key-1': {
+                'type': str,
+                'exists': True,
+            },
+            'key-2': {
+                'type': int,
+                'exists': True,
+                'allowed': [0, 1, 2],
+                'default': 0,
+                '{key-1} == "a"': {
+                    'default': 1,
+                },
+                '{key-1} == "b" or {key-3} > 0': {
+                    'default': 2,
+                },
+            },
+            'key-3': {
+                'type': str,
+                'exists': True,
+                'default': 'x',
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+
+        # the last configs are checked by the conditional expression parser
+        expected = {
+            'a': ({'key-1': 'a', 'key-2': 1, 'key-3': 'x'}, None),
+            'b': ({'key-1': 'b', 'key-3': 'x'}, ParserSyntaxError),
+            'c': ({'key-1': 'c', 'key-3': 'x'}, ParserSyntaxError),
+        }
+        barrier = threading.Barrier(8)
+        failures = list()
+
+        def check(key_1):
+            barrier.wait()
+            for _ in range(200):
+                config = {'key-1': key_1}
+                try:
+                    checker(config)
+                    error = None
+                except ParserSyntaxError as exception:
+                    error = type(exception)
+                if (config, error) != expected[key_1]:
+                    failures.append((config, error))
+
+        threads = [threading.Thread(target=check, args=('abc'[i % 3],))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(failures, [])
+
+    def test_recheck(self):
+        rules = {
+            '/db/host': {
+                'type': str,
+                'exists': True,
+                'default': 'localhost',
+            },
+            '/db/port': {
+                'type': int,
+                'exists': True,
+                'allowed': [0, 80, 8080],
+                'default': 80,
+            },
+            '/db/proxy': {
+                'type': str,
+                'exists': True,
+                'allowed': ['none', 'http'],
+                'default': 'none',
+                '{/db/port} == 8080': {
+                    'default': 'http',
+                },
+            },
+            'name': {
+                'type': str,
+                'exists': True,
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+        config = {'name': 'a'}
+        checker(config)
+
+        # the rules of the other items are not applied
+        applied = list()
+        for rule in checker.plan:
+            def apply(config, values=None, rule=rule, apply=rule.apply):
+                applied.append(rule.name)
+                return apply(config, values)
+            rule.apply = apply
+
+        original = {'name': 'a', 'db': {'port': '8080'}}
+        checker.recheck(config, {'/db/port'}, original)
+        self.assertEqual(applied, ['/db/port', '/db/proxy'])
+        self.assertEqual(config['db'], {'host': 'localhost', 'port': 8080,
+                                        'proxy': 'http'})
+        self.assertEqual(original, {'name': 'a', 'db': {'port': '8080'}})
+
+        # changed section
+        del applied[:]
+        checker.recheck(config, {'/db'}, {'name': 'a', 'db': dict()})
+        self.assertEqual(applied, ['/db/host', '/db/port', '/db/proxy'])
+        self.assertEqual(config['db'], {'host': 'localhost', 'port': 80,
+                                        'proxy': 'none'})
+
+        # changed item below a checked item
+        del applied[:]
+        with self.assertRaises(TypeError):
+            checker.recheck(config, {'/name/a'}, {'name': {'a': 'b'}})
+        self.assertEqual(applied, ['name'])
+
+    def test_recheck_full(self):
+        # the result of a rechecking is the one of a full checking
+        rules = {
+            '/db/port': {
+                'type': int,
+                'exists': True,
+                'default': 80,
+            },
+            '/db/proxy': {
+                'type': str,
+                'exists': True,
+                'allowed': ['none', 'http'],
+                'default': 'none',
+                '{/db/port} == 8080': {
+                    'default': 'http',
+                },
+            },
+            'a': {
+                'type': int,
+                'exists': True,
+                'allowed': '[0, 9]',
+                'default': 1,
+            },
+            'b': {
+                'type': int,
+                'exists': True,
+                'allowed': '[0, 9]',
+                'default': 0,
+                '{a} == 2': {
+                    'exists': False,
+                },
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+        cases = [
+            # dependent default value
+            ({'db': {'port': 80}}, {'db': {'port': 8080}}, {'/db/port'}),
+            ({'db': {'port': 8080}}, {'db': {'port': 80}}, {'/db/port'}),
+            ({'db': {'port': 8080, 'proxy': 'none'}}, {'db': {'port': 8080}},
+             {'/db/proxy'}),
+            # item that shall not exist in a context
+            ({'db': {}, 'a': 3, 'b': 4}, {'db': {}, 'a': 2}, {'/a', '/b'}),
+            ({'db': {}, 'a': 2}, {'db': {}, 'a': 3, 'b': 4}, {'/a', '/b'}),
+            ({'db': {}}, {'db': {}, 'a': 2}, {'/a'}),
+        ]
+        for previous, original, changed in cases:
+            config = copy.deepcopy(previous)
+            checker(config)
+            checker.recheck(config, changed, original)
+            expected = copy.deepcopy(original)
+            checker(expected)
+            self.assertEqual(config, expected, (previous, original))
+
+    def test_cache(self):
+        rules = {
+            'key-1': {
+                'type': int,
+                'exists': True,
+                'allowed': [1, 2],
+            },
+            'key-2': {
+                'type': int,
+                'exists': True,
+                'allowed': [1, 2],
+            },
+            'key-3': {
+                'type': int,
+                'exists': True,
+            },
+        }
+        cache = ConversionCache()
+        checker = ConfigContextualChecker(rules, cache)
+        config = {'key-1': '1', 'key-2': '1', 'key-3': '1'}
+        checker(config)
+        self.assertEqual(config, {'key-1': 1, 'key-2': 1, 'key-3': 1})
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # shared cache and compiled checker
+        compiled = ConfigContextualChecker(rules, cache).compile()
+        compiled({'key-1': '2', 'key-2': '1', 'key-3': '1'})
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+
+        with self.assertRaises(ValueError):
+            compiled({'key-1': '3', 'key-2': '1', 'key-3': '1'})
+
+    def test_cache_forbidden(self):
+        # the contextual rule only differs from the base rule by exists
+        rules = {
+            'k1': {
+                'type': str,
+                'exists': True,
+                'allowed': ['a', 'b'],
+            },
+            'k2': {
+                'type': int,
+                'exists': True,
+                'allowed': [1, 2, 3],
+                'default': 1,
+                '{k1} == "b"': {
+                    'exists': False,
+                },
+            },
+        }
+        checker = ConfigContextualChecker(rules, ConversionCache())
+        checker({'k1': 'a', 'k2': '2'})
+        with self.assertRaises(ItemError):
+            checker({'k1': 'b', 'k2': '2'})
+
+    def test_report(self):
+        rules = {
+            'mode': {
+                'type': str,
+                'exists': True,
+                'allowed': ['a', 'b'],
+            },
+            'level': {
+                'type': int,
+                'exists': True,
+                'default': 1,
+            },
+            'size': {
+                'type': int,
+                'exists': True,
+                'allowed': '[0, 10]',
+                'default': 1,
+                '{mode} == "a"': {
+                    'allowed': [1, 2],
+                },
+            },
+            'name': {
+                'type': str,
+                'exists': True,
+                'allowed': ['x', 'y'],
+                'default': 'x',
+                '{size} > 1': {
+                    'default': 'y',
+                },
+            },
+            'other': {
+                'type': int,
+                'exists': False,
+            },
+        }
+        checker = ConfigContextualChecker(rules)
+
+        config = {'mode': 'a', 'size': '2'}
+        report = checker.report(config)
+        self.assertTrue(report.valid)
+        self.assertEqual(report, ((), ()))
+        self.assertEqual(config, {'mode': 'a', 'size': 2, 'level': 1,
+                                  'name': 'y'})
+
+        # every violation in a single pass
+        config = {'mode': 'a', 'level': 'x', 'size': '3', 'other': 1}
+        report = checker.report(config)
+        self.assertFalse(report.valid)
+        self.assertEqual([violation[:3] for violation in report.violations],
+                         [('level', None, 'TypeError'),
+                          ('other', None, 'ItemError'),
+                          ('size', '{mode} == "a"', 'ValueError')])
+        self.assertIsInstance(report.violations[2].error, ValueError)
+        # name depends on the violated size
+        self.assertEqual(report.skipped, ('name',))
+        self.assertEqual(config, {'mode': 'a', 'level': 'x', 'size': '3',
+                                  'other': 1})
+
+        # rules depending on skipped rules are skipped
+        config = {'mode': 'c', 'size': 3}
+        report = checker.report(config)
+        self.assertEqual([violation.rule for violation in report.violations],
+                         ['mode'])
+        self.assertEqual(report.skipped, ('size', 'name'))
+        self.assertEqual(config, {'mode': 'c', 'size': 3, 'level': 1})
+
+    def test_shared_conditions(self):
+        rule_def = {
+            'type': int,
+            'exists': True,
+            'allowed': [0, 1],
+            'default': 0,
+            '{/env} == "prod" and {/level} > 1': {
+                'default': 1,
+            },
+        }
+        rules = dict(('/key_{0}'.format(i), rule_def) for i in range(10))
+        rules['/env'] = {'type': str, 'exists': True}
+        rules['/level'] = {'type': int, 'exists': True, 'default': 2}
+        checker = ConfigContextualChecker(rules)
+
+        # the condition is evaluated once
+        shared = checker.plan[-1].cond_exps[0][0].tree
+        evaluations = list()
+
+        class Counter(object):
+            def evaluate(self, values):
+                evaluations.append(None)
+                return node.evaluate(values)
+
+        node, shared.node = shared.node, Counter()
+        config = {'env': 'prod'}
+        checker(config)
+        self.assertEqual(len(evaluations), 1)
+        self.assertEqual(config['key_9'], 1)
+        checker({'env': 'test'})
+        self.assertEqual(len(evaluations), 2)
+
+        # a shared value is dropped when a later rule sets a section of its
+        # item, as the compiled checker evaluates it again
+        rule_def = {
+            'type': int,
+            'exists': True,
+            'allowed': [0, 1],
+            'default': 0,
+            '{/b} == 1': {
+                'default': 1,
+            },
+        }
+        rules = {
+            '/b': {'type': int, 'exists': True},
+            '/a': rule_def,
+            '/b/x': {'type': int, 'exists': True, 'default': 5},
+            '/z': rule_def,
+        }
+        checker = ConfigContextualChecker(rules)
+        self.assertEqual([rule.name for rule in checker.plan],
+                         ['/b', '/a', '/b/x', '/z'])
+        for check in (checker, checker.compile()):
+            self.assertRaises(KeyError, check, {'b': 1})
@@ -0,0 +1,105 @@
+import copy
+import unittest
+
+from configcontextualchecker.checker import ConfigContextualChecker
+from configcontextualchecker.exceptions import ItemError
+
+
+class TestCompiledChecker(unittest.TestCase):
+
+    RULES = {
+        'key-1': {
+            'type': str,
+            'exists': True,
+            'allowed': ['a', 'b', 'c'],
+        },
+        '/x/y': {
+            'type': int,
+            'exists': True,
+            'default': 1,
+        },
+        '/s/key-2': {
+            'type': int,
+            'exists': True,
+            'allowed': ']0,+inf]',
+            'default': 1,
+            '{key-1} == "a" and {/x/y} in (1, 2.)': {
+                'default': 2,
+            },
+            '{key-1} == "b"': {
+                'exists': False,
+            },
+        },
+        'key-3': {
+            'type': float,
+            'exists': False,
+            'allowed': '[0., 10.]',
+            'default': 0.,
+            '{/s/key-2} > 3 or not {key-1} == "c"': {
+                'exists': True,
+                'default': 1.5,
+            },
+        },
+    }
+
+    def setUp(self):
+        self.checker = ConfigContextualChecker(self.RULES)
+        self.compiled = self.checker.compile()
+
+    def checkSame(self, config):
+        """Check the compiled checker behaves as the checker does."""
+        expected = copy.deepcopy(config)
+        result = copy.deepcopy(config)
+        try:
+            self.checker(expected)
+        except Exception as error:
+            with self.assertRaises(type(error)) as compiled_error:
+                self.compiled(result)
+            self.assertEqual(str(compiled_error.exception), str(error))
+        else:
+            self.compiled(result)
+            self.assertEqual(result, expected)
+
+    def test_source(self):
+        source = self.compiled.source
+        self.assertTrue(source.startswith('def check(config):'))
+        for name in self.RULES:
+            self.assertIn('# {0}'.format(name), source)
+
+    def test_same_results(self):
+        test_data = (
+            {'key-1': 'a'},
+            {'key-1': 'a', 'x': {'y': 2}},
+            {'key-1': 'a', 'x': {'y': 3}, 's': {'key-2': 4}},
+            {'key-1': 'b'},
+            {'key-1': 'c', 'key-3': 2.},
+            {'key-1': 'c', 's': {'key-2': 5}},
+            {'key-1': 'c', 's': {'key-2': '5'}, 'key-3': '2.'},
+            {'key-1': 'a', 'x': 0},
+            {'key-1': 'a', 's': 'b'},
+        )
+
+        for config in test_data:
+            self.checkSame(config)
+
+    def test_same_errors(self):
+        test_data = (
+            # mandatory
+            dict(),
+            # type
+            {'key-1': 0},
+            # allowed
+            {'key-1': 'd'},
+            {'key-1': 'a', 's': {'key-2': 0}},
+            {'key-1': 'c', 'key-3': 11.},
+            # forbidden
+            {'key-1': 'b', 's': {'key-2': 1}},
+            # conditional expression items of bad types
+            {'key-1': 'a', 'x': {'y': '1'}},
+        )
+
+        for config in test_data:
+            self.checkSame(config)
+
+        with self.assertRaises(ItemError):
+            self.compiled({'key-1': 'b', 's': {'key-2': 1}})
@@ -0,0 +1,146 @@
+import unittest
+
+from configcontextualchecker.condexp import CondExp, Shared, iter_shared, share
+from configcontextualchecker.condexp_parser import Parser
+from configcontextualchecker.exceptions import ParserSyntaxError
+
+
+class TestCondExp(unittest.TestCase):
+
+    CONFIG = {
+        'a': 0,
+        'b': 1,
+        'c': 2,
+        'w': 0.,
+        'd': 'e',
+        't': True,
+        'f': False,
+        'g': {'h': True},
+        }
+
+    def setUp(self):
+        self.parser = Parser()
+        self.parser.config = self.CONFIG
+
+    def checkEqual(self, data):
+        """Check the compiled expression evaluates as the parser does."""
+        expected = self.parser.parse(data)
+        result = CondExp(data).evaluate(self.CONFIG)
+        self.assertEqual(result, expected)
+
+    def checkRaises(self, data):
+        """Check the compiled expression raises as the parser does."""
+        with self.assertRaises(ParserSyntaxError) as expected:
+            self.parser.parse(data)
+        with self.assertRaises(ParserSyntaxError) as error:
+            CondExp(data).evaluate(self.CONFIG)
+        self.assertEqual(str(error.exception), str(expected.exception))
+
+    def test_evaluate(self):
+        test_data = (
+            '{a} in (0, 1)',
+            '{a} not in (1, {b})',
+            '{d} in ("e", "f")',
+            '{a} < {b} and {b} < {c}',
+            '({a} in (0, 1) or {b} > 1) and {c} != 2',
+            '{w} == {a}',
+            '{d} != "e"',
+            'not {t} or {f}',
+            '{t} and not {f}',
+            '{/g/h}',
+            'False or not True and True',
+        )
+
+        for data in test_data:
+            self.checkEqual(data)
+
+    def test_reuse(self):
+        cond_exp = CondExp('{a} == 0')
+        self.assertTrue(cond_exp.evaluate({'a': 0}))
+        self.assertFalse(cond_exp.evaluate({'a': 1}))
+        self.assertTrue(cond_exp.evaluate({'a': 0.}))
+
+    def test_short_circuit(self):
+        # the operands that are not evaluated raise the errors of the parser
+        # as well
+        test_data = (
+            '{f} and {/foo}',
+            '{t} or {/foo}',
+            '{a} == 1 and {d} > 1',
+            '{a} == 0 or {d} > 1',
+            '{a} == "c" and {b} == "c"',
+            '{d} == "x" and {a} == {d}',
+            '{f} and "a" == 1',
+        )
+        for data in test_data:
+            self.checkRaises(data)
+
+        test_data = (
+            '{a} == 1 and {d} == "x"',
+            '{a} == 0 or {d} == {d}',
+        )
+        for data in test_data:
+            self.checkEqual(data)
+
+    def test_errors(self):
+        test_data = (
+            # syntax errors
+            '0 in 0',
+            '0 < "a"',
+            # missing item
+            '{/foo} == 0',
+            # bad item types
+            '{d} < 1',
+            '{d} == {a}',
+            '{a} and {t}',
+            '{t} in (0, 1)',
+        )
+
+        for data in test_data:
+            self.checkRaises(data)
+
+    def test_share(self):
+        strings = (
+            '({a} in (0, 1) or {b} > 1) and {c} != 2',
+            '{c} != 2 and ({a} in (0, 1) or {b} > 1)',
+            '{a} in (0, 1) or {b} > 1',
+            '{d} == "e"',
+            '{d} == "e"',
+            '{w} == 0',
+            '{w} == 0.',
+        )
+        cond_exps = [CondExp(string) for string in strings]
+        trees = share([cond_exp.tree for cond_exp in cond_exps])
+
+        # the identical expressions are one node, the shared ones are
+        # wrapped once
+        self.assertIs(trees[3], trees[4])
+        self.assertIsInstance(trees[3], Shared)
+        self.assertIs(trees[0].right, trees[1].left)
+        self.assertIs(trees[0].left, trees[2])
+        self.assertIsInstance(trees[2], Shared)
+        self.assertNotIsInstance(trees[0], Shared)
+        self.assertEqual(len(list(iter_shared(trees[0]))), 2)
+        # literals of different types are different
+        self.assertIsNot(trees[5], trees[6])
+        self.assertNotIsInstance(trees[5], Shared)
+
+        for cond_exp, tree in zip(cond_exps, trees):
+            expected = cond_exp.evaluate(self.CONFIG)
+            cond_exp.tree = tree
+            self.assertEqual(cond_exp.evaluate(self.CONFIG), expected)
+
+        # the shared values are kept with the values of the items
+        values = {'a': 5, 'b': 0, 'c': 3}
+        self.assertFalse(trees[0].evaluate(values))
+        values['b'] = 2
+        self.assertFalse(trees[2].evaluate(values))
+        del values[trees[2]]
+        self.assertTrue(trees[2].evaluate(values))
+
+        # shared again, the same
+        again = share(trees)
+        self.assertIs(again[3], again[4])
+        self.assertEqual([type(tree) for tree in again],
+                         [type(tree) for tree in trees])
+        self.assertEqual(len(list(iter_shared(again[0]))), 2)
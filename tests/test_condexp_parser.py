@@ -1,9 +1,14 @@
 import unittest
 import os
 
-from configcontextualchecker.condexp_parser import Parser
+from configcontextualchecker.condexp_parser import Parser, PlyParser
 from configcontextualchecker.exceptions import ParserSyntaxError
 
+try:
+    import ply
+except ImportError:
+    ply = None
+
 
 class ErrorChecking(object):
     """Mixin class for error checking of exceptions."""
@@ -201,3 +206,12 @@ class TestExpressionParser(unittest.TestCase, ErrorChecking):
         }
 
         self.checkErrors(test_data)
+
+
+@unittest.skipIf(ply is None, 'PLY is not installed')
+class TestPlyExpressionParser(TestExpressionParser):
+    """The reference parser passes the same tests."""
+
+    def setUp(self):
+        self.parser = PlyParser()
+        self.parser.config = self.CONFIG
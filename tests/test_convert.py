@@ -0,0 +1,120 @@
+import pickle
+import unittest
+
+from configcontextualchecker.convert import (ConversionCache, allowed_key,
+                                             convert, type_string)
+from configcontextualchecker.range import Range
+
+
+class TestConvert(unittest.TestCase):
+
+    def test_type_string(self):
+        data = {
+            '0': int,
+            ' -1_000 ': int,
+            '0.': float,
+            '1e3': float,
+            'inf': float,
+            'a': str,
+            '': str,
+            '1 2': str,
+            'int': type,
+            ' float ': type,
+            'str': type,
+            'True': bool,
+            'False': bool,
+            '__import__("os")': str,
+        }
+
+        for datum, expected in data.items():
+            self.assertEqual(type_string(datum), expected)
+
+        self.assertEqual(type_string(0), int)
+
+    def test_convert(self):
+        data = (
+            ('0', int, 0),
+            (' 12 ', int, 12),
+            ('1.5', float, 1.5),
+            ('-1e3', float, -1000.),
+            ('0', str, '0'),
+            ('True', bool, True),
+            ('False', bool, False),
+            ('int', type, int),
+            ('str', type, str),
+        )
+
+        for string, type_, expected in data:
+            result = convert(string, type_)
+            self.assertEqual(result, expected)
+            self.assertIs(type(result), type_)
+
+    def test_bad_type(self):
+        data = (
+            ('1.5', int),
+            ('1', float),
+            ('int', float),
+            ('true', bool),
+            ('0', bool),
+            ('list', type),
+            ('', int),
+            (1, str),
+            (1., int),
+            ('[1]', list),
+        )
+
+        for value, type_ in data:
+            with self.assertRaises(TypeError):
+                convert(value, type_)
+
+        with self.assertRaises(TypeError) as error:
+            convert('1', float)
+        self.assertEqual(str(error.exception),
+                         "bad item type: expected {0}, found {1}".format(
+                             float, int))
+
+
+class TestConversionCache(unittest.TestCase):
+
+    def test_lookup(self):
+        cache = ConversionCache(maxsize=2)
+        self.assertEqual(cache.lookup('a', int, '1'), 1)
+        self.assertEqual(cache.lookup('b', int, '2'), 2)
+        self.assertEqual(cache.lookup('a', int, '3'), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # the least recently used value is evicted
+        self.assertEqual(cache.lookup('c', int, '4'), 4)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.lookup('a', int, '5'), 1)
+        self.assertEqual(cache.lookup('b', int, '6'), 6)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+        # errors are not cached
+        with self.assertRaises(ValueError):
+            cache.lookup('d', int, 'x')
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_unbounded(self):
+        cache = ConversionCache(maxsize=None)
+        for i in range(10):
+            cache.lookup(i, str, i)
+        self.assertEqual(len(cache), 10)
+
+    def test_pickle(self):
+        cache = ConversionCache(maxsize=3)
+        cache.lookup('a', int, '1')
+        cache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(cache.maxsize, 3)
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_allowed_key(self):
+        self.assertIsNone(allowed_key(None))
+        self.assertEqual(allowed_key([1, 2]), (1, 2))
+        self.assertEqual(allowed_key(Range(0, True, 1, False)),
+                         allowed_key(Range(0, True, 1, False)))
+        self.assertNotEqual(allowed_key(Range(0, True, 1, False)),
+                            allowed_key(Range(0, False, 1, False)))
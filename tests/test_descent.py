@@ -0,0 +1,108 @@
+import contextlib
+import io
+import random
+import unittest
+
+from configcontextualchecker.condexp import Compiler, PlyCompiler, _Mismatch
+from configcontextualchecker.condexp_parser import Parser, PlyParser
+from configcontextualchecker.descent import Lexer
+from configcontextualchecker.range.range_parser import (PlyRangeParser,
+                                                        RangeParser)
+
+try:
+    import ply
+except ImportError:
+    ply = None
+
+
+def _dump(node):
+    """Convert a tree of nodes to comparable lists."""
+    if isinstance(node, (list, tuple)):
+        return [_dump(child) for child in node]
+    if hasattr(node, '__slots__'):
+        return [type(node).__name__] + [
+            _dump(getattr(node, name)) for name in node.__slots__
+            if not name.startswith('_')]
+    if hasattr(node, 'string'):
+        return node.string
+    return node
+
+
+class TestDescentParsers(unittest.TestCase):
+    """The hand-written parsers are checked against the PLY parsers."""
+
+    CONFIG = {
+        'a': 0,
+        'b': 1,
+        'w': 0.5,
+        'd': 'e',
+        't': True,
+        'f': False,
+    }
+
+    CONDEXP_TOKENS = (
+        'not', 'and', 'or', 'in', '(', ')', ',', '==', '!=', '<', '>', '<=',
+        '>=', '1', '2.5', '-3', '+4', '1.e3', '"x"', '"a\\""', 'True', 'False',
+        '{a}', '{w}', '{d}', '{t}', '{f}', '{missing}', '$', '=', ' ', '',
+    )
+
+    RANGE_TOKENS = (
+        '[', ']', ',', '-inf', '+inf', '1', '2.5', '-3', '+4', '1.', 'x', ' ',
+        '',
+    )
+
+    @staticmethod
+    def parse(parser, string, convert=_dump):
+        """Parse a string, return the result or the error with the output."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            try:
+                result = convert(parser.parse(string))
+            except (SyntaxError, _Mismatch) as error:
+                result = (type(error), str(error))
+        return result, output.getvalue()
+
+    def checkSame(self, parsers, tokens, convert=_dump):
+        """Check the parsers on strings of random tokens."""
+        generator = random.Random(0)
+        for _ in range(2000):
+            string = ' '.join(generator.choice(tokens)
+                              for _ in range(generator.randint(0, 7)))
+            expected = self.parse(parsers[1], string, convert)
+            self.assertEqual(self.parse(parsers[0], string, convert),
+                             expected, string)
+
+    @unittest.skipIf(ply is None, 'PLY is not installed')
+    def test_parser(self):
+        parsers = Parser(), PlyParser()
+        for parser in parsers:
+            parser.config = self.CONFIG
+        self.checkSame(parsers, self.CONDEXP_TOKENS)
+
+    @unittest.skipIf(ply is None, 'PLY is not installed')
+    def test_compiler(self):
+        self.checkSame((Compiler(), PlyCompiler()), self.CONDEXP_TOKENS)
+
+    @unittest.skipIf(ply is None, 'PLY is not installed')
+    def test_range_parser(self):
+        def convert(range_):
+            return (range_.lower.value, range_.lower._open,
+                    range_.upper.value, range_.upper._open)
+
+        self.checkSame((RangeParser(), PlyRangeParser()), self.RANGE_TOKENS,
+                       convert)
+
+    def test_lexer(self):
+        lexer = Lexer(Parser(), '{a}$not in')
+        # the items are not found in an empty config
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            token = lexer.token()
+        # the character after a missing item is skipped as well
+        self.assertEqual(output.getvalue(), 'key path "a" does not exist\n')
+        self.assertEqual((token.type, token.value, token.lexpos),
+                         ('NOT', 'not', 4))
+        # the tokens are read on demand
+        self.assertEqual(lexer.lexpos, 7)
+        self.assertEqual(lexer.token().type, 'IN')
+        self.assertIsNone(lexer.token())
@@ -1,6 +1,7 @@
 import unittest
 
-from configcontextualchecker.dict_path import get_from_path, set_from_path
+from configcontextualchecker.dict_path import (get_from_path, set_from_path,
+                                               Path, PathTrie)
 
 
 class TestDictPath(unittest.TestCase):
@@ -69,3 +70,59 @@ class TestDictPath(unittest.TestCase):
         result = {'a': {'d': None}}
         set_from_path(result, path, 0)
         self.assertEqual(result, expected)
+
+    def test_path(self):
+        # get behaves like get_from_path
+        dicts = (
+            {'a': 0},
+            {'a': {'b': {'c': 0}}},
+            {'a': 0, 'b': 'c'},
+            dict(),
+        )
+        for path in ('a', '/a', '/a/b/c', '/b/c'):
+            for dict_ in dicts:
+                self.assertEqual(Path(path).get(dict_),
+                                 get_from_path(dict_, path))
+
+        # set behaves like set_from_path
+        dicts = (
+            dict(),
+            {'a': None},
+            {'a': {'b': {'c': 1}}},
+            {'a': {'d': None}},
+        )
+        for path in ('a', '/a', '/a/b/c'):
+            for dict_ in dicts:
+                expected = dict(dict_)
+                set_from_path(expected, path, 0)
+                result = dict(dict_)
+                Path(path).set(result, 0)
+                self.assertEqual(result, expected)
+
+        self.assertEqual(Path('/a/b').keys, ('a', 'b'))
+        self.assertEqual(Path('/a/b'), Path('/a/b'))
+        self.assertNotEqual(Path('/a/b'), Path('/a'))
+
+    def test_path_trie(self):
+        paths = [Path(p) for p in ('a', '/a', '/a/b', '/a/b/c', '/a/d', '/e')]
+        trie = PathTrie(paths)
+
+        dicts = (
+            dict(),
+            {'a': 0},
+            {'a': {'b': {'c': 0}, 'd': 1}, 'e': 2},
+            {'a': {'b': 'c'}},
+        )
+        for dict_ in dicts:
+            expected = dict((p.string, p.get(dict_)) for p in paths)
+            self.assertEqual(trie.snapshot(dict_), expected)
+
+        # refresh after setting values
+        dict_ = {'a': {'b': 0, 'd': 1}}
+        values = trie.snapshot(dict_)
+        for string, value in (('/a/b/c', 2), ('/a/d', 3), ('a', 4)):
+            path = Path(string)
+            created = path.set(dict_, value)
+            trie.refresh(values, dict_, path, created)
+            expected = dict((p.string, p.get(dict_)) for p in paths)
+            self.assertEqual(values, expected)
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import sys
 
@@ -185,3 +186,26 @@ class TestRangeParser(unittest.TestCase, ErrorChecking):
         }
 
         self.checkErrors(data)
+
+    def test_Range_equality(self):
+        range_ = Range(0, True, 2, False)
+        self.assertEqual(range_, Range(0, True, 2, False))
+        self.assertEqual(hash(range_), hash(Range(0, True, 2, False)))
+        self.assertNotEqual(range_, Range(0, False, 2, False))
+        self.assertNotEqual(range_, Range(0., True, 2., False))
+        self.assertNotEqual(range_, str(range_))
+
+        # the openness of a missing bound does not matter
+        self.assertEqual(Range(None, True, 2, False),
+                         Range(None, False, 2, False))
+
+        # deduplication
+        ranges = {Range(0, True, None, True), Range(0, True, None, False),
+                  Range(0, False, None, True)}
+        self.assertEqual(len(ranges), 2)
+
+    def test_Range_pickle(self):
+        range_ = pickle.loads(pickle.dumps(Range(0., True, 2., False)))
+        self.assertEqual(range_, Range(0., True, 2., False))
+        self.assertIn(2., range_)
+        self.assertNotIn(0., range_)
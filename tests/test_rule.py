@@ -69,3 +69,46 @@ class TestRuleParser(unittest.TestCase):
 
         with self.assertRaises(RuleError):
             Rule('', rule_def)
+
+    def test_dispatch(self):
+        rule_def = {
+            'exists': True,
+            'type': int,
+            'allowed': '[0, 10]',
+            'default': 0,
+            '{mode} == "a"': {'default': 1},
+            '"b" == {mode}': {'default': 2},
+            '{mode} in ("a", "c", "d")': {'default': 3},
+            '{mode} == 1': {'default': 4},
+            '{mode} in (1, 2.0)': {'default': 5},
+            '{other} == "a"': {'default': 6},
+            '{mode} == "e"': {'default': 7},
+            '{mode} == "f"': {'default': 8},
+        }
+        rule = Rule('key', rule_def)
+        # the string, number and other tests are grouped
+        self.assertEqual([len(case[0].cases) if case[1] is None else 1
+                          for case in rule._cases], [3, 2, 1, 2])
+
+        for mode in ('a', 'b', 'c', 'd', 'e', 'f', 'g', 1, 1.0, 2, 3, True,
+                     None):
+            for other in ('a', 'b'):
+                config = {'mode': mode, 'other': other}
+
+                # selected as the expressions are evaluated in order
+                expected = None, rule.base_rule
+                error = None
+                try:
+                    for cond_exp, ctx_rule in rule.cond_exps:
+                        if cond_exp.evaluate(config):
+                            expected = cond_exp.string, ctx_rule
+                            break
+                except Exception as exception:
+                    error = type(exception)
+
+                if error is None:
+                    self.assertEqual(rule.select(config), expected)
+                    self.assertEqual(rule.apply(config),
+                                     expected[1].default)
+                else:
+                    self.assertRaises(error, rule.select, config)
@@ -0,0 +1,119 @@
+import copy
+import math
+import os
+import timeit
+import unittest
+
+from configcontextualchecker.checker import ConfigContextualChecker
+from configcontextualchecker.rule import Rule
+
+from tests.synthetic import item_path, make_configs, make_rules
+
+
+def growth_exponent(sizes, function):
+    """Estimate the exponent of the growth of the duration of a function.
+
+    Parameters
+    ----------
+    sizes : list of int
+        sizes of the problems
+    function : callable
+        function of a size returning a callable to time, that solves the
+        problem of that size, and a callable or None that prepares each
+        timing of it without being timed
+
+    Returns
+    -------
+    float
+        slope of the least squares fit of the logarithms of the durations
+        against the ones of the sizes: 1 for a linear growth, 2 for a
+        quadratic one
+    """
+    points = list()
+    for size in sizes:
+        # the best duration is the least disturbed, the garbage collector is
+        # disabled by timeit
+        timed, setup = function(size)
+        duration = min(timeit.Timer(timed, setup or 'pass').repeat(3, 1))
+        points += [(math.log(size), math.log(duration))]
+    x_mean = sum(x for x, _ in points) / len(points)
+    y_mean = sum(y for _, y in points) / len(points)
+    return sum((x - x_mean) * (y - y_mean) for x, y in points) / \
+        sum((x - x_mean) ** 2 for x, _ in points)
+
+
+class TestSynthetic(unittest.TestCase):
+
+    def test_make_rules(self):
+        rules = make_rules(100, depth=3, fanout=3, contexts=2)
+        self.assertEqual(len(rules), 100)
+        self.assertIn('/section_1/section_0/key_1', rules)
+        self.assertEqual(item_path(17, 3), '/section_1/section_0/key_17')
+
+        rule = Rule(item_path(50, 3), rules[item_path(50, 3)])
+        self.assertEqual(len(rule.cond_exps), 2)
+        self.assertIn(item_path(49, 3), rule.dependencies)
+        self.assertEqual(len(rule.dependencies), 6)
+
+        # the rules form a chain of dependencies
+        checker = ConfigContextualChecker(rules)
+        self.assertEqual(len(checker.impacted([item_path(0, 3)])), 100)
+
+    def test_make_configs(self):
+        rules = make_rules(50, depth=3, contexts=2)
+        checker = ConfigContextualChecker(rules)
+        for config in make_configs(10, 50, depth=3):
+            checker(config)
+            self.assertEqual(sum(len(section) for sections in config.values()
+                                 for section in sections.values()), 50)
+
+
+@unittest.skipUnless(os.environ.get('SCALING_TESTS'),
+                     'set SCALING_TESTS to run the slow scaling tests')
+class TestScaling(unittest.TestCase):
+    """The durations of the creation of a checker and of the checking shall
+    grow linearly with the number of rules, a quadratic growth is caught.
+    """
+
+    # the exponent of a linear growth is about 1, or a bit more since the
+    # memory accesses get slower as the data outgrows the processor caches,
+    # the margin is for the noise of the timings: a quadratic growth gives
+    # about 2 once it dominates
+    MAX_EXPONENT = 1.6
+
+    SIZES = (250, 500, 1000, 2000)
+
+    def checkGrowth(self, sizes, **kwargs):
+        def create(size):
+            rules = make_rules(size, **kwargs)
+            return lambda: ConfigContextualChecker(rules), None
+
+        def check(size):
+            checker = ConfigContextualChecker(make_rules(size, **kwargs))
+            configs = list(make_configs(10, size, kwargs.get('depth', 2)))
+            copies = list()
+
+            def copy_configs():
+                # the checking converts the values in place, each timing
+                # checks fresh copies
+                copies[:] = copy.deepcopy(configs)
+
+            def check_configs():
+                for config in copies:
+                    checker(config)
+            return check_configs, copy_configs
+
+        for function in (create, check):
+            exponent = growth_exponent(sizes, function)
+            self.assertLess(exponent, self.MAX_EXPONENT,
+                            '{0} with {1}'.format(function.__name__, kwargs))
+
+    def test_flat(self):
+        self.checkGrowth(self.SIZES, contexts=0)
+
+    def test_chain(self):
+        self.checkGrowth(self.SIZES, depth=2, fanout=1, contexts=1)
+
+    def test_dependencies(self):
+        self.checkGrowth((400, 800, 1600), depth=6, fanout=4, contexts=3,
+                         allowed_size=64)
@@ -0,0 +1,116 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from configcontextualchecker.checker import ConfigContextualChecker
+from configcontextualchecker.exceptions import ItemError
+from configcontextualchecker.stats import prometheus_text, write_prometheus
+
+
+class TestStats(unittest.TestCase):
+
+    RULES = {
+        'key': {
+            'type': int,
+            'exists': True,
+            'allowed': '[0, 10]',
+            'default': 0,
+        },
+        'name': {
+            'type': str,
+            'exists': True,
+            'allowed': ['a', 'b'],
+            'default': 'a',
+            '{key} > 5': {
+                'default': 'b',
+            },
+        },
+    }
+
+    def test_disabled(self):
+        checker = ConfigContextualChecker(self.RULES)
+        checker({'key': '1'})
+        self.assertEqual(checker.stats(), dict())
+
+    def test_stats(self):
+        checker = ConfigContextualChecker(self.RULES)
+        checker.instrument()
+        checker({'key': '1'})
+        checker({'key': 7})
+        self.assertRaises(ValueError, checker, {'key': '11'})
+        self.assertRaises(TypeError, checker, {'key': 'a'})
+
+        stats = checker.stats()
+        self.assertEqual(sorted(stats), ['key', 'name'])
+        self.assertEqual(stats['key'].calls, 4)
+        self.assertEqual(stats['key'].selected, {None: 2})
+        self.assertEqual(stats['key'].conversions, 1)
+        self.assertEqual(stats['key'].errors, {'ValueError': 1,
+                                               'TypeError': 1})
+        self.assertGreater(stats['key'].total_time, 0)
+        self.assertGreaterEqual(stats['key'].total_time,
+                                stats['key'].max_time)
+
+        self.assertEqual(stats['name'].calls, 2)
+        self.assertEqual(stats['name'].selected, {None: 1, '{key} > 5': 1})
+        self.assertEqual(stats['name'].conversions, 0)
+        self.assertEqual(stats['name'].errors, dict())
+
+        # the stats are copies
+        checker({'key': 2})
+        self.assertEqual(stats['key'].calls, 4)
+        self.assertEqual(checker.stats()['key'].calls, 5)
+
+        # the same checking
+        config = {'key': '8'}
+        checker(config)
+        self.assertEqual(config, {'key': 8, 'name': 'b'})
+
+        # reset, then dropped
+        checker.instrument()
+        self.assertEqual(checker.stats()['key'].calls, 0)
+        checker.instrument(False)
+        checker({'key': 2})
+        self.assertEqual(checker.stats(), dict())
+
+    def test_pickle(self):
+        checker = ConfigContextualChecker(self.RULES)
+        checker.instrument()
+        checker({'key': 2})
+        checker = pickle.loads(pickle.dumps(checker))
+        self.assertEqual(checker.stats(), dict())
+
+    def test_prometheus(self):
+        checker = ConfigContextualChecker({
+            'a"b': {
+                'type': int,
+                'exists': True,
+            },
+        })
+        checker.instrument()
+        checker({'a"b': 1})
+        self.assertRaises(ItemError, checker, dict())
+
+        text = prometheus_text(checker.stats())
+        lines = text.splitlines()
+        self.assertIn('# TYPE configcontextualchecker_rule_calls_total '
+                      'counter', lines)
+        self.assertIn('configcontextualchecker_rule_calls_total'
+                      '{rule="a\\"b"} 2', lines)
+        self.assertIn('configcontextualchecker_rule_selected_total'
+                      '{rule="a\\"b",context=""} 1', lines)
+        self.assertIn('configcontextualchecker_rule_errors_total'
+                      '{rule="a\\"b",kind="ItemError"} 1', lines)
+        self.assertTrue(text.endswith('\n'))
+
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, 'checker.prom')
+            write_prometheus(checker.stats(), filename)
+            with open(filename) as file_:
+                self.assertEqual(file_.read(), text)
+            self.assertEqual(os.listdir(directory), ['checker.prom'])
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import configcontextualchecker
+from configcontextualchecker import store
+from configcontextualchecker.checker import ConfigContextualChecker
+from configcontextualchecker.convert import ConversionCache
+from configcontextualchecker.store import load_checker, ruleset_key
+
+
+class TestStore(unittest.TestCase):
+
+    RULES = {
+        'key': {
+            'type': int,
+            'exists': True,
+            'allowed': '[0, 10]',
+            'default': 0,
+        },
+        'name': {
+            'type': str,
+            'exists': True,
+            'allowed': ['a', 'b'],
+            'default': 'a',
+            '{key} > 5': {
+                'default': 'b',
+            },
+        },
+    }
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_version(self):
+        version_file = os.path.join(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))), 'VERSION')
+        with open(version_file) as file_:
+            self.assertEqual(configcontextualchecker.__version__,
+                             file_.read().strip())
+
+    def test_ruleset_key(self):
+        key = ruleset_key(self.RULES)
+        self.assertEqual(ruleset_key(dict(self.RULES)), key)
+
+        changed = dict(self.RULES, key=dict(self.RULES['key'], type=float))
+        self.assertNotEqual(ruleset_key(changed), key)
+        changed = dict(self.RULES, key=dict(self.RULES['key'], default='0'))
+        self.assertNotEqual(ruleset_key(changed), key)
+        changed = dict(self.RULES, name=dict(self.RULES['name'],
+                                             allowed=('a', 'b')))
+        self.assertNotEqual(ruleset_key(changed), key)
+
+        version = configcontextualchecker.__version__
+        store.__version__ = version + '.1'
+        try:
+            self.assertNotEqual(ruleset_key(self.RULES), key)
+        finally:
+            store.__version__ = version
+
+    def test_load_checker(self):
+        filename = os.path.join(self.directory, 'checkers',
+                                ruleset_key(self.RULES) + store.SUFFIX)
+        created = load_checker(self.RULES, os.path.dirname(filename))
+        self.assertTrue(os.path.exists(filename))
+
+        cache = ConversionCache()
+        loaded = load_checker(self.RULES, os.path.dirname(filename), cache)
+        self.assertIsNot(loaded, created)
+        self.assertIs(loaded.plan[0].base_rule.cache, cache)
+        for checker in (created, loaded):
+            config = {'key': '7'}
+            checker(config)
+            self.assertEqual(config, {'key': 7, 'name': 'b'})
+            self.assertEqual([rule.name for rule in checker.impacted(['key'])],
+                             ['key', 'name'])
+
+        # a file that cannot be loaded is replaced
+        with open(filename, 'wb') as file_:
+            file_.write(b'truncated')
+        self.assertIsInstance(load_checker(self.RULES,
+                                           os.path.dirname(filename)),
+                              ConfigContextualChecker)
+        self.assertEqual(len(os.listdir(os.path.dirname(filename))), 1)
+        self.assertIsNotNone(store._load(filename, ruleset_key(self.RULES)))
+
+        # a file renamed after other rules is not used
+        self.assertIsNone(store._load(filename, 'other'))
@@ -0,0 +1,35 @@
+import importlib
+import unittest
+
+from configcontextualchecker.condexp import PlyCompiler
+from configcontextualchecker.condexp_parser import PlyParser
+from configcontextualchecker.range.range_parser import PlyRangeParser
+
+try:
+    from ply import lex, yacc
+except ImportError:
+    lex = yacc = None
+
+
+@unittest.skipIf(lex is None, 'PLY is not installed')
+class TestTables(unittest.TestCase):
+    """The precomputed tables shall be generated again after a change of the
+    tokens or of a grammar, with python -m configcontextualchecker.tables
+    """
+
+    PARSERS = (PlyParser, PlyCompiler, PlyRangeParser)
+
+    def test_lex_tables(self):
+        for cls in self.PARSERS:
+            tables = importlib.import_module(cls.TABLES + '_lex')
+            lexer = lex.lex(module=cls())
+            self.assertEqual(tables._lextokens, lexer.lextokens)
+            patterns = [pattern for pattern, _ in
+                        tables._lexstatere['INITIAL']]
+            self.assertEqual(patterns, lexer.lexstateretext['INITIAL'])
+
+    def test_yacc_tables(self):
+        for cls in self.PARSERS:
+            # the productions of the loaded tables are not the full ones
+            productions = cls().parser.productions
+            self.assertIsInstance(productions[1], yacc.MiniProduction)
@@ -0,0 +1,72 @@
+import unittest
+
+from configcontextualchecker import vectorized
+from configcontextualchecker.allowed import AllowedValues
+from configcontextualchecker.flat_rule import FlatRule
+from configcontextualchecker.range import Range
+from configcontextualchecker.vectorized import check_values
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestCheckValues(unittest.TestCase):
+
+    def test_sequence(self):
+        checked, offending = check_values(['80', 8080, 'a', 1.5, None, '0'],
+                                          int)
+        self.assertEqual(checked, [80, 8080, 'a', 1.5, None, 0])
+        self.assertEqual(offending, [2, 3, 4])
+
+        checked, offending = check_values(('0.5', 2., '3.', '1'), float,
+                                          Range(0., True, 2., False))
+        self.assertEqual(checked, [0.5, 2., 3., '1'])
+        self.assertEqual(offending, [2, 3])
+
+        checked, offending = check_values(['a', 'b', 'c'], str,
+                                          AllowedValues(['a', 'c']))
+        self.assertEqual(checked, ['a', 'b', 'c'])
+        self.assertEqual(offending, [1])
+
+    def test_flat_rule(self):
+        rule = FlatRule({
+            'type': int,
+            'exists': True,
+            'allowed': '[1, 65535]',
+        })
+        checked, offending = rule.check_values(['0', '80', '8080', '65536'])
+        self.assertEqual(checked, [0, 80, 8080, 65536])
+        self.assertEqual(offending, [0, 3])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_array(self):
+        data = (
+            (numpy.arange(10), int, Range(2, False, 8, True),
+             [0, 1, 8, 9]),
+            (numpy.arange(10.), float, Range(2., True, None, True),
+             [0, 1, 2]),
+            (numpy.array([1., numpy.nan]), float, Range(None, True, 2., True),
+             [1]),
+            (numpy.arange(6).reshape(2, 3), int, AllowedValues([1, 5]),
+             [0, 2, 3, 4]),
+            (numpy.arange(3), int, None, []),
+            (numpy.array([True, False]), bool, AllowedValues([True]), [1]),
+        )
+        for values, type_, allowed, expected in data:
+            checked, offending = check_values(values, type_, allowed)
+            self.assertIsInstance(offending, numpy.ndarray)
+            self.assertEqual(offending.tolist(), expected)
+            # same as the pure Python checking
+            _, offending = vectorized._check_sequence(values.ravel().tolist(),
+                                                      type_, allowed)
+            self.assertEqual(offending, expected)
+
+        # other types and data types are checked value by value
+        checked, offending = check_values(numpy.array(['1', 'a']), int)
+        self.assertEqual(checked, [1, 'a'])
+        self.assertEqual(offending, [1])
+
+        checked, offending = check_values(numpy.arange(2), float)
+        self.assertEqual(offending, [0, 1])
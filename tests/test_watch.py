@@ -0,0 +1,105 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from configcontextualchecker.checker import ConfigContextualChecker
+from configcontextualchecker.watch import Watcher, _diff
+
+
+class TestWatcher(unittest.TestCase):
+
+    RULES = {
+        '/db/port': {
+            'type': int,
+            'exists': True,
+            'allowed': [80, 8080],
+            'default': 80,
+        },
+        '/db/proxy': {
+            'type': str,
+            'exists': True,
+            'allowed': ['none', 'http'],
+            'default': 'none',
+            '{/db/port} == 8080': {
+                'default': 'http',
+            },
+        },
+        'name': {
+            'type': str,
+            'exists': True,
+        },
+    }
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'config.json')
+        self.results = list()
+        self.watcher = Watcher(ConfigContextualChecker(self.RULES),
+                               [self.filename], self.results.append,
+                               debounce=1.)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, config):
+        with open(self.filename, 'w') as file_:
+            json.dump(config, file_)
+        # make the modification visible whatever the time resolution
+        self.watcher._statuses.clear()
+
+    def test_diff(self):
+        old = {'a': 1, 'b': {'c': 2, 'd': 3}, 'e': {'f': 4}}
+        new = {'a': 1, 'b': {'c': 2, 'd': 0}, 'e': 5, 'g': 6}
+        self.assertEqual(set(_diff(old, new)), {'/b/d', '/e', '/g'})
+        self.assertEqual(set(_diff(old, old)), set())
+
+    def test_poll(self):
+        # missing file
+        self.watcher.poll(now=0.)
+        self.watcher.poll(now=1.)
+        self.assertEqual(len(self.results), 1)
+        self.assertIsInstance(self.results[0].error, IOError)
+
+        # full checking
+        self.write({'name': 'a', 'db': dict()})
+        self.watcher.poll(now=2.)
+        self.assertEqual(len(self.results), 1)
+        self.watcher.poll(now=3.)
+        result = self.results[-1]
+        self.assertTrue(result.valid)
+        self.assertIsNone(result.changed)
+        self.assertEqual(result.config, {'name': 'a', 'db': {'port': 80,
+                                                             'proxy': 'none'}})
+
+        # a burst of writes is checked once, only the changes are checked
+        self.write({'name': 'a', 'db': {'port': 80}})
+        self.watcher.poll(now=4.)
+        self.write({'name': 'a', 'db': {'port': '8080'}})
+        self.watcher.poll(now=4.5)
+        self.watcher.poll(now=5.)
+        self.assertEqual(len(self.results), 2)
+        self.watcher.poll(now=5.5)
+        result = self.results[-1]
+        self.assertTrue(result.valid)
+        self.assertEqual(result.changed, {'/db/port'})
+        self.assertEqual(result.config, {'name': 'a', 'db': {'port': 8080,
+                                                             'proxy': 'http'}})
+
+        # same content
+        self.write({'name': 'a', 'db': {'port': '8080'}})
+        self.watcher.poll(now=6.)
+        self.watcher.poll(now=7.)
+        self.assertEqual(len(self.results), 3)
+
+        # failed checking, then full checking
+        self.write({'name': 'a', 'db': {'port': 0}})
+        self.watcher.poll(now=8.)
+        self.watcher.poll(now=9.)
+        self.assertFalse(self.results[-1].valid)
+        self.write({'name': 'b', 'db': {'port': 0}})
+        self.watcher.poll(now=10.)
+        self.watcher.poll(now=11.)
+        self.assertFalse(self.results[-1].valid)
+        self.assertIsNone(self.results[-1].changed)